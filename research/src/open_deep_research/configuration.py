@@ -150,6 +150,160 @@ class Configuration(BaseModel):
             }
         }
     )
+    http_max_connections: int = Field(
+        default=20,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 20,
+                "min": 1,
+                "max": 200,
+                "description": "Maximum open connections of the pooled HTTP client used by search tools, per event loop"
+            }
+        }
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 10,
+                "min": 0,
+                "max": 200,
+                "description": "Idle connections the pooled HTTP client keeps open for reuse between searches"
+            }
+        }
+    )
+    max_concurrent_model_calls: int = Field(
+        default=10,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 10,
+                "min": 1,
+                "max": 200,
+                "description": "Maximum model calls in flight per provider, including webpage summarization, across all researchers"
+            }
+        }
+    )
+    model_requests_per_minute: Optional[int] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "description": "Requests per minute allowed per model provider. Leave empty for no limit"
+            }
+        }
+    )
+    model_tokens_per_minute: Optional[int] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "description": "Tokens per minute allowed per model provider, counting the prompt and max output tokens like provider limits do. Leave empty for no limit"
+            }
+        }
+    )
+    max_concurrent_search_calls: int = Field(
+        default=10,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 10,
+                "min": 1,
+                "max": 200,
+                "description": "Maximum search API requests in flight across all researchers"
+            }
+        }
+    )
+    search_requests_per_minute: Optional[int] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "description": "Search API requests per minute. Leave empty for no limit"
+            }
+        }
+    )
+    provider_rate_limits: Optional[dict[str, dict[str, int]]] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "json",
+                "description": "Per-provider overrides, e.g. {\"openai\": {\"concurrency\": 20, \"rpm\": 500, \"tpm\": 200000}, \"tavily\": {\"rpm\": 100}}"
+            }
+        }
+    )
+    prefilter_search_results: bool = Field(
+        default=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "boolean",
+                "default": True,
+                "description": "Strip boilerplate, drop near-duplicate pages and rank pages by relevance locally before summarizing them"
+            }
+        }
+    )
+    max_pages_to_summarize: int = Field(
+        default=5,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 5,
+                "min": 1,
+                "max": 50,
+                "description": "Most relevant pages per search call sent to the summarization model; the others keep the search snippet"
+            }
+        }
+    )
+    near_duplicate_threshold: int = Field(
+        default=3,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 3,
+                "min": 0,
+                "max": 16,
+                "description": "Pages whose 64-bit SimHash fingerprints differ in at most this many bits are treated as duplicates"
+            }
+        }
+    )
+    deduplicate_run_urls: bool = Field(
+        default=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "boolean",
+                "default": True,
+                "description": "Summarize each webpage once per research run. Researchers that find a page another researcher already summarized get a short reference instead"
+            }
+        }
+    )
+    summary_cache_size: int = Field(
+        default=1024,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 1024,
+                "min": 0,
+                "max": 100000,
+                "description": "Number of webpage summaries kept in memory and shared by all researchers in the process. Set to 0 to disable the summary cache"
+            }
+        }
+    )
+    summary_cache_path: Optional[str] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "text",
+                "description": "Optional SQLite file that keeps webpage summaries across runs and processes"
+            }
+        }
+    )
     research_model: str = Field(
         default="openai:gpt-4.1",
         metadata={
@@ -40,6 +40,7 @@ from open_deep_research.state import (
     SupervisorState,
 )
 from open_deep_research.utils import (
+    RunUrlRegistry,
     anthropic_websearch_called,
     get_all_tools,
     get_api_key_for_model,
@@ -48,7 +49,10 @@ from open_deep_research.utils import (
     get_today_str,
     is_token_limit_exceeded,
     openai_websearch_called,
+    rate_limited_ainvoke,
     remove_up_to_last_ai_message,
+    reset_run_url_registry,
+    set_run_url_registry,
     think_tool,
 )
 
@@ -98,7 +102,9 @@ async def clarify_with_user(state: AgentState, config: RunnableConfig) -> Comman
         messages=get_buffer_string(messages), 
         date=get_today_str()
     )
-    response = await clarification_model.ainvoke([HumanMessage(content=prompt_content)])
+    response = await rate_limited_ainvoke(
+        clarification_model, [HumanMessage(content=prompt_content)], model_config, config
+    )
     
     # Step 4: Route based on clarification analysis
     if response.need_clarification:
@@ -151,7 +157,9 @@ async def write_research_brief(state: AgentState, config: RunnableConfig) -> Com
         messages=get_buffer_string(state.get("messages", [])),
         date=get_today_str()
     )
-    response = await research_model.ainvoke([HumanMessage(content=prompt_content)])
+    response = await rate_limited_ainvoke(
+        research_model, [HumanMessage(content=prompt_content)], research_model_config, config
+    )
     
     # Step 3: Initialize supervisor with research brief and instructions
     supervisor_system_prompt = lead_researcher_prompt.format(
@@ -211,7 +219,7 @@ async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[
     
     # Step 2: Generate supervisor response based on current context
     supervisor_messages = state.get("supervisor_messages", [])
-    response = await research_model.ainvoke(supervisor_messages)
+    response = await rate_limited_ainvoke(research_model, supervisor_messages, research_model_config, config)
     
     # Step 3: Update state and proceed to tool execution
     return Command(
@@ -291,6 +299,10 @@ async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Co
             allowed_conduct_research_calls = conduct_research_calls[:configurable.max_concurrent_research_units]
             overflow_conduct_research_calls = conduct_research_calls[configurable.max_concurrent_research_units:]
             
+            # Share the pages summarized so far in this run with every researcher
+            run_urls = RunUrlRegistry(state.get("summarized_urls", {}))
+            run_urls_token = set_run_url_registry(run_urls)
+            
             # Execute research tasks in parallel
             research_tasks = [
                 researcher_subgraph.ainvoke({
@@ -302,7 +314,11 @@ async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Co
                 for tool_call in allowed_conduct_research_calls
             ]
             
-            tool_results = await asyncio.gather(*research_tasks)
+            try:
+                tool_results = await asyncio.gather(*research_tasks)
+            finally:
+                reset_run_url_registry(run_urls_token)
+            update_payload["summarized_urls"] = run_urls.snapshot()
             
             # Create tool messages with research results
             for observation, tool_call in zip(tool_results, allowed_conduct_research_calls):
@@ -412,7 +428,7 @@ async def researcher(state: ResearcherState, config: RunnableConfig) -> Command[
     
     # Step 3: Generate researcher response with system context
     messages = [SystemMessage(content=researcher_prompt)] + researcher_messages
-    response = await research_model.ainvoke(messages)
+    response = await rate_limited_ainvoke(research_model, messages, research_model_config, config)
     
     # Step 4: Update state and proceed to tool execution
     return Command(
@@ -524,12 +540,13 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
     """
     # Step 1: Configure the compression model
     configurable = Configuration.from_runnable_config(config)
-    synthesizer_model = configurable_model.with_config({
+    synthesizer_model_config = {
         "model": configurable.compression_model,
         "max_tokens": configurable.compression_model_max_tokens,
         "api_key": get_api_key_for_model(configurable.compression_model, config),
         "tags": ["langsmith:nostream"]
-    })
+    }
+    synthesizer_model = configurable_model.with_config(synthesizer_model_config)
     
     # Step 2: Prepare messages for compression
     researcher_messages = state.get("researcher_messages", [])
@@ -548,7 +565,7 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
             messages = [SystemMessage(content=compression_prompt)] + researcher_messages
             
             # Execute compression
-            response = await synthesizer_model.ainvoke(messages)
+            response = await rate_limited_ainvoke(synthesizer_model, messages, synthesizer_model_config, config)
             
             # Extract raw notes from all tool and AI messages
             raw_notes_content = "\n".join([
@@ -647,9 +664,12 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
             )
             
             # Generate the final report
-            final_report = await configurable_model.with_config(writer_model_config).ainvoke([
-                HumanMessage(content=final_report_prompt)
-            ])
+            final_report = await rate_limited_ainvoke(
+                configurable_model.with_config(writer_model_config),
+                [HumanMessage(content=final_report_prompt)],
+                writer_model_config,
+                config,
+            )
             
             # Return successful report generation
             return {
@@ -79,6 +79,7 @@ class SupervisorState(TypedDict):
     notes: Annotated[list[str], override_reducer] = []
     research_iterations: int = 0
     raw_notes: Annotated[list[str], override_reducer] = []
+    summarized_urls: dict[str, str] = {}
 
 class ResearcherState(TypedDict):
     """State for individual researchers conducting research."""
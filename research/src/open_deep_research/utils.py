@@ -1,13 +1,25 @@
 """Utility functions and helpers for the Deep Research agent."""
 
 import asyncio
+import contextlib
+import contextvars
+import hashlib
+import inspect
 import logging
+import math
 import os
+import re
+import sqlite3
+import threading
+import time
 import warnings
+import weakref
+from collections import Counter, OrderedDict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
 
 import aiohttp
+import httpx
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import (
@@ -77,6 +89,28 @@ async def tavily_search(
     
     # Step 3: Set up the summarization model with configuration
     configurable = Configuration.from_runnable_config(config)
+
+    # Pages another researcher in this run already summarized are only referenced
+    already_summarized = {}
+    run_urls = get_run_url_registry() if configurable.deduplicate_run_urls else None
+    if run_urls is not None:
+        for url in list(unique_results):
+            if url in run_urls:
+                already_summarized[url] = unique_results.pop(url)
+
+    # Strip boilerplate, drop near-duplicates and keep only the most relevant pages for the LLM
+    if configurable.prefilter_search_results:
+        unique_results = prefilter_search_results(
+            unique_results,
+            max_pages=configurable.max_pages_to_summarize,
+            near_duplicate_bits=configurable.near_duplicate_threshold,
+        )
+
+    # Only pages that will actually be summarized are claimed for this run
+    if run_urls is not None:
+        for url, result in unique_results.items():
+            if result.get("raw_content"):
+                run_urls.claim(url, result['title'])
     
     # Character limit to stay within model token limits (configurable)
     max_char_to_include = configurable.max_content_length
@@ -97,13 +131,31 @@ async def tavily_search(
         """No-op function for results without raw content."""
         return None
     
+    # Summaries are shared across researchers and calls, keyed by page content
+    summary_cache = get_summary_cache(configurable.summary_cache_size, configurable.summary_cache_path)
+
+    # Summaries share the provider's rate limits with every other model call in the run
+    summary_limiter = get_rate_limiter(get_model_provider(configurable.summarization_model), configurable)
+
+    async def limited_summary(content: str) -> str:
+        estimated_tokens = estimate_tokens(content) + configurable.summarization_model_max_tokens
+        async with summary_limiter.slot(estimated_tokens):
+            return await summarize_webpage(summarization_model, content)
+
+    def summarize(url: str, content: str):
+        if summary_cache is None:
+            return limited_summary(content)
+        return summary_cache.get_or_summarize(
+            url,
+            content,
+            configurable.summarization_model,
+            lambda: limited_summary(content),
+        )
+
     summarization_tasks = [
         noop() if not result.get("raw_content") 
-        else summarize_webpage(
-            summarization_model, 
-            result['raw_content'][:max_char_to_include]
-        )
-        for result in unique_results.values()
+        else summarize(url, result['raw_content'][:max_char_to_include])
+        for url, result in unique_results.items()
     ]
     
     # Step 5: Execute all summarization tasks in parallel
@@ -123,15 +175,24 @@ async def tavily_search(
     }
     
     # Step 7: Format the final output
-    if not summarized_results:
+    if not summarized_results and not already_summarized:
         return "No valid search results found. Please try different search queries or use a different search API."
     
     formatted_output = "Search results: \n\n"
+    if already_summarized:
+        formatted_output += (
+            f"{len(already_summarized)} of {len(already_summarized) + len(summarized_results)} results were "
+            "already summarized earlier in this research run; search from a different angle to find new sources.\n"
+        )
     for i, (url, result) in enumerate(summarized_results.items()):
         formatted_output += f"\n\n--- SOURCE {i+1}: {result['title']} ---\n"
         formatted_output += f"URL: {url}\n\n"
         formatted_output += f"SUMMARY:\n{result['content']}\n\n"
         formatted_output += "\n\n" + "-" * 80 + "\n"
+    for i, (url, result) in enumerate(already_summarized.items(), start=len(summarized_results)):
+        formatted_output += f"\n\n--- SOURCE {i+1}: {result['title']} ---\n"
+        formatted_output += f"URL: {url}\n\n"
+        formatted_output += "ALREADY SUMMARIZED: covered by earlier research in this run.\n"
     
     return formatted_output
 
@@ -154,19 +215,28 @@ async def tavily_search_async(
     Returns:
         List of search result dictionaries from Tavily API
     """
-    # Initialize the Tavily client with API key from config
-    tavily_client = AsyncTavilyClient(api_key=get_tavily_api_key(config))
+    # Reuse the event loop's pooled Tavily client and its keep-alive connections
+    configurable = Configuration.from_runnable_config(config)
+    tavily_client = get_tavily_client(
+        get_tavily_api_key(config),
+        max_connections=configurable.http_max_connections,
+        max_keepalive_connections=configurable.http_max_keepalive_connections,
+    )
+    
+    # Searches of all researchers share one limit on in-flight and per-minute requests
+    search_limiter = get_rate_limiter("tavily", configurable, kind="search")
+
+    async def limited_search(query: str):
+        async with search_limiter.slot():
+            return await tavily_client.search(
+                query,
+                max_results=max_results,
+                include_raw_content=include_raw_content,
+                topic=topic
+            )
     
     # Create search tasks for parallel execution
-    search_tasks = [
-        tavily_client.search(
-            query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-            topic=topic
-        )
-        for query in search_queries
-    ]
+    search_tasks = [limited_search(query) for query in search_queries]
     
     # Execute all search queries in parallel and return results
     search_results = await asyncio.gather(*search_tasks)
@@ -212,6 +282,768 @@ async def summarize_webpage(model: BaseChatModel, webpage_content: str) -> str:
         logging.warning(f"Summarization failed with error: {str(e)}, returning original content")
         return webpage_content
 
+##########################
+# Search Result Prefilter Utils
+##########################
+
+_BOILERPLATE_PATTERN = re.compile(
+    r"\b(?:cookies?|privacy policy|terms of (?:use|service)|all rights reserved|subscribe|newsletter|"
+    r"sign (?:in|up)|log ?in|skip to (?:main )?content|follow us|share (?:this|on)|advertisement)\b|\u00a9",
+    re.IGNORECASE,
+)
+_LINK_ONLY_LINE = re.compile(r"^(\W*!?\[[^\]]*\]\([^)]*\)\W*)+$")
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_WORD = re.compile(r"\w+")
+# List items and table rows carry content however short they are
+_STRUCTURED_LINE = re.compile(r"^[-*+\u2022]\s|\|")
+_MENU_RUN_LENGTH = 3
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to what when where which who why "
+    "with your you do does can".split()
+)
+
+
+def _is_menu_entry(line: str) -> bool:
+    """Whether a line looks like a navigation entry: a few words, no punctuation or data."""
+    if len(line.split()) >= 4 or line.startswith("#") or line.endswith((".", "!", "?", ":")):
+        return False
+    return not _STRUCTURED_LINE.search(line) and not any(char.isdigit() for char in line)
+
+
+def strip_boilerplate(text: str) -> str:
+    """Remove navigation, link lists and boilerplate lines from page content.
+
+    Lines are dropped when they only hold links, repeat an earlier line, are
+    short boilerplate notices, or belong to a run of menu entries (three or
+    more short lines in a row without punctuation). Headings, prose, list
+    items, table rows and lines holding numbers are kept.
+
+    Args:
+        text: Raw page content as returned by the search API
+
+    Returns:
+        The content with boilerplate removed and link targets stripped
+    """
+    lines: List[str] = []
+    seen = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        if _LINK_ONLY_LINE.match(line):
+            continue
+        line = _MARKDOWN_LINK.sub(r"\1", line).strip()
+        if not line:
+            continue
+        # Repeated headers and footers go, repeated table rows of separate tables stay
+        if line.lower() in seen and "|" not in line:
+            continue
+        if len(line.split()) < 12 and _BOILERPLATE_PATTERN.search(line):
+            continue
+        seen.add(line.lower())
+        lines.append(line)
+
+    # A lone short line is usually a title or a label; runs of them are menus
+    kept: List[str] = []
+    run: List[str] = []
+    for line in lines + [""]:
+        if line and _is_menu_entry(line):
+            run.append(line)
+            continue
+        if len(run) < _MENU_RUN_LENGTH:
+            kept.extend(run)
+        run = []
+        if line or (kept and kept[-1]):
+            kept.append(line)
+    return "\n".join(kept).strip()
+
+
+def _terms(text: str) -> List[str]:
+    return [word for word in _WORD.findall(text.lower()) if len(word) > 1 and word not in _STOPWORDS]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash fingerprint of a text over word 3-shingles.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Fingerprint; similar texts differ in few bits
+    """
+    words = _WORD.findall(text.lower())
+    shingles = Counter(" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2)))
+    weights = [0] * 64
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def bm25_scores(queries: List[str], documents: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """Okapi BM25 score of each document against its own query.
+
+    Args:
+        queries: Query of each document
+        documents: Documents scored together as one corpus
+
+    Returns:
+        One score per document
+    """
+    doc_terms = [_terms(document) for document in documents]
+    if not doc_terms:
+        return []
+    average_length = sum(len(terms) for terms in doc_terms) / len(doc_terms) or 1.0
+    document_frequency = Counter(term for terms in doc_terms for term in set(terms))
+
+    scores = []
+    for query, terms in zip(queries, doc_terms):
+        frequencies = Counter(terms)
+        score = 0.0
+        for term in set(_terms(query)):
+            frequency = frequencies.get(term, 0)
+            if not frequency:
+                continue
+            n = document_frequency[term]
+            idf = math.log((len(doc_terms) - n + 0.5) / (n + 0.5) + 1)
+            score += idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * len(terms) / average_length))
+        scores.append(score)
+    return scores
+
+
+def prefilter_search_results(
+    results: Dict[str, Dict[str, Any]],
+    max_pages: int = 5,
+    near_duplicate_bits: int = 3,
+) -> Dict[str, Dict[str, Any]]:
+    """Select which search results are worth summarizing with the LLM.
+
+    Boilerplate is stripped from every page, pages that are near-duplicates
+    of a more relevant page are dropped, and only the ``max_pages`` pages
+    most relevant to their query keep their content. Pages sharing no terms
+    with their query still fill free slots, in the search API's order. The
+    rest fall back to the search API's snippet, like results without content.
+
+    Args:
+        results: Search results by URL, each with ``query`` and ``raw_content``
+        max_pages: Pages kept for summarization
+        near_duplicate_bits: SimHash distance at or below which pages are duplicates
+
+    Returns:
+        The results in their original order, without near-duplicates
+    """
+    cleaned = {
+        url: strip_boilerplate(result["raw_content"])
+        for url, result in results.items()
+        if result.get("raw_content")
+    }
+    urls = list(cleaned)
+    scores = dict(zip(urls, bm25_scores([results[url].get("query", "") for url in urls], [cleaned[url] for url in urls])))
+
+    # Walk pages from most to least relevant, so the better of two duplicates is kept
+    selected, dropped, fingerprints = set(), set(), []
+    for url in sorted(urls, key=lambda url: scores[url], reverse=True):
+        if not cleaned[url]:
+            continue
+        fingerprint = simhash(cleaned[url])
+        if any(bin(fingerprint ^ other).count("1") <= near_duplicate_bits for other in fingerprints):
+            dropped.add(url)
+            continue
+        fingerprints.append(fingerprint)
+        if len(selected) < max_pages:
+            selected.add(url)
+
+    filtered = {}
+    for url, result in results.items():
+        if url in dropped:
+            continue
+        filtered[url] = {**result, "raw_content": cleaned[url] if url in selected else None}
+    if dropped or len(selected) < len(cleaned):
+        logging.info(
+            f"Prefiltered {len(results)} search results: {len(selected)} to summarize, "
+            f"{len(dropped)} near-duplicates dropped"
+        )
+    return filtered
+
+##########################
+# HTTP Client Pool Utils
+##########################
+
+# Tavily releases before 0.8 build their own HTTP client and cannot take ours
+_TAVILY_ACCEPTS_CLIENT = "client" in inspect.signature(AsyncTavilyClient.__init__).parameters
+
+
+class _LoopClients:
+    """HTTP clients owned by one event loop."""
+
+    def __init__(self):
+        self.tavily: Dict[Tuple[Optional[str], int, int], Tuple[AsyncTavilyClient, Optional[httpx.AsyncClient]]] = {}
+        self.sessions: Dict[int, aiohttp.ClientSession] = {}
+
+
+# Clients are bound to the loop they were created on; entries go away with their loop
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = weakref.WeakKeyDictionary()
+_loop_clients_lock = threading.Lock()
+
+
+def _current_loop_clients() -> _LoopClients:
+    loop = asyncio.get_running_loop()
+    with _loop_clients_lock:
+        clients = _loop_clients.get(loop)
+        if clients is None:
+            clients = _loop_clients[loop] = _LoopClients()
+        return clients
+
+
+def get_tavily_client(
+    api_key: Optional[str],
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+) -> AsyncTavilyClient:
+    """Get the running event loop's pooled Tavily client.
+
+    Concurrent researchers on one loop share the client and its keep-alive
+    connections instead of opening new ones for every search.
+
+    Args:
+        api_key: Tavily API key
+        max_connections: Maximum open connections of the client
+        max_keepalive_connections: Idle connections kept open for reuse
+
+    Returns:
+        A Tavily client bound to the running event loop
+    """
+    clients = _current_loop_clients()
+    key = (api_key, max_connections, max_keepalive_connections)
+    if key not in clients.tavily:
+        proxied = os.getenv("TAVILY_HTTP_PROXY") or os.getenv("TAVILY_HTTPS_PROXY")
+        if _TAVILY_ACCEPTS_CLIENT and not proxied:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            )
+            clients.tavily[key] = (AsyncTavilyClient(api_key=api_key, client=http_client), http_client)
+        else:
+            # Let Tavily configure proxies itself; the client is still reused
+            clients.tavily[key] = (AsyncTavilyClient(api_key=api_key), None)
+    return clients.tavily[key][0]
+
+
+def get_http_session(max_connections: int = 20) -> aiohttp.ClientSession:
+    """Get the running event loop's pooled aiohttp session.
+
+    Args:
+        max_connections: Maximum open connections of the session
+
+    Returns:
+        A keep-alive session bound to the running event loop
+    """
+    clients = _current_loop_clients()
+    session = clients.sessions.get(max_connections)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max_connections))
+        clients.sessions[max_connections] = session
+    return session
+
+
+async def close_http_clients() -> None:
+    """Close the pooled HTTP clients of the running event loop.
+
+    Call this before closing an event loop that ran research, so no
+    connections or unclosed-session warnings outlive it.
+    """
+    with _loop_clients_lock:
+        clients = _loop_clients.pop(asyncio.get_running_loop(), None)
+    if clients is None:
+        return
+    for tavily_client, http_client in clients.tavily.values():
+        try:
+            if http_client is not None:
+                await http_client.aclose()
+            elif hasattr(tavily_client, "close"):
+                await tavily_client.close()
+        except Exception as e:
+            logging.warning(f"Error closing Tavily client: {e}")
+    for session in clients.sessions.values():
+        if not session.closed:
+            await session.close()
+
+##########################
+# Rate Limit Utils
+##########################
+
+class TokenBucket:
+    """Budget of requests or tokens that refills continuously over a minute.
+
+    The bucket is thread-safe and not bound to an event loop, so researchers
+    on every loop of the process draw from the same budget.
+
+    Args:
+        per_minute: Budget available per minute
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until the budget allows ``amount``, then spend it.
+
+        The amount is reserved on arrival and the budget may go negative, so
+        waiters are served in arrival order and a large request is not starved
+        by a stream of small ones.
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            self.available -= amount
+            wait = -self.available / self.rate if self.available < 0 else 0
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.adjust(amount)
+                raise
+
+    def adjust(self, amount: float) -> None:
+        """Return unused budget (positive) or charge an overrun (negative)."""
+        with self._lock:
+            self._refill()
+            self.available = min(self.capacity, self.available + amount)
+
+
+class ProcessSemaphore:
+    """Semaphore shared by the event loops of every thread in the process.
+
+    Freed slots are handed to waiters in arrival order, whichever loop they
+    wait on.
+
+    Args:
+        value: Number of slots
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: "deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]" = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # A slot handed over just before the cancellation is passed on; a cancelled
+            # future is passed on by _hand_over instead
+            if not queued and not waiter[1].cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the longest waiting caller if there is one."""
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._hand_over, future)
+                    return
+                except RuntimeError:  # the waiter's loop is closed
+                    continue
+            self._value += 1
+
+    def _hand_over(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class RateLimiter:
+    """Concurrency, request and token limits for one provider.
+
+    Args:
+        max_concurrency: Calls allowed in flight at once
+        requests_per_minute: Optional request budget per minute
+        tokens_per_minute: Optional token budget per minute
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self._semaphore = ProcessSemaphore(max(1, max_concurrency))
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @contextlib.asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a call slot once the request and token budgets allow it.
+
+        Args:
+            estimated_tokens: Tokens the call is expected to use
+        """
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None and estimated_tokens:
+            await self.tokens.acquire(estimated_tokens)
+        await self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def settle(self, estimated_tokens: int, used_tokens: int) -> None:
+        """Correct the token budget once a call reports its actual usage."""
+        if self.tokens is not None and estimated_tokens:
+            self.tokens.adjust(estimated_tokens - used_tokens)
+
+
+def get_model_provider(model_name: str) -> str:
+    """Provider part of a ``provider:model`` name, e.g. ``openai``."""
+    return model_name.split(":", 1)[0].lower() if ":" in model_name else "openai"
+
+
+def estimate_tokens(content: Any) -> int:
+    """Rough token count of a prompt, at four characters per token."""
+    return len(str(content)) // 4 + 1
+
+
+# One limiter per provider and limits for the whole process, shared by every event loop
+_rate_limiters: Dict[Tuple[Any, ...], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, configurable: Configuration, kind: str = "model") -> RateLimiter:
+    """Get the process-wide limiter for a provider.
+
+    All researchers share the limiter, including those of concurrent runs on
+    other threads and event loops, so the total number of calls in flight
+    and per minute stays within the provider's limits.
+
+    Args:
+        provider: Provider name, e.g. ``openai`` or ``tavily``
+        configurable: Configuration holding the limits
+        kind: ``model`` or ``search``, selecting the default limits
+
+    Returns:
+        The shared limiter
+    """
+    if kind == "search":
+        limits = {
+            "concurrency": configurable.max_concurrent_search_calls,
+            "rpm": configurable.search_requests_per_minute,
+            "tpm": None,
+        }
+    else:
+        limits = {
+            "concurrency": configurable.max_concurrent_model_calls,
+            "rpm": configurable.model_requests_per_minute,
+            "tpm": configurable.model_tokens_per_minute,
+        }
+    limits.update((configurable.provider_rate_limits or {}).get(provider, {}))
+
+    key = (kind, provider, limits["concurrency"], limits["rpm"], limits["tpm"])
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(limits["concurrency"], limits["rpm"], limits["tpm"])
+        return _rate_limiters[key]
+
+
+async def rate_limited_ainvoke(model, messages, model_config: Dict[str, Any], config: RunnableConfig):
+    """Invoke a configured chat model within its provider's rate limits.
+
+    The token budget is charged the prompt estimate plus ``max_tokens`` up
+    front, as providers count it, and corrected with the reported usage.
+
+    Args:
+        model: Runnable to invoke
+        messages: Model input
+        model_config: The ``model`` and ``max_tokens`` the runnable was configured with
+        config: Runtime configuration holding the limits
+
+    Returns:
+        The model response
+    """
+    configurable = Configuration.from_runnable_config(config)
+    limiter = get_rate_limiter(get_model_provider(model_config["model"]), configurable)
+    estimated_tokens = estimate_tokens(messages) + (model_config.get("max_tokens") or 0)
+
+    async with limiter.slot(estimated_tokens):
+        response = await model.ainvoke(messages)
+
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        limiter.settle(estimated_tokens, usage.get("total_tokens", estimated_tokens))
+    return response
+
+##########################
+# Summary Cache Utils
+##########################
+
+class SummaryCache:
+    """Webpage summaries keyed by URL, content hash and summarization model.
+
+    Summaries are kept in an in-memory LRU tier and, when a path is given, in
+    a SQLite file shared across runs and processes. Concurrent requests for
+    the same page on one event loop wait for a single summarization.
+
+    Args:
+        max_entries: Number of summaries kept in memory
+        path: Optional SQLite file for the on-disk tier
+        max_disk_entries: Number of summaries kept on disk
+    """
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None, max_disk_entries: int = 20000):
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries "
+                "(key TEXT PRIMARY KEY, summary TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logging.warning(f"Summary cache at {path} unavailable, keeping summaries in memory only: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(url: str, content: str, model: str) -> str:
+        """Cache key of a page's summary.
+
+        Args:
+            url: Page URL
+            content: Page content as sent to the summarization model
+            model: Summarization model name
+
+        Returns:
+            Hex digest identifying the summary
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{model}\0{url}\0{content_hash}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a summary in memory, then on disk."""
+        with self._lock:
+            summary = self._memory.get(key)
+            if summary is not None:
+                self._memory.move_to_end(key)
+                return summary
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._db.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Summary cache read failed: {e}")
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, summary: str) -> None:
+        """Store a summary in both tiers."""
+        with self._lock:
+            self._remember(key, summary)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO summaries (key, summary, accessed_at) VALUES (?, ?, ?)",
+                    (key, summary, time.time()),
+                )
+                self._writes += 1
+                if self._writes % 100 == 0:
+                    # Drop the least recently used summaries beyond the disk limit
+                    self._db.execute(
+                        "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries "
+                        "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Summary cache write failed: {e}")
+
+    def _remember(self, key: str, summary: str) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def get_or_summarize(
+        self,
+        url: str,
+        content: str,
+        model: str,
+        summarize: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Return the cached summary of a page, summarizing it on a miss.
+
+        Args:
+            url: Page URL
+            content: Page content as sent to the summarization model
+            model: Summarization model name
+            summarize: Produces the summary on a cache miss
+
+        Returns:
+            The page summary, or the content itself if summarization failed
+        """
+        key = self.make_key(url, content, model)
+        summary = await asyncio.to_thread(self.get, key) if self._db is not None else self.get(key)
+        if summary is not None:
+            self.hits += 1
+            return summary
+
+        # Futures belong to one event loop, so only coalesce within the running loop
+        flight = (id(asyncio.get_running_loop()), key)
+        pending = self._inflight.get(flight)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight] = future
+        try:
+            summary = await summarize()
+            # summarize_webpage falls back to the raw content on failure; do not cache that
+            if summary != content:
+                if self._db is not None:
+                    await asyncio.to_thread(self.set, key, summary)
+                else:
+                    self.set(key, summary)
+            future.set_result(summary)
+            return summary
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no other caller was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(flight, None)
+
+
+_summary_caches: Dict[Tuple[int, Optional[str]], SummaryCache] = {}
+_summary_caches_lock = threading.Lock()
+
+
+def get_summary_cache(max_entries: int, path: Optional[str] = None) -> Optional[SummaryCache]:
+    """Get the process-wide summary cache for a configuration.
+
+    Every researcher of a run, and every run in the process, with the same
+    settings shares one cache.
+
+    Args:
+        max_entries: In-memory LRU size; 0 without a path disables caching
+        path: Optional SQLite file for the on-disk tier
+
+    Returns:
+        The shared cache, or None if caching is disabled
+    """
+    if max_entries <= 0 and not path:
+        return None
+    cache_id = (max_entries, os.path.abspath(path) if path else None)
+    with _summary_caches_lock:
+        if cache_id not in _summary_caches:
+            _summary_caches[cache_id] = SummaryCache(max_entries=max_entries, path=path)
+        return _summary_caches[cache_id]
+
+class RunUrlRegistry:
+    """URLs summarized so far in one research run, shared by its parallel researchers.
+
+    Args:
+        urls: URLs already summarized in earlier supervisor iterations, mapped to their titles
+    """
+
+    def __init__(self, urls: Optional[Dict[str, str]] = None):
+        self._urls: Dict[str, str] = dict(urls or {})
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def claim(self, url: str, title: str) -> bool:
+        """Register a URL about to be summarized.
+
+        Returns:
+            True if the URL is new to this run, False if it was already claimed
+        """
+        if url in self._urls:
+            return False
+        self._urls[url] = title
+        return True
+
+    def snapshot(self) -> Dict[str, str]:
+        """All URLs claimed so far, mapped to their titles."""
+        return dict(self._urls)
+
+
+# Researcher subgraphs and their tools run in copies of the supervisor's context
+_run_url_registry: contextvars.ContextVar[Optional[RunUrlRegistry]] = contextvars.ContextVar(
+    "run_url_registry", default=None
+)
+
+
+def get_run_url_registry() -> Optional[RunUrlRegistry]:
+    """Get the URL registry of the current research run, if any."""
+    return _run_url_registry.get()
+
+
+def set_run_url_registry(registry: Optional[RunUrlRegistry]) -> contextvars.Token:
+    """Make a URL registry current for the researchers started in this context.
+
+    Returns:
+        Token to pass to ``reset_run_url_registry``
+    """
+    return _run_url_registry.set(registry)
+
+
+def reset_run_url_registry(token: contextvars.Token) -> None:
+    """Restore the registry that was current before ``set_run_url_registry``."""
+    _run_url_registry.reset(token)
+
 ##########################
 # Reflection Tool Utils
 ##########################
@@ -270,20 +1102,20 @@ async def get_mcp_access_token(
             "subject_token_type": "urn:ietf:params:oauth:token-type:access_token",
         }
         
-        # Execute token exchange request
-        async with aiohttp.ClientSession() as session:
-            token_url = base_mcp_url.rstrip("/") + "/oauth/token"
-            headers = {"Content-Type": "application/x-www-form-urlencoded"}
-            
-            async with session.post(token_url, headers=headers, data=form_data) as response:
-                if response.status == 200:
-                    # Successfully obtained token
-                    token_data = await response.json()
-                    return token_data
-                else:
-                    # Log error details for debugging
-                    response_text = await response.text()
-                    logging.error(f"Token exchange failed: {response_text}")
+        # Execute token exchange request on the event loop's pooled session
+        session = get_http_session()
+        token_url = base_mcp_url.rstrip("/") + "/oauth/token"
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        
+        async with session.post(token_url, headers=headers, data=form_data) as response:
+            if response.status == 200:
+                # Successfully obtained token
+                token_data = await response.json()
+                return token_data
+            else:
+                # Log error details for debugging
+                response_text = await response.text()
+                logging.error(f"Token exchange failed: {response_text}")
                     
     except Exception as e:
         logging.error(f"Error during token exchange: {e}")
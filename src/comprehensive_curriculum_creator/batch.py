@@ -0,0 +1,352 @@
+"""Non-interactive generation of many curricula from a catalog.
+
+A batch reads curriculum specs from a JSONL or CSV file, one course per line
+or row, with the same fields ``get_user_input`` asks for. Each job runs in
+its own worker process with its own directory as working directory, so every
+job gets its own ``output/`` folder and checkpoints, and the tools need no
+changes. Worker output goes to ``job.log`` in the job directory.
+
+State that belongs to the whole batch is not moved into the job directory:
+the cost ledger and the research, semantic and webpage summary caches are
+resolved to absolute paths in the parent process and handed to every job
+through the environment, so the monthly budget covers the whole batch and
+jobs reuse each other's research.
+
+Progress is kept in ``batch_progress.json`` in the batch directory. Rerunning
+the same batch skips completed jobs, and a job that failed after Stage 1
+resumes from its task checkpoints.
+
+The approval checkpoint between Stage 1 and Stage 2 is replaced by a policy:
+
+- ``auto``: approve every outline
+- ``check``: approve outlines that contain the requested number of sessions
+- ``outline-only``: stop after Stage 1 so outlines can be reviewed; a later
+  run with another policy develops them
+"""
+
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from comprehensive_curriculum_creator.checkpoint import inputs_fingerprint
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_POLICIES = ("auto", "check", "outline-only")
+PROGRESS_FILE = "batch_progress.json"
+DEFAULT_BATCH_DIR = "./output/batch"
+
+# Job states recorded in the progress file
+PENDING, OUTLINE_READY, REJECTED, COMPLETED, FAILED = "pending", "outline_ready", "rejected", "completed", "failed"
+
+
+class CurriculumSpec(BaseModel):
+    """Inputs of one curriculum, validated like the interactive prompts."""
+    id: Optional[str] = Field(default=None, description="Job id; derived from the topic if empty")
+    topic: str = Field(..., min_length=1, max_length=200)
+    duration: str = Field(..., min_length=1)
+    sessions: int = Field(..., gt=0, le=100)
+    session_duration: str = Field(..., min_length=1)
+    project_based: str = Field(...)
+    audience_level: str = Field(..., min_length=1, max_length=200)
+
+    @field_validator("topic", "duration", "session_duration", "audience_level", mode="before")
+    @classmethod
+    def _strip(cls, value):
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("project_based", mode="before")
+    @classmethod
+    def _yes_no(cls, value):
+        value = str(value).strip().lower()
+        if value not in ("yes", "no"):
+            raise ValueError("project_based must be 'yes' or 'no'")
+        return value
+
+    @property
+    def inputs(self) -> Dict[str, str]:
+        """Crew inputs, in the format ``get_user_input`` returns."""
+        return {
+            "topic": self.topic,
+            "duration": self.duration,
+            "sessions": str(self.sessions),
+            "session_duration": self.session_duration,
+            "project_based": self.project_based,
+            "audience_level": self.audience_level,
+        }
+
+    @property
+    def job_id(self) -> str:
+        """Filesystem-safe job id, unique per topic and inputs unless set explicitly."""
+        if self.id:
+            return re.sub(r"[^A-Za-z0-9_-]+", "_", self.id).strip("_") or "job"
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", self.topic).strip("_")[:40] or "curriculum"
+        return f"{slug}_{inputs_fingerprint(self.inputs)[:8]}"
+
+
+class JobState(BaseModel):
+    """Progress of one job."""
+    status: str = PENDING
+    inputs_fingerprint: str = ""
+    directory: str = ""
+    error: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+def load_specs(path: str) -> List[CurriculumSpec]:
+    """Read curriculum specs from a JSONL or CSV file.
+
+    Raises:
+        ValueError: If the file type is unsupported, a spec is invalid or two
+            specs have the same job id
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            rows = [(i, row) for i, row in enumerate(csv.DictReader(f), start=2)]
+        elif path.suffix.lower() in (".jsonl", ".ndjson"):
+            rows = [(i, json.loads(line)) for i, line in enumerate(f, start=1) if line.strip()]
+        else:
+            raise ValueError(f"Unsupported spec file type '{path.suffix}'; use .jsonl or .csv")
+
+    specs = []
+    for line, row in rows:
+        try:
+            specs.append(CurriculumSpec(**{key: value for key, value in row.items() if value not in (None, "")}))
+        except (ValidationError, TypeError) as e:
+            raise ValueError(f"Invalid curriculum spec on line {line} of {path}: {e}") from e
+
+    seen = set()
+    for spec in specs:
+        if spec.job_id in seen:
+            raise ValueError(f"Duplicate job id '{spec.job_id}' in {path}")
+        seen.add(spec.job_id)
+    return specs
+
+
+def outline_session_count(outline: str) -> int:
+    """Number of sessions the outline describes."""
+    from comprehensive_curriculum_creator.research_fanout import parse_outline_units
+
+    return sum(1 for unit in parse_outline_units(outline) if unit.session is not None)
+
+
+def approve_outline(policy: str, spec: CurriculumSpec, outline: str) -> Optional[str]:
+    """Apply the approval policy to a Stage 1 outline.
+
+    Returns:
+        None if approved, otherwise the reason it was not
+    """
+    if policy == "outline-only":
+        return "outline kept for review"
+    if policy == "check":
+        found = outline_session_count(outline)
+        if found != spec.sessions:
+            return f"outline has {found} sessions, {spec.sessions} were requested"
+    return None
+
+
+def shared_state_env() -> Dict[str, str]:
+    """Environment pointing every job at the batch's shared ledger and caches.
+
+    Paths are resolved against the parent's working directory; values already
+    set in the environment win. The research cache uses SQLite unless another
+    shared backend is configured, as an in-memory cache is not shared between
+    processes.
+    """
+    from comprehensive_curriculum_creator.cost_budget import LEDGER_PATH_ENV, ledger_path_from_config
+    from comprehensive_curriculum_creator.tools import deep_research_tool as research
+
+    def shared_path(env: str, default: str) -> str:
+        return os.path.abspath(os.path.expanduser(os.getenv(env) or default))
+
+    backend = os.getenv(research.CACHE_BACKEND_ENV) or "sqlite"
+    return {
+        LEDGER_PATH_ENV: ledger_path_from_config(str(research.DEFAULT_RESEARCH_CONFIG_PATH)),
+        research.CACHE_BACKEND_ENV: "sqlite" if backend == "memory" else backend,
+        research.CACHE_PATH_ENV: shared_path(research.CACHE_PATH_ENV, research.DEFAULT_CACHE_PATH),
+        research.SUMMARY_CACHE_PATH_ENV: shared_path(research.SUMMARY_CACHE_PATH_ENV, research.DEFAULT_SUMMARY_CACHE_PATH),
+        research.SEMANTIC_CACHE_PATH_ENV: shared_path(research.SEMANTIC_CACHE_PATH_ENV, research.DEFAULT_SEMANTIC_CACHE_PATH),
+    }
+
+
+def enter_job_dir(job_dir: str, shared_env: Optional[Dict[str, str]] = None) -> None:
+    """Make ``job_dir`` the working directory, keeping the batch's shared state."""
+    os.environ.update(shared_env or {})
+    os.chdir(job_dir)
+
+
+def run_job(spec_data: Dict, job_dir: str, policy: str, shared_env: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+    """Run one curriculum in a worker process.
+
+    The worker changes into ``job_dir`` so the crew's ``./output`` paths
+    resolve to the job's own folder, and sends its output to ``job.log``.
+    ``shared_env`` (see ``shared_state_env``) keeps the ledger and caches
+    shared with the other jobs.
+
+    Returns:
+        The job's final status and, if it did not complete, why
+    """
+    enter_job_dir(job_dir, shared_env)
+    log = open("job.log", "a", encoding="utf-8")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+
+    # LLM provider exceptions often cannot be pickled back to the parent,
+    # which would take the worker down with them, so failures are returned
+    try:
+        return _run_curriculum(CurriculumSpec(**spec_data), policy)
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": FAILED, "error": f"{type(e).__name__}: {e}"}
+
+
+def _run_curriculum(spec: CurriculumSpec, policy: str) -> Dict[str, Optional[str]]:
+    from comprehensive_curriculum_creator.checkpoint import CheckpointStore
+    from comprehensive_curriculum_creator.main import run_full_curriculum_creation, run_stage1_outline_creation
+
+    inputs = spec.inputs
+    output_dir = Path("./output")
+    output_dir.mkdir(exist_ok=True)
+    with open(output_dir / "curriculum_inputs.json", "w") as f:
+        json.dump(inputs, f, indent=2)
+
+    # A job that failed in Stage 2 resumes from its outline and completed tasks
+    outline_output = CheckpointStore().load("create_curriculum_outline", inputs)
+    resuming = outline_output is not None
+    if not resuming:
+        outline_output = run_stage1_outline_creation(inputs).tasks_output[0]
+
+    rejection = approve_outline(policy, spec, outline_output.raw)
+    if rejection is not None:
+        status = OUTLINE_READY if policy == "outline-only" else REJECTED
+        return {"status": status, "error": rejection}
+
+    run_full_curriculum_creation(inputs, outline_output, resume=resuming)
+    return {"status": COMPLETED, "error": None}
+
+
+class BatchRunner:
+    """Runs curriculum jobs concurrently and records their progress.
+
+    Args:
+        batch_dir: Directory holding one folder per job and the progress file
+        concurrency: Jobs running at the same time
+        policy: Approval policy, one of ``APPROVAL_POLICIES``
+    """
+
+    def __init__(self, batch_dir: str = DEFAULT_BATCH_DIR, concurrency: int = 4, policy: str = "auto"):
+        if policy not in APPROVAL_POLICIES:
+            raise ValueError(f"Approval policy must be one of: {', '.join(APPROVAL_POLICIES)}")
+        self.batch_dir = Path(batch_dir).resolve()
+        self.concurrency = max(1, concurrency)
+        self.policy = policy
+        self.progress_path = self.batch_dir / PROGRESS_FILE
+
+    def load_progress(self) -> Dict[str, JobState]:
+        """Job states from a previous run of this batch."""
+        if not self.progress_path.exists():
+            return {}
+        try:
+            with open(self.progress_path, "r", encoding="utf-8") as f:
+                return {job_id: JobState(**state) for job_id, state in json.load(f).items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable batch progress {self.progress_path}: {e}")
+            return {}
+
+    def _save_progress(self, progress: Dict[str, JobState]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.batch_dir), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({job_id: state.model_dump() for job_id, state in progress.items()}, f, indent=2)
+        os.replace(tmp_path, self.progress_path)
+
+    def _update(self, progress: Dict[str, JobState], job_id: str, **changes) -> None:
+        state = progress[job_id]
+        for key, value in changes.items():
+            setattr(state, key, value)
+        state.updated_at = datetime.now(timezone.utc).isoformat()
+        self._save_progress(progress)
+
+    def pending_jobs(self, specs: List[CurriculumSpec], progress: Dict[str, JobState]) -> List[CurriculumSpec]:
+        """Specs that still need to run.
+
+        Completed jobs are skipped unless their inputs changed. Outlines kept
+        for review are developed once the policy allows it.
+        """
+        pending = []
+        for spec in specs:
+            state = progress.get(spec.job_id)
+            fingerprint = inputs_fingerprint(spec.inputs)
+            if state is not None and state.inputs_fingerprint == fingerprint:
+                if state.status == COMPLETED:
+                    continue
+                if state.status == OUTLINE_READY and self.policy == "outline-only":
+                    continue
+            pending.append(spec)
+        return pending
+
+    def run(self, specs: List[CurriculumSpec]) -> Dict[str, JobState]:
+        """Run every pending job, at most ``concurrency`` at a time.
+
+        Returns:
+            Final state of every job in the batch
+        """
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        progress = self.load_progress()
+        pending = self.pending_jobs(specs, progress)
+        print(f"Batch: {len(specs)} curricula, {len(specs) - len(pending)} already done, "
+              f"{len(pending)} to run ({self.concurrency} at a time, policy '{self.policy}')")
+
+        for spec in pending:
+            job_dir = self.batch_dir / spec.job_id
+            job_dir.mkdir(parents=True, exist_ok=True)
+            progress[spec.job_id] = JobState(
+                status=PENDING,
+                inputs_fingerprint=inputs_fingerprint(spec.inputs),
+                directory=str(job_dir),
+            )
+        self._save_progress(progress)
+
+        if not pending:
+            return progress
+
+        # Ledger and caches are shared by path, resolved before any job changes directory
+        shared_env = shared_state_env()
+
+        # One process per job: no crew, LLM or tool state is shared between jobs.
+        # Python 3.10 cannot recycle workers, so there a worker runs several jobs.
+        pool_options = {"mp_context": multiprocessing.get_context("spawn")}
+        if sys.version_info >= (3, 11):
+            pool_options["max_tasks_per_child"] = 1
+        with ProcessPoolExecutor(max_workers=self.concurrency, **pool_options) as pool:
+            futures = {
+                pool.submit(run_job, spec.model_dump(), progress[spec.job_id].directory, self.policy, shared_env): spec
+                for spec in pending
+            }
+
+            for future in as_completed(futures):
+                spec = futures[future]
+                try:
+                    outcome = future.result()
+                    self._update(progress, spec.job_id, status=outcome["status"], error=outcome["error"])
+                except Exception as e:
+                    self._update(progress, spec.job_id, status=FAILED, error=str(e))
+                state = progress[spec.job_id]
+                detail = f" ({state.error})" if state.error else ""
+                print(f"[{state.status}] {spec.job_id}{detail}")
+
+        return progress
@@ -0,0 +1,143 @@
+"""Persisted task outputs for reusing finished work across crew runs.
+
+Each completed task's ``TaskOutput`` is stored as JSON together with the
+inputs it was produced for. A later crew built with
+``ComprehensiveCurriculumCreatorCrew.crew_with_completed_tasks`` can then be
+seeded with those outputs instead of running the tasks again.
+
+Stage 2 saves every task's output as soon as the task finishes (see
+``CheckpointStore.saver``), so a run that dies part way can be resumed with
+the same inputs from the tasks it completed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from crewai.tasks.task_output import TaskOutput
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = "./output/.checkpoints"
+
+
+def inputs_fingerprint(inputs: Dict[str, Any]) -> str:
+    """Stable hash of the curriculum inputs a checkpoint belongs to."""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class CheckpointStore:
+    """Directory of task output checkpoints, one JSON file per task.
+
+    Args:
+        directory: Where checkpoint files are written
+    """
+
+    def __init__(self, directory: str = DEFAULT_CHECKPOINT_DIR):
+        self.directory = Path(directory)
+
+    def _path(self, task_name: str) -> Path:
+        return self.directory / f"{task_name}.json"
+
+    def save(self, task_name: str, output: TaskOutput, inputs: Dict[str, Any]) -> Path:
+        """Persist a task output for the given inputs.
+
+        The file is written to a temporary name and renamed into place so a
+        crash never leaves a truncated checkpoint behind.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = {
+            "task_name": task_name,
+            "inputs": inputs,
+            "inputs_fingerprint": inputs_fingerprint(inputs),
+            "task_output": output.model_dump(mode="json", exclude={"pydantic"}),
+        }
+
+        path = self._path(task_name)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.directory), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, task_name: str, inputs: Optional[Dict[str, Any]] = None) -> Optional[TaskOutput]:
+        """Load a task output checkpoint.
+
+        Args:
+            task_name: Name of the task (the @task method name)
+            inputs: If given, the checkpoint is only returned when it was
+                produced for exactly these inputs
+
+        Returns:
+            The stored TaskOutput, or None if missing, unreadable or stale
+        """
+        path = self._path(task_name)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            output = TaskOutput(**record["task_output"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+        if inputs is not None and record.get("inputs_fingerprint") != inputs_fingerprint(inputs):
+            logger.info(f"Ignoring checkpoint {path}: it was created for different inputs")
+            return None
+
+        return output
+
+    def delete(self, task_name: str) -> None:
+        """Remove a task's checkpoint if present."""
+        self._path(task_name).unlink(missing_ok=True)
+
+    def task_names(self) -> List[str]:
+        """Names of the tasks that have a checkpoint."""
+        if not self.directory.exists():
+            return []
+        return sorted(path.stem for path in self.directory.glob("*.json"))
+
+    def load_all(self, inputs: Dict[str, Any]) -> Dict[str, TaskOutput]:
+        """Every checkpoint produced for the given inputs, keyed by task name."""
+        completed = {}
+        for task_name in self.task_names():
+            output = self.load(task_name, inputs)
+            if output is not None:
+                completed[task_name] = output
+        return completed
+
+    def load_inputs(self, task_name: str) -> Optional[Dict[str, Any]]:
+        """Inputs a task's checkpoint was produced for, or None if there is none."""
+        try:
+            with open(self._path(task_name), "r", encoding="utf-8") as f:
+                return json.load(f).get("inputs")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def clear(self, keep: Iterable[str] = ()) -> None:
+        """Remove every checkpoint except those of the tasks in ``keep``."""
+        keep = set(keep)
+        for task_name in self.task_names():
+            if task_name not in keep:
+                self.delete(task_name)
+
+    def saver(self, inputs: Dict[str, Any]) -> Callable[[TaskOutput], None]:
+        """Task callback that checkpoints each task's output when it finishes.
+
+        Failing to write a checkpoint is logged and never fails the crew.
+        """
+        def save_output(output: TaskOutput) -> None:
+            if not output.name:
+                return
+            try:
+                self.save(output.name, output, inputs)
+            except OSError as e:
+                logger.warning(f"Could not checkpoint task '{output.name}': {e}")
+
+        return save_output
@@ -0,0 +1,345 @@
+"""Spend tracking and budget enforcement for research and crew runs.
+
+The limits come from the ``cost_management`` section of research_config.yaml:
+
+- ``max_cost_per_research``: a single research run is stopped once its LLM
+  calls cost more than this
+- ``monthly_budget_limit``: total spend per calendar month
+- ``cost_alert_threshold``: fraction of the monthly budget after which work
+  is downgraded instead of failing: research runs in a cheaper mode
+  (``research_mode_downgrades``) and LLMs switch to a cheaper model
+  (``model_downgrades``)
+
+Once the monthly budget is used up, new research is refused and the crew
+runs on the downgraded models only.
+
+Spend is priced with the table in llm_config.yaml and persisted per month
+in one ledger file: ``$COST_LEDGER_PATH``, else ``cost_management.ledger_path``,
+else ``output/.cache/cost_ledger.json``. The path is made absolute when it is
+resolved, so processes that later change directory (batch jobs) keep adding
+to the same ledger. The ledger is locked while it is updated, so concurrent
+processes sharing it keep an exact total.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import yaml
+from langchain_core.callbacks import BaseCallbackHandler
+from pydantic import BaseModel, Field
+
+from comprehensive_curriculum_creator.llm_registry import get_llm_registry
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock still applies
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER_PATH = "./output/.cache/cost_ledger.json"
+LEDGER_PATH_ENV = "COST_LEDGER_PATH"
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a research run goes over its cost limit."""
+
+
+class CostSettings(BaseModel):
+    """The ``cost_management`` section of research_config.yaml."""
+    enable_cost_tracking: bool = True
+    max_cost_per_research: float = Field(default=5.0, description="USD per research run")
+    monthly_budget_limit: float = Field(default=500.0, description="USD per calendar month")
+    cost_alert_threshold: float = Field(default=0.8, description="Budget fraction that triggers downgrades")
+    research_mode_downgrades: Dict[str, str] = Field(default_factory=lambda: {"academic": "deep", "deep": "quick"})
+    model_downgrades: Dict[str, str] = Field(default_factory=lambda: {"gpt-4o": "gpt-4o-mini"})
+    ledger_path: Optional[str] = Field(default=None, description="Spend ledger shared by every run; relative to the working directory")
+
+
+def load_cost_settings(config: Dict[str, Any]) -> CostSettings:
+    """Cost settings from a parsed research_config.yaml."""
+    return CostSettings(**(config.get("cost_management") or {}))
+
+
+def load_cost_settings_file(config_path: str) -> CostSettings:
+    """Cost settings from a research_config.yaml file; defaults if it cannot be read."""
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except OSError as e:
+        logger.warning(f"Could not read research config at {config_path}: {e}")
+        config = {}
+    return load_cost_settings(config)
+
+
+def resolve_ledger_path(settings: Optional[CostSettings] = None) -> str:
+    """Absolute path of the spend ledger.
+
+    ``$COST_LEDGER_PATH`` wins over ``cost_management.ledger_path``, which
+    wins over ``DEFAULT_LEDGER_PATH``. Relative paths are resolved against
+    the current working directory.
+    """
+    path = os.getenv(LEDGER_PATH_ENV) or (settings.ledger_path if settings else None) or DEFAULT_LEDGER_PATH
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def ledger_path_from_config(config_path: str) -> str:
+    """Absolute ledger path for a research_config.yaml file."""
+    return resolve_ledger_path(load_cost_settings_file(config_path))
+
+
+def _month(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).strftime("%Y-%m")
+
+
+def _bare_model(model: str) -> str:
+    return str(model).split("/")[-1].split(":")[-1]
+
+
+class CostLedger:
+    """Monthly spend totals persisted to a JSON file.
+
+    Args:
+        path: Ledger file
+    """
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH):
+        self.path = Path(path).absolute()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path.with_suffix(".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cost ledger {self.path}: {e}")
+            return {}
+
+    def month(self, month: Optional[str] = None) -> Dict[str, Any]:
+        """Totals of a month (the current one by default)."""
+        entry = self._read().get(month or _month(), {})
+        return {
+            "total_usd": entry.get("total_usd", 0.0),
+            "research_usd": entry.get("research_usd", 0.0),
+            "crew_usd": entry.get("crew_usd", 0.0),
+            "research_calls": entry.get("research_calls", 0),
+            "runs": entry.get("runs", {}),
+        }
+
+    def spent(self, month: Optional[str] = None) -> float:
+        """Total spend of a month in USD."""
+        return self.month(month)["total_usd"]
+
+    def add(self, cost_usd: float, kind: str, run_id: Optional[str] = None, research_mode: Optional[str] = None) -> float:
+        """Add spend to the current month.
+
+        Args:
+            cost_usd: Amount spent
+            kind: 'research' or 'crew'
+            run_id: Curriculum run the spend belongs to
+            research_mode: Mode of a research call, to learn its typical cost
+
+        Returns:
+            The month's new total
+        """
+        with self._locked():
+            data = self._read()
+            entry = data.setdefault(_month(), {})
+            entry["total_usd"] = entry.get("total_usd", 0.0) + cost_usd
+            entry[f"{kind}_usd"] = entry.get(f"{kind}_usd", 0.0) + cost_usd
+            if kind == "research":
+                entry["research_calls"] = entry.get("research_calls", 0) + 1
+                if research_mode:
+                    modes = entry.setdefault("research_modes", {})
+                    stats = modes.setdefault(research_mode, {"calls": 0, "usd": 0.0})
+                    stats["calls"] += 1
+                    stats["usd"] += cost_usd
+            if run_id:
+                runs = entry.setdefault("runs", {})
+                runs[run_id] = runs.get(run_id, 0.0) + cost_usd
+
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+            return entry["total_usd"]
+
+    def average_research_cost(self, research_mode: str) -> Optional[float]:
+        """Average cost of a research call in a mode, from this month's calls."""
+        stats = self._read().get(_month(), {}).get("research_modes", {}).get(research_mode)
+        if not stats or not stats.get("calls"):
+            return None
+        return stats["usd"] / stats["calls"]
+
+
+class ResearchPlan(BaseModel):
+    """How a research call may run under the current budget."""
+    research_mode: str
+    downgrade_model: bool = Field(default=False, description="Run on the cheaper model of ``model_downgrades``")
+    allowed: bool = True
+    reason: Optional[str] = None
+
+
+class CostMeter(BaseCallbackHandler):
+    """LangChain callback that prices every LLM call of a research run.
+
+    Args:
+        limit_usd: Stop the run with ``BudgetExceededError`` above this cost
+    """
+
+    raise_error = True
+
+    def __init__(self, limit_usd: Optional[float] = None):
+        super().__init__()
+        self.limit_usd = limit_usd
+        self.cost_usd = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        registry = get_llm_registry()
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or {}
+                if not usage:
+                    continue
+                metadata = getattr(message, "response_metadata", None) or {}
+                model = metadata.get("model_name") or (response.llm_output or {}).get("model_name")
+                prompt, completion = usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+                cost = registry.estimate_cost(model, prompt, completion) or 0.0
+                with self._lock:
+                    self.prompt_tokens += prompt
+                    self.completion_tokens += completion
+                    self.cost_usd += cost
+
+        if self.limit_usd is not None and self.cost_usd > self.limit_usd:
+            raise BudgetExceededError(
+                f"Research cost ${self.cost_usd:.2f} exceeded the ${self.limit_usd:.2f} per-research limit"
+            )
+
+
+class BudgetGuard:
+    """Applies the cost limits to research calls and crew runs.
+
+    Args:
+        settings: Limits and downgrade maps
+        ledger: Where spend is recorded; the resolved shared ledger by default
+    """
+
+    def __init__(self, settings: CostSettings, ledger: Optional[CostLedger] = None):
+        self.settings = settings
+        self.ledger = ledger or CostLedger(resolve_ledger_path(settings))
+
+    @classmethod
+    def from_config_file(cls, config_path: str, ledger_path: Optional[str] = None) -> "BudgetGuard":
+        """Build a guard from research_config.yaml.
+
+        Args:
+            config_path: research_config.yaml file
+            ledger_path: Spend ledger; resolved with ``resolve_ledger_path`` by default
+        """
+        settings = load_cost_settings_file(config_path)
+        return cls(settings, CostLedger(ledger_path or resolve_ledger_path(settings)))
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.enable_cost_tracking
+
+    def budget_used(self) -> float:
+        """Fraction of the monthly budget spent."""
+        if self.settings.monthly_budget_limit <= 0:
+            return 0.0
+        return self.ledger.spent() / self.settings.monthly_budget_limit
+
+    def downgrade_model(self, model: str) -> str:
+        """Cheaper replacement of a model, or the model itself."""
+        return self.settings.model_downgrades.get(_bare_model(model), model)
+
+    def plan_research(self, research_mode: str) -> ResearchPlan:
+        """Decide how a research call may run.
+
+        Near the monthly limit the mode and model are downgraded; a mode whose
+        typical cost this month is above the per-research limit is downgraded
+        too. Once the monthly budget is spent, research is refused.
+        """
+        if not self.enabled:
+            return ResearchPlan(research_mode=research_mode)
+
+        used = self.budget_used()
+        if used >= 1.0:
+            return ResearchPlan(
+                research_mode=research_mode,
+                allowed=False,
+                reason=f"monthly research budget of ${self.settings.monthly_budget_limit:.2f} is used up",
+            )
+
+        plan = ResearchPlan(research_mode=research_mode)
+        if used >= self.settings.cost_alert_threshold:
+            plan.research_mode = self.settings.research_mode_downgrades.get(research_mode, research_mode)
+            plan.downgrade_model = True
+            plan.reason = f"{used:.0%} of the monthly budget is spent"
+        else:
+            average = self.ledger.average_research_cost(research_mode)
+            if average is not None and average > self.settings.max_cost_per_research:
+                plan.research_mode = self.settings.research_mode_downgrades.get(research_mode, research_mode)
+                plan.reason = f"{research_mode} research averages ${average:.2f}, above the per-research limit"
+
+        if plan.reason:
+            logger.warning(
+                f"Downgrading research from {research_mode} to {plan.research_mode}"
+                f"{' on cheaper models' if plan.downgrade_model else ''}: {plan.reason}"
+            )
+        return plan
+
+    def meter(self) -> CostMeter:
+        """Callback handler that prices one research run and enforces its limit."""
+        return CostMeter(self.settings.max_cost_per_research if self.enabled else None)
+
+    def record_research(self, meter: CostMeter, research_mode: str, run_id: Optional[str] = None) -> None:
+        """Record the spend of a finished (or stopped) research run."""
+        if not self.enabled or meter.cost_usd <= 0:
+            return
+        total = self.ledger.add(meter.cost_usd, "research", run_id=run_id, research_mode=research_mode)
+        self._alert(total)
+
+    def record_crew(self, cost_usd: float, run_id: Optional[str] = None) -> None:
+        """Record the LLM spend of a crew run."""
+        if not self.enabled or cost_usd <= 0:
+            return
+        total = self.ledger.add(cost_usd, "crew", run_id=run_id)
+        self._alert(total)
+
+    def crew_model_overrides(self) -> Dict[str, str]:
+        """Model replacements for the crew's agents under the current budget."""
+        if not self.enabled or self.budget_used() < self.settings.cost_alert_threshold:
+            return {}
+        logger.warning(f"{self.budget_used():.0%} of the monthly budget is spent; using cheaper crew models")
+        return dict(self.settings.model_downgrades)
+
+    def _alert(self, total: float) -> None:
+        limit = self.settings.monthly_budget_limit
+        if limit > 0 and total >= limit * self.settings.cost_alert_threshold:
+            logger.warning(f"Cost alert: ${total:.2f} of the ${limit:.2f} monthly budget spent ({total / limit:.0%})")
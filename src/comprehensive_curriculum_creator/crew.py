@@ -1,20 +1,21 @@
+import importlib.util
 import os
-from crewai import LLM
+from typing import Dict, Optional
 from crewai import Agent, Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import (
-	SerperDevTool,
-	ScrapeWebsiteTool,
-	WebsiteSearchTool,
-	TavilySearchTool,
-	GithubSearchTool
-)
 from comprehensive_curriculum_creator.tools.custom_tool import (
 	FileOrganizerTool,
 	ZipCreatorTool,
-	ContentWriterTool
+	ContentWriterTool,
+	BatchContentWriterTool
 )
-from comprehensive_curriculum_creator.tools.deep_research_tool import DeepResearchTool
+from comprehensive_curriculum_creator.tools.content_store import DEFAULT_STORE_PATH, resolve_store_path
+from comprehensive_curriculum_creator.cost_budget import ledger_path_from_config
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_CONFIG_PATH, DeepResearchTool
+from comprehensive_curriculum_creator.tools.lazy_tool import lazy_crewai_tool
+from comprehensive_curriculum_creator.llm_registry import get_llm_registry
+from comprehensive_curriculum_creator.task_graph import schedule_parallel, schedule_sequential
 
 
 
@@ -23,14 +24,23 @@ from comprehensive_curriculum_creator.tools.deep_research_tool import DeepResear
 class ComprehensiveCurriculumCreatorCrew:
     """ComprehensiveCurriculumCreator crew"""
 
-    
+    # Run tasks whose tasks.yaml contexts do not depend on each other concurrently
+    parallel_tasks: bool = True
+
+    # Course files are written through this content store so repeated boilerplate is stored once and
+    # compressed once in the zip; CONTENT_STORE_PATH overrides it, and None or "" writes plain files
+    content_store_path: Optional[str] = DEFAULT_STORE_PATH
+
+    def _schedule(self, tasks):
+        return schedule_parallel(tasks) if self.parallel_tasks else schedule_sequential(tasks)
+
     @agent
     def curriculum_architect(self) -> Agent:
         
         return Agent(
             config=self.agents_config["curriculum_architect"],
             tools=[
-				SerperDevTool()
+				lazy_crewai_tool("SerperDevTool")
             ],
             reasoning=False,
             max_reasoning_attempts=None,
@@ -39,32 +49,27 @@ class ComprehensiveCurriculumCreatorCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                model="gpt-4o",
-                temperature=0.7,
-            ),
+            llm=get_llm_registry().for_agent("curriculum_architect"),
         )
     
     @agent
     def subject_matter_researcher(self) -> Agent:
         # Build tools list conditionally based on available API keys
         tools = [
-            SerperDevTool(),
-            ScrapeWebsiteTool(),
-            WebsiteSearchTool()
+            lazy_crewai_tool("SerperDevTool"),
+            lazy_crewai_tool("ScrapeWebsiteTool"),
+            lazy_crewai_tool("WebsiteSearchTool")
         ]
 
-        # Only add TavilySearchTool if API key is available
-        try:
-            if os.getenv("TAVILY_API_KEY"):
-                tools.append(TavilySearchTool())
-        except ImportError:
-            pass  # TavilySearchTool not available
+        # Only add TavilySearchTool if API key and the tavily package are available
+        if os.getenv("TAVILY_API_KEY") and importlib.util.find_spec("tavily") is not None:
+            tools.append(lazy_crewai_tool("TavilySearchTool"))
 
         # Only add GitHub tool if token is available
         github_token = os.getenv("GITHUB_TOKEN")
         if github_token:
-            tools.append(GithubSearchTool(
+            tools.append(lazy_crewai_tool(
+                "GithubSearchTool",
                 gh_token=github_token,
                 content_types=['code', 'repo', 'issue']
             ))
@@ -77,7 +82,9 @@ class ComprehensiveCurriculumCreatorCrew:
             has_tavily = bool(os.getenv("TAVILY_API_KEY"))
 
             if has_openai or has_anthropic:  # At least one LLM provider
-                tools.append(DeepResearchTool())
+                tools.append(DeepResearchTool(
+                    cost_ledger_path=ledger_path_from_config(str(DEFAULT_RESEARCH_CONFIG_PATH))
+                ))
                 print("✅ Deep Research Tool added to subject_matter_researcher")
             else:
                 print("⚠️  Deep Research Tool not available - missing API keys")
@@ -96,10 +103,7 @@ class ComprehensiveCurriculumCreatorCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                model="gpt-4o",
-                temperature=0.7,
-            ),
+            llm=get_llm_registry().for_agent("subject_matter_researcher"),
         )
     
     @agent
@@ -117,31 +121,26 @@ class ComprehensiveCurriculumCreatorCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                model="gpt-4o",
-                temperature=0.7,
-            ),
+            llm=get_llm_registry().for_agent("learning_content_developer"),
         )
     
     @agent
     def project_specialist(self) -> Agent:
         # Build tools list conditionally based on available API keys
         tools = [
-            SerperDevTool(),
-            WebsiteSearchTool()
+            lazy_crewai_tool("SerperDevTool"),
+            lazy_crewai_tool("WebsiteSearchTool")
         ]
 
-        # Only add TavilySearchTool if API key is available
-        try:
-            if os.getenv("TAVILY_API_KEY"):
-                tools.append(TavilySearchTool())
-        except ImportError:
-            pass  # TavilySearchTool not available
+        # Only add TavilySearchTool if API key and the tavily package are available
+        if os.getenv("TAVILY_API_KEY") and importlib.util.find_spec("tavily") is not None:
+            tools.append(lazy_crewai_tool("TavilySearchTool"))
 
         # Only add GitHub tool if token is available
         github_token = os.getenv("GITHUB_TOKEN")
         if github_token:
-            tools.append(GithubSearchTool(
+            tools.append(lazy_crewai_tool(
+                "GithubSearchTool",
                 gh_token=github_token,
                 content_types=['code', 'repo', 'issue']
             ))
@@ -156,21 +155,20 @@ class ComprehensiveCurriculumCreatorCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                model="gpt-4o",
-                temperature=0.7,
-            ),
+            llm=get_llm_registry().for_agent("project_specialist"),
         )
     
     @agent
     def course_structure_organizer(self) -> Agent:
+        store_path = resolve_store_path(self.content_store_path)
 
         return Agent(
             config=self.agents_config["course_structure_organizer"],
             tools=[
 				FileOrganizerTool(),
-				ZipCreatorTool(),
-				ContentWriterTool()
+				ZipCreatorTool(content_store_path=store_path),
+				ContentWriterTool(content_store_path=store_path),
+				BatchContentWriterTool(content_store_path=store_path)
             ],
             reasoning=False,
             max_reasoning_attempts=None,
@@ -179,10 +177,7 @@ class ComprehensiveCurriculumCreatorCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                model="gpt-4o",
-                temperature=0.7,
-            ),
+            llm=get_llm_registry().for_agent("course_structure_organizer"),
         )
     
 
@@ -235,7 +230,38 @@ class ComprehensiveCurriculumCreatorCrew:
         """Creates the ComprehensiveCurriculumCreator crew"""
         return Crew(
             agents=self.agents,  # Automatically created by the @agent decorator
-            tasks=self.tasks,  # Automatically created by the @task decorator
+            tasks=self._schedule(self.tasks),  # Automatically created by the @task decorator
             process=Process.sequential,
             verbose=True,
         )
+
+    def crew_with_completed_tasks(self, completed: Dict[str, TaskOutput]) -> Crew:
+        """Creates the crew with some tasks already completed.
+
+        Completed tasks keep their output so later tasks still receive it as
+        context, but they are left out of the crew and never run again.
+
+        Args:
+            completed: Task outputs keyed by task name (the @task method name)
+        """
+        full_crew = self.crew()
+        remaining_tasks = []
+        for task in full_crew.tasks:
+            if task.name in completed:
+                task.output = completed[task.name]
+            else:
+                remaining_tasks.append(task)
+
+        agents = []
+        agent_roles = set()
+        for task in remaining_tasks:
+            if task.agent is not None and task.agent.role not in agent_roles:
+                agents.append(task.agent)
+                agent_roles.add(task.agent.role)
+
+        return Crew(
+            agents=agents,
+            tasks=self._schedule(remaining_tasks),
+            process=full_crew.process,
+            verbose=full_crew.verbose,
+        )
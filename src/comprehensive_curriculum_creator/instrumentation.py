@@ -0,0 +1,308 @@
+"""Timings, token counts and cost estimates for crew runs.
+
+A ``MetricsRecorder`` attached to a crew records, as JSON lines:
+
+- ``task``: duration, agent, model, prompt/completion tokens and estimated
+  cost of every task, from per-task callbacks
+- ``step``: every agent iteration (tool call or final answer) and the time
+  since the agent's previous step, from per-agent step callbacks
+- ``tool``: duration and outcome of every call to a tool whose ``_run`` is
+  decorated with ``timed_tool``
+- ``run``: totals per agent and per tool when the run finishes
+
+Tokens are read from each agent's own token counter, which CrewAI updates on
+every LLM call. An agent never runs two tasks at once (see task_graph), so the
+difference between two of its tasks is exactly the later task's usage. Costs
+use the price table in llm_config.yaml.
+
+With a Prometheus path set (or ``CREW_METRICS_PROMETHEUS``), the totals are
+also written in the Prometheus text format for the node exporter's textfile
+collector.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from crewai import Crew, Task
+
+from comprehensive_curriculum_creator.llm_registry import get_llm_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_DIR = "./output/.metrics"
+
+_current: Optional["MetricsRecorder"] = None
+
+
+def get_recorder() -> Optional["MetricsRecorder"]:
+    """The recorder tool calls are reported to, if any."""
+    return _current
+
+
+def set_recorder(recorder: Optional["MetricsRecorder"]) -> None:
+    """Make a recorder receive tool timings; None stops recording."""
+    global _current
+    _current = recorder
+
+
+def timed_tool(run: Callable) -> Callable:
+    """Decorate a tool's ``_run`` or ``_arun`` to report its duration."""
+    def report(tool, start: float, result: Any = None, error: Optional[BaseException] = None) -> None:
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.record_tool(tool.name, time.perf_counter() - start, result, error)
+
+    if asyncio.iscoroutinefunction(run):
+        @functools.wraps(run)
+        async def timed_arun(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await run(self, *args, **kwargs)
+            except BaseException as e:
+                report(self, start, error=e)
+                raise
+            report(self, start, result)
+            return result
+        return timed_arun
+
+    @functools.wraps(run)
+    def timed_run(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = run(self, *args, **kwargs)
+        except BaseException as e:
+            report(self, start, error=e)
+            raise
+        report(self, start, result)
+        return result
+    return timed_run
+
+
+def _usage(agent) -> Dict[str, int]:
+    token_process = getattr(agent, "_token_process", None)
+    if token_process is None:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "cached_prompt_tokens": 0, "requests": 0}
+    summary = token_process.get_summary()
+    return {
+        "prompt_tokens": summary.prompt_tokens,
+        "completion_tokens": summary.completion_tokens,
+        "cached_prompt_tokens": summary.cached_prompt_tokens,
+        "requests": summary.successful_requests,
+    }
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+class MetricsRecorder:
+    """Records structured metrics of one crew run.
+
+    Args:
+        jsonl_path: File the events are appended to; defaults to a new file
+            per run under ``output/.metrics``
+        prometheus_path: Optional Prometheus textfile written by ``finish``
+        run_id: Identifier added to every event
+    """
+
+    def __init__(
+        self,
+        jsonl_path: Optional[str] = None,
+        prometheus_path: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ):
+        self.run_id = run_id or f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:6]}"
+        self.jsonl_path = Path(jsonl_path or Path(DEFAULT_METRICS_DIR) / f"run_{self.run_id}.jsonl")
+        self.prometheus_path = prometheus_path or os.getenv("CREW_METRICS_PROMETHEUS")
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._usage_marks: Dict[int, Dict[str, int]] = {}
+        self._last_step: Dict[int, float] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.agents: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.tools: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def emit(self, event: str, **fields) -> None:
+        """Append one event to the JSONL file."""
+        record = {"event": event, "run_id": self.run_id, "timestamp": datetime.now(timezone.utc).isoformat()}
+        record.update(fields)
+        line = json.dumps(record, default=str)
+        with self._lock:
+            try:
+                self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write metrics to {self.jsonl_path}: {e}")
+
+    def attach(self, crew: Crew) -> Crew:
+        """Hook task and step callbacks of a crew and report its tool calls here.
+
+        Existing task callbacks keep running; the crew's own ``task_callback``
+        is still called by CrewAI alongside the per-task callbacks.
+        """
+        for task in crew.tasks:
+            task.callback = self._task_callback(task, task.callback)
+        for agent in crew.agents:
+            self._usage_marks[id(agent)] = _usage(agent)
+            agent.step_callback = self._step_callback(agent, agent.step_callback)
+        set_recorder(self)
+        return crew
+
+    def _task_callback(self, task: Task, previous: Optional[Callable]) -> Callable:
+        def on_task_done(output) -> None:
+            try:
+                self.record_task(task)
+            except Exception as e:
+                logger.warning(f"Could not record metrics for task '{task.name}': {e}")
+            if previous is not None:
+                previous(output)
+        return on_task_done
+
+    def _step_callback(self, agent, previous: Optional[Callable]) -> Callable:
+        def on_step(step) -> None:
+            now = time.perf_counter()
+            executor_task = getattr(getattr(agent, "agent_executor", None), "task", None)
+            since = self._last_step.get(id(agent), self._started)
+            task_start = getattr(executor_task, "start_time", None)
+            if task_start is not None:
+                # Do not count the time the agent waited for its task to start
+                since = max(since, now - (datetime.now() - task_start).total_seconds())
+            self._last_step[id(agent)] = now
+
+            kind = type(step).__name__
+            with self._lock:
+                self.agents[agent.role]["steps"] += 1
+            self.emit(
+                "step",
+                agent=agent.role,
+                task=getattr(executor_task, "name", None),
+                kind=kind,
+                tool=getattr(step, "tool", None),
+                seconds=round(now - since, 3),
+            )
+            if previous is not None:
+                previous(step)
+        return on_step
+
+    def record_task(self, task: Task) -> None:
+        """Record duration, token usage and cost of a finished task."""
+        agent = task.agent
+        usage = _usage(agent)
+        mark = self._usage_marks.get(id(agent), {key: 0 for key in usage})
+        delta = {key: usage[key] - mark.get(key, 0) for key in usage}
+        self._usage_marks[id(agent)] = usage
+
+        seconds = (task.end_time - task.start_time).total_seconds() if task.start_time and task.end_time else None
+        model = getattr(getattr(agent, "llm", None), "model", None)
+        cost = get_llm_registry().estimate_cost(model, delta["prompt_tokens"], delta["completion_tokens"])
+        record = {
+            "task": task.name,
+            "agent": agent.role if agent else None,
+            "model": model,
+            "seconds": round(seconds, 3) if seconds is not None else None,
+            **delta,
+            "cost_usd": round(cost, 6) if cost is not None else None,
+        }
+        with self._lock:
+            self.tasks[task.name] = record
+            if agent is not None:
+                totals = self.agents[agent.role]
+                totals["tasks"] += 1
+                totals["seconds"] += seconds or 0
+                totals["prompt_tokens"] += delta["prompt_tokens"]
+                totals["completion_tokens"] += delta["completion_tokens"]
+                totals["cost_usd"] += cost or 0
+        self.emit("task", **record)
+
+    def record_tool(self, tool_name: str, seconds: float, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Record one tool call."""
+        with self._lock:
+            totals = self.tools[tool_name]
+            totals["calls"] += 1
+            totals["seconds"] += seconds
+            if error is not None:
+                totals["errors"] += 1
+        self.emit(
+            "tool",
+            tool=tool_name,
+            seconds=round(seconds, 3),
+            status="error" if error is not None else "ok",
+            error=str(error) if error is not None else None,
+            result_chars=len(str(result)) if result is not None else 0,
+        )
+
+    def finish(self, status: str = "completed") -> Dict[str, Any]:
+        """Record the run totals, write the Prometheus file and stop recording tools.
+
+        Returns:
+            The run summary that was emitted
+        """
+        if get_recorder() is self:
+            set_recorder(None)
+        with self._lock:
+            summary = {
+                "status": status,
+                "seconds": round(time.perf_counter() - self._started, 3),
+                "cost_usd": round(sum(task["cost_usd"] or 0 for task in self.tasks.values()), 6),
+                "agents": {role: dict(totals) for role, totals in self.agents.items()},
+                "tools": {name: dict(totals) for name, totals in self.tools.items()},
+            }
+        self.emit("run", **summary)
+        if self.prometheus_path:
+            self.write_prometheus(self.prometheus_path, summary)
+        return summary
+
+    def prometheus_text(self, summary: Dict[str, Any]) -> str:
+        """Render the run's metrics in the Prometheus text exposition format."""
+        run = f'run_id="{_label(self.run_id)}"'
+        lines = [
+            "# TYPE curriculum_run_duration_seconds gauge",
+            f"curriculum_run_duration_seconds{{{run}}} {summary['seconds']}",
+            "# TYPE curriculum_run_cost_usd gauge",
+            f"curriculum_run_cost_usd{{{run}}} {summary['cost_usd']}",
+            "# TYPE curriculum_task_duration_seconds gauge",
+        ]
+        for task in self.tasks.values():
+            labels = f'{run},task="{_label(task["task"])}",agent="{_label(task["agent"])}"'
+            lines.append(f"curriculum_task_duration_seconds{{{labels}}} {task['seconds'] or 0}")
+        lines.append("# TYPE curriculum_task_tokens gauge")
+        for task in self.tasks.values():
+            labels = f'{run},task="{_label(task["task"])}",agent="{_label(task["agent"])}"'
+            lines.append(f'curriculum_task_tokens{{{labels},kind="prompt"}} {task["prompt_tokens"]}')
+            lines.append(f'curriculum_task_tokens{{{labels},kind="completion"}} {task["completion_tokens"]}')
+        lines.append("# TYPE curriculum_agent_steps gauge")
+        for role, totals in summary["agents"].items():
+            lines.append(f'curriculum_agent_steps{{{run},agent="{_label(role)}"}} {int(totals.get("steps", 0))}')
+        lines.append("# TYPE curriculum_tool_calls gauge")
+        for name, totals in summary["tools"].items():
+            labels = f'{run},tool="{_label(name)}"'
+            lines.append(f'curriculum_tool_calls{{{labels},status="ok"}} {int(totals["calls"] - totals.get("errors", 0))}')
+            lines.append(f'curriculum_tool_calls{{{labels},status="error"}} {int(totals.get("errors", 0))}')
+        lines.append("# TYPE curriculum_tool_duration_seconds gauge")
+        for name, totals in summary["tools"].items():
+            lines.append(f'curriculum_tool_duration_seconds{{{run},tool="{_label(name)}"}} {round(totals["seconds"], 3)}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, summary: Dict[str, Any]) -> None:
+        """Atomically write the Prometheus textfile."""
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.prometheus_text(summary))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write Prometheus metrics to {path}: {e}")
@@ -0,0 +1,177 @@
+"""Process-wide registry of LLM instances for the crew's agents.
+
+Building a new ``LLM`` in every ``@agent`` method gives each agent, and each
+crew instance, its own client and connection pool. The registry hands out one
+``LLM`` per distinct (model, temperature, params) combination and installs a
+single keep-alive HTTP pool for every LiteLLM call in the process. Models,
+per-agent overrides and pool limits come from config/llm_config.yaml.
+"""
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from crewai import LLM
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_CONFIG_PATH = Path(__file__).parent / "config" / "llm_config.yaml"
+
+# Date of a model snapshot: gpt-4o-2024-08-06, claude-3-5-sonnet-20241022, gpt-4-0613
+_SNAPSHOT_SUFFIX = re.compile(r"-(\d{4}-\d{2}-\d{2}|\d{8}|\d{4})$")
+
+
+class HttpPoolSettings(BaseModel):
+    """Limits for the shared LLM HTTP connection pool."""
+    enabled: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30
+    timeout_seconds: float = 600
+
+
+class LLMRegistry:
+    """Shares LLM instances and one HTTP connection pool across agents.
+
+    Args:
+        config_path: Path to the LLM configuration YAML
+    """
+
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = Path(config_path) if config_path else DEFAULT_LLM_CONFIG_PATH
+        self._config: Optional[Dict[str, Any]] = None
+        self._llms: Dict[Tuple[str, Optional[float], str], LLM] = {}
+        self._lock = threading.Lock()
+        self._pool_installed = False
+        self._model_overrides: Dict[str, str] = {}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The parsed LLM configuration, loaded on first use."""
+        if self._config is None:
+            try:
+                with open(self.config_path, "r", encoding="utf-8") as f:
+                    self._config = yaml.safe_load(f) or {}
+            except OSError as e:
+                logger.warning(f"Could not read LLM config at {self.config_path}: {e}")
+                self._config = {}
+        return self._config
+
+    def agent_settings(self, agent_name: str) -> Dict[str, Any]:
+        """Defaults merged with the overrides for one agent."""
+        settings = {"model": "gpt-4o", "temperature": 0.7}
+        settings.update(self.config.get("defaults") or {})
+        settings.update((self.config.get("agents") or {}).get(agent_name) or {})
+        settings["model"] = self._model_overrides.get(settings["model"], settings["model"])
+        return settings
+
+    def set_model_overrides(self, overrides: Dict[str, str]) -> None:
+        """Replace models for agents built from now on, e.g. to stay within budget."""
+        self._model_overrides = dict(overrides)
+
+    def get(self, model: str, temperature: Optional[float] = None, **params) -> LLM:
+        """Get the shared LLM for a model, temperature and extra parameters.
+
+        Args:
+            model: Model name, e.g. 'gpt-4o'
+            temperature: Sampling temperature
+            **params: Any other ``crewai.LLM`` arguments
+
+        Returns:
+            An LLM instance shared by every caller asking for the same settings
+        """
+        self.install_http_pool()
+        key = (model, temperature, json.dumps(params, sort_keys=True, default=str))
+        with self._lock:
+            llm = self._llms.get(key)
+            if llm is None:
+                llm = LLM(model=model, temperature=temperature, **params)
+                self._llms[key] = llm
+            return llm
+
+    def for_agent(self, agent_name: str) -> LLM:
+        """Get the shared LLM configured for an agent in llm_config.yaml."""
+        return self.get(**self.agent_settings(agent_name))
+
+    def estimate_cost(self, model: Optional[str], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """Estimated cost in USD of a number of tokens, from the price table.
+
+        Providers report dated snapshots (``gpt-4o-2024-08-06``), which are
+        priced like their base model. Models missing from llm_config.yaml
+        fall back to LiteLLM's cost map.
+
+        Returns:
+            The cost, or None if no price is known for the model
+        """
+        pricing = self.config.get("pricing") or {}
+        bare = str(model).split("/")[-1].split(":")[-1]
+        prices = pricing.get(model) or pricing.get(bare) or pricing.get(_SNAPSHOT_SUFFIX.sub("", bare))
+        if prices:
+            return (prompt_tokens * prices.get("prompt", 0) + completion_tokens * prices.get("completion", 0)) / 1_000_000
+
+        import litellm
+
+        for name in (str(model), bare, _SNAPSHOT_SUFFIX.sub("", bare)):
+            info = litellm.model_cost.get(name)
+            if info and "input_cost_per_token" in info:
+                return prompt_tokens * info["input_cost_per_token"] + completion_tokens * info.get("output_cost_per_token", 0)
+        return None
+
+    def install_http_pool(self) -> None:
+        """Route every synchronous LiteLLM request through one pooled HTTP client.
+
+        CrewAI agents call their LLM synchronously, also when tasks run
+        concurrently in threads, so a thread-safe ``httpx.Client`` covers
+        them. No async client is installed because an ``httpx.AsyncClient``
+        is bound to the event loop it first runs on. An HTTP client the
+        application already set on ``litellm`` is left alone.
+        """
+        if self._pool_installed:
+            return
+        with self._lock:
+            if self._pool_installed:
+                return
+            self._pool_installed = True
+
+            settings = HttpPoolSettings(**(self.config.get("http_pool") or {}))
+            if not settings.enabled:
+                return
+
+            import httpx
+            import litellm
+
+            limits = httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry_seconds,
+            )
+            if litellm.client_session is not None:
+                return
+            litellm.client_session = httpx.Client(
+                limits=limits,
+                timeout=httpx.Timeout(settings.timeout_seconds),
+                follow_redirects=True,
+            )
+            logger.info(
+                f"Shared LLM HTTP pool installed (max_connections={settings.max_connections}, "
+                f"max_keepalive_connections={settings.max_keepalive_connections})"
+            )
+
+    def clear(self) -> None:
+        """Forget all shared LLM instances and reload the configuration."""
+        with self._lock:
+            self._llms.clear()
+            self._config = None
+
+
+_registry = LLMRegistry()
+
+
+def get_llm_registry() -> LLMRegistry:
+    """The process-wide LLM registry."""
+    return _registry
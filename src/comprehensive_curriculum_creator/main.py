@@ -3,7 +3,26 @@ import sys
 import json
 from pathlib import Path
 from crewai import Crew
+from comprehensive_curriculum_creator.checkpoint import CheckpointStore
+from comprehensive_curriculum_creator.cost_budget import BudgetGuard, ledger_path_from_config
 from comprehensive_curriculum_creator.crew import ComprehensiveCurriculumCreatorCrew
+from comprehensive_curriculum_creator.instrumentation import MetricsRecorder, set_recorder
+from comprehensive_curriculum_creator.llm_registry import get_llm_registry
+from comprehensive_curriculum_creator.research_fanout import parse_outline_units, run_research_fanout
+from comprehensive_curriculum_creator.session_build import SessionBuild, scope_tasks_to_sessions
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_CONFIG_PATH
+
+# Result of a Stage 2 run that found every session up to date and rebuilt nothing
+UP_TO_DATE = "All sessions are up to date; nothing was rebuilt."
+
+def get_budget_guard():
+    """Cost guard configured from research_config.yaml; applies budget downgrades to crew models"""
+    guard = BudgetGuard.from_config_file(
+        str(DEFAULT_RESEARCH_CONFIG_PATH),
+        ledger_path=ledger_path_from_config(str(DEFAULT_RESEARCH_CONFIG_PATH)),
+    )
+    get_llm_registry().set_model_overrides(guard.crew_model_overrides())
+    return guard
 
 def get_user_input():
     """Collect curriculum creation parameters from user with validation"""
@@ -108,6 +127,7 @@ def run_stage1_outline_creation(inputs):
     print("\n=== Stage 1: Creating Curriculum Outline ===")
 
     # Create crew instance
+    budget = get_budget_guard()
     crew_instance = ComprehensiveCurriculumCreatorCrew()
 
     # Create a partial crew that only runs the outline creation task
@@ -119,12 +139,22 @@ def run_stage1_outline_creation(inputs):
 
     # Run the outline creation
     result = partial_crew.kickoff(inputs=inputs)
+    registry = get_llm_registry()
+    budget.record_crew(registry.estimate_cost(
+        registry.agent_settings("curriculum_architect")["model"],
+        result.token_usage.prompt_tokens,
+        result.token_usage.completion_tokens,
+    ) or 0.0)
+
+    # Persist the outline so Stage 2 develops exactly this one instead of regenerating it
+    checkpoint_path = CheckpointStore().save("create_curriculum_outline", result.tasks_output[0], inputs)
 
     print("\n" + "="*60)
     print("CURRICULUM OUTLINE CREATED - STAGE 1 COMPLETE")
     print("="*60)
     print("\nOutline Result:")
     print(result)
+    print(f"\nOutline saved to {checkpoint_path}")
 
     return result
 
@@ -147,12 +177,87 @@ def get_user_approval():
             return response
         print("Please enter 'yes', 'no', or 'revise'")
 
-def run_full_curriculum_creation(inputs):
-    """Run the complete curriculum creation process"""
+def run_full_curriculum_creation(inputs, outline_output=None, incremental=True, resume=False):
+    """Run the complete curriculum creation process
+
+    With ``incremental``, sessions already generated from unchanged inputs are
+    kept and only the stale ones are researched and regenerated. Every task's
+    output is checkpointed when it finishes; with ``resume``, tasks that
+    already have a checkpoint for these inputs are not run again. Timings,
+    tokens and costs of the run are written to ``output/.metrics``.
+
+    Returns ``UP_TO_DATE`` when every session is current and nothing was run.
+    """
     print("\n=== Stage 2: Complete Curriculum Development ===")
 
+    budget = get_budget_guard()
     crew_instance = ComprehensiveCurriculumCreatorCrew()
-    result = crew_instance.crew().kickoff(inputs=inputs)
+    checkpoints = CheckpointStore()
+
+    # Seed Stage 2 with the approved Stage 1 outline rather than generating a new one
+    completed = {}
+    build = plan = None
+    if outline_output is None:
+        outline_output = checkpoints.load("create_curriculum_outline", inputs)
+    if resume:
+        completed.update(checkpoints.load_all(inputs))
+        if set(crew_instance.tasks_config) <= set(completed):
+            print("\nEvery task already completed for these inputs; nothing to resume.")
+            return completed["organize_course_structure"]
+        if completed:
+            print(f"\nResuming; already completed: {', '.join(completed)}")
+    else:
+        # Outputs of an earlier run must not be mixed into a later resume
+        checkpoints.clear(keep=["create_curriculum_outline"])
+
+    metrics = MetricsRecorder()
+    set_recorder(metrics)
+    if outline_output is not None:
+        completed["create_curriculum_outline"] = outline_output
+        units = parse_outline_units(outline_output.raw)
+
+        if incremental:
+            build = SessionBuild(inputs)
+            plan = build.plan(units)
+            if plan.up_to_date:
+                print(f"\nAll {len(plan.fresh)} sessions are up to date; nothing to regenerate.")
+                metrics.finish("up_to_date")
+                return UP_TO_DATE
+            if plan.incremental:
+                print(f"\nRegenerating {len(plan.stale)} of {len(units)} sessions:")
+                for unit in plan.stale:
+                    print(f"- {unit.label}: {unit.title} ({plan.reasons[unit.label]})")
+                units = plan.stale
+
+        # Research every session of the approved outline in parallel instead of
+        # inside the research agent's sequential loop
+        if "research_course_content" not in completed:
+            research_output = run_research_fanout(inputs, outline_output.raw, units=units)
+            if research_output is not None:
+                completed["research_course_content"] = research_output
+                checkpoints.save("research_course_content", research_output, inputs)
+    else:
+        print("No approved outline checkpoint found for these inputs; the outline will be regenerated.")
+
+    if completed:
+        crew = crew_instance.crew_with_completed_tasks(completed)
+    else:
+        crew = crew_instance.crew()
+    if plan is not None and plan.incremental:
+        scope_tasks_to_sessions(crew.tasks, plan)
+    crew.task_callback = checkpoints.saver(inputs)
+    metrics.attach(crew)
+    try:
+        result = crew.kickoff(inputs=inputs)
+    except BaseException:
+        budget.record_crew(metrics.finish("failed")["cost_usd"], metrics.run_id)
+        raise
+    budget.record_crew(metrics.finish()["cost_usd"], metrics.run_id)
+    print(f"\nRun metrics written to {metrics.jsonl_path}")
+
+    if build is not None:
+        recorded = build.record(plan)
+        print(f"\nRecorded {recorded} generated sessions in {build.manifest_path}")
 
     print("\n" + "="*60)
     print("CURRICULUM CREATION COMPLETE")
@@ -201,7 +306,11 @@ def run():
 
         else:  # approval == 'yes'
             print("\nProceeding to Stage 2: Complete curriculum development...")
-            final_result = run_full_curriculum_creation(inputs)
+            final_result = run_full_curriculum_creation(inputs, outline_result.tasks_output[0])
+            if final_result is UP_TO_DATE:
+                print(f"\n{UP_TO_DATE}")
+                print("The curriculum package in ./output/ is current; change the inputs or outline to rebuild it.")
+                return
 
             print("\n" + "="*60)
             print("🎉 CURRICULUM CREATION SUCCESSFULLY COMPLETED!")
@@ -262,18 +371,87 @@ def test():
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
 
+def resume():
+    """
+    Resume the last Stage 2 run from its task checkpoints, with the same inputs.
+    """
+    inputs = CheckpointStore().load_inputs("create_curriculum_outline")
+    if inputs is None:
+        print("No checkpointed run found in ./output/.checkpoints; start one with 'run'.")
+        sys.exit(1)
+
+    try:
+        run_full_curriculum_creation(inputs, resume=True)
+    except Exception as e:
+        raise Exception(f"An error occurred while resuming the crew: {e}")
+
+def profile_startup():
+    """
+    Profile cold-start import time of the crew and the deep research graph.
+    """
+    from comprehensive_curriculum_creator.startup_profile import STARTUP_TARGETS, get_budget, profile_startup as run_profile
+
+    targets = [arg for arg in sys.argv[1:] if not arg.startswith("-") and arg != "profile_startup"]
+    try:
+        profiles = run_profile(targets or None)
+    except ValueError as e:
+        print(f"Usage: profile_startup [{' '.join(STARTUP_TARGETS)}]\n{e}")
+        sys.exit(2)
+
+    # A target that could not be profiled cannot be shown to be within budget
+    failed = [target for target in targets or STARTUP_TARGETS if target not in profiles]
+    over_budget = [target for target, profile in profiles.items() if profile.total_seconds > get_budget(target)]
+    if failed:
+        print(f"Startup profiling failed for: {', '.join(failed)}")
+    if over_budget:
+        print(f"Startup budget exceeded for: {', '.join(over_budget)}")
+    if failed or over_budget:
+        sys.exit(1)
+
+def batch():
+    """
+    Generate many curricula from a JSONL or CSV catalog without prompts.
+    """
+    import argparse
+    from comprehensive_curriculum_creator.batch import APPROVAL_POLICIES, DEFAULT_BATCH_DIR, BatchRunner, load_specs
+
+    parser = argparse.ArgumentParser(prog="batch", description="Generate curricula from a catalog of input specs")
+    parser.add_argument("specs", help="JSONL or CSV file with one curriculum spec per line")
+    parser.add_argument("--concurrency", type=int, default=4, help="Curricula generated at the same time")
+    parser.add_argument("--policy", choices=APPROVAL_POLICIES, default="auto", help="How outlines are approved")
+    parser.add_argument("--output-dir", default=DEFAULT_BATCH_DIR, help="Directory for the job folders")
+    args = parser.parse_args([arg for arg in sys.argv[1:] if arg != "batch"])
+
+    try:
+        specs = load_specs(args.specs)
+        progress = BatchRunner(args.output_dir, concurrency=args.concurrency, policy=args.policy).run(specs)
+    except (OSError, ValueError) as e:
+        print(f"Batch failed: {e}")
+        sys.exit(1)
+
+    failed = [job_id for job_id, state in progress.items() if state.status == "failed"]
+    if failed:
+        print(f"{len(failed)} curricula failed; rerun the same command to retry them.")
+        sys.exit(1)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: main.py <command> [<args>]")
         sys.exit(1)
 
     command = sys.argv[1]
-    if command == "run":
+    if command in ("profile_startup", "--profile-startup"):
+        profile_startup()
+    elif command == "run":
         run()
+    elif command == "batch":
+        batch()
     elif command == "train":
         train()
     elif command == "replay":
         replay()
+    elif command == "resume":
+        resume()
     elif command == "test":
         test()
     else:
@@ -0,0 +1,254 @@
+"""Parallel per-session research for Stage 2.
+
+The ``research_course_content`` task asks a single agent to research every
+module and session in turn. This module splits the approved outline into
+per-session research units, runs them concurrently through the deep research
+tool with a bounded concurrency limit, and merges the reports into one
+``TaskOutput`` that downstream tasks receive as context.
+"""
+
+import asyncio
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+import yaml
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel, Field
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import (
+    DEFAULT_RESEARCH_CONFIG_PATH,
+    RESEARCH_SKIPPED_PREFIX,
+    DeepResearchTool,
+    close_research_http_clients
+)
+
+logger = logging.getLogger(__name__)
+
+# Matches outline lines such as "## Module 2: Data", "- **Session 3:** Intro" or "Week 1 - Basics"
+STRUCTURE_PATTERN = re.compile(
+    r"^\s*(?:#{1,6}\s*|[-*+]\s+|\d+\.\s+)?[*_]*\s*(module|week|session)\s+(\d+)\b[*_]*\s*[:.\-–—)]?\s*(.*)$",
+    re.IGNORECASE,
+)
+DETAIL_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+(.+)$")
+
+RESEARCH_FAILED_PREFIX = "Deep research failed"
+
+
+class ResearchUnit(BaseModel):
+    """One independently researchable piece of the outline."""
+    module: Optional[str] = Field(default=None, description="Module number")
+    module_title: str = Field(default="", description="Module title")
+    week: Optional[str] = Field(default=None, description="Week number")
+    session: Optional[str] = Field(default=None, description="Session number")
+    title: str = Field(..., description="Session (or module) title")
+    details: List[str] = Field(default_factory=list, description="Topics listed under the session")
+
+    @property
+    def label(self) -> str:
+        """Human readable location of the unit in the course."""
+        parts = []
+        if self.module:
+            parts.append(f"Module {self.module}")
+        if self.week:
+            parts.append(f"Week {self.week}")
+        if self.session:
+            parts.append(f"Session {self.session}")
+        return " / ".join(parts) or "Course"
+
+
+class FanoutSettings(BaseModel):
+    """Settings for the research fan-out, read from research_config.yaml."""
+    enabled: bool = True
+    research_mode: str = "quick"
+    max_concurrency: int = 4
+    max_units: int = 60
+    max_sources: int = 10
+
+
+def load_fanout_settings(config_path: Optional[str] = None) -> FanoutSettings:
+    """Load the ``session_research`` section of research_config.yaml."""
+    path = config_path or str(DEFAULT_RESEARCH_CONFIG_PATH)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except OSError as e:
+        logger.warning(f"Could not read research config at {path}: {e}")
+        config = {}
+    return FanoutSettings(**(config.get("session_research") or {}))
+
+
+def _clean_title(text: str) -> str:
+    return text.strip().strip("*_#:").strip()
+
+
+def parse_outline_units(outline: str) -> List[ResearchUnit]:
+    """Split a markdown curriculum outline into per-session research units.
+
+    Sessions are detected from "Module N", "Week N" and "Session N" markers in
+    headings, bullets or bold text. Bullets directly under a session become its
+    details. If the outline names modules but no sessions, one unit per module
+    is returned instead.
+
+    Args:
+        outline: Raw markdown outline from Stage 1
+
+    Returns:
+        Research units in outline order
+    """
+    sessions: List[ResearchUnit] = []
+    modules: List[ResearchUnit] = []
+    module_num: Optional[str] = None
+    module_title = ""
+    week_num: Optional[str] = None
+    current: Optional[ResearchUnit] = None
+
+    for line in outline.splitlines():
+        match = STRUCTURE_PATTERN.match(line)
+        if match:
+            kind, number, title = match.group(1).lower(), match.group(2), _clean_title(match.group(3))
+            if kind == "module":
+                module_num, module_title, week_num = number, title, None
+                current = ResearchUnit(module=number, module_title=title, title=title or f"Module {number}")
+                modules.append(current)
+            elif kind == "week":
+                week_num = number
+                current = None
+            else:
+                current = ResearchUnit(
+                    module=module_num,
+                    module_title=module_title,
+                    week=week_num,
+                    session=number,
+                    title=title or f"Session {number}",
+                )
+                sessions.append(current)
+            continue
+
+        detail = DETAIL_PATTERN.match(line)
+        if detail and current is not None and len(current.details) < 8:
+            current.details.append(_clean_title(detail.group(1)))
+
+    return sessions or modules
+
+
+def build_unit_query(unit: ResearchUnit, topic: str) -> str:
+    """Build the deep research question for one unit."""
+    query = f"{topic}: {unit.title}"
+    if unit.module_title and unit.module_title != unit.title:
+        query += f" (part of the module '{unit.module_title}')"
+    if unit.details:
+        query += ". Cover: " + "; ".join(unit.details)
+    return query
+
+
+async def research_units(
+    units: List[ResearchUnit],
+    tool: DeepResearchTool,
+    topic: str,
+    audience: Optional[str] = None,
+    research_mode: str = "quick",
+    max_sources: int = 10,
+    max_concurrency: int = 4,
+) -> List[str]:
+    """Research every unit concurrently, at most ``max_concurrency`` at a time.
+
+    The HTTP clients pooled for the research are closed once every unit is
+    done, so the caller's event loop can shut down cleanly.
+
+    Returns:
+        One report per unit, in the same order as ``units``
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def research(unit: ResearchUnit) -> str:
+        async with semaphore:
+            logger.info(f"Researching {unit.label}: {unit.title}")
+            return await tool.arun(
+                build_unit_query(unit, topic),
+                research_mode=research_mode,
+                max_sources=max_sources,
+                target_audience=audience,
+            )
+
+    try:
+        return await asyncio.gather(*(research(unit) for unit in units))
+    finally:
+        await close_research_http_clients()
+
+
+def merge_unit_reports(topic: str, units: List[ResearchUnit], reports: List[str]) -> str:
+    """Merge per-unit reports into one research document."""
+    sections = [f"# Research for {topic}\n"]
+    for unit, report in zip(units, reports):
+        sections.append(f"## {unit.label}: {unit.title}\n")
+        sections.append(report.strip())
+        sections.append("")
+    return "\n".join(sections)
+
+
+def run_research_fanout(
+    inputs: Dict[str, Any],
+    outline: str,
+    description: str = "",
+    settings: Optional[FanoutSettings] = None,
+    tool: Optional[DeepResearchTool] = None,
+    units: Optional[List[ResearchUnit]] = None,
+) -> Optional[TaskOutput]:
+    """Research the approved outline session by session, in parallel.
+
+    Args:
+        inputs: Curriculum inputs (topic, audience_level, ...)
+        outline: Raw outline text approved in Stage 1
+        description: Description of the research task the output stands in for
+        settings: Fan-out settings, loaded from research_config.yaml by default
+        tool: Deep research tool to use; a new one is created by default
+        units: Units to research, parsed from the outline by default
+
+    Returns:
+        Merged research as the output of ``research_course_content``, or None
+        when the fan-out is disabled, unavailable or every unit failed, in
+        which case the research agent should run as usual.
+    """
+    settings = settings or load_fanout_settings()
+    if not settings.enabled:
+        return None
+
+    if not (os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY")):
+        logger.info("Skipping research fan-out: no LLM provider API key configured")
+        return None
+
+    units = units if units is not None else parse_outline_units(outline)
+    if not units:
+        logger.info("Skipping research fan-out: no modules or sessions found in the outline")
+        return None
+    if len(units) > settings.max_units:
+        logger.warning(f"Outline has {len(units)} research units, researching the first {settings.max_units}")
+        units = units[:settings.max_units]
+
+    logger.info(f"Researching {len(units)} sessions in parallel (up to {settings.max_concurrency} at a time)")
+    reports = asyncio.run(research_units(
+        units,
+        tool or DeepResearchTool(),
+        topic=inputs.get("topic", ""),
+        audience=inputs.get("audience_level"),
+        research_mode=settings.research_mode,
+        max_sources=settings.max_sources,
+        max_concurrency=settings.max_concurrency,
+    ))
+
+    # Units skipped by the cost budget have no findings either
+    failed = sum(1 for report in reports if report.startswith((RESEARCH_FAILED_PREFIX, RESEARCH_SKIPPED_PREFIX)))
+    if failed == len(reports):
+        logger.warning("Every research unit failed or was skipped; falling back to the research agent")
+        return None
+    if failed:
+        logger.warning(f"{failed} of {len(reports)} research units failed or were skipped")
+
+    return TaskOutput(
+        name="research_course_content",
+        description=description or f"Per-session research for {inputs.get('topic', '')}",
+        raw=merge_unit_reports(inputs.get("topic", ""), units, reports),
+        agent="Subject Matter Researcher",
+    )
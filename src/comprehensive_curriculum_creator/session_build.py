@@ -0,0 +1,248 @@
+"""Incremental regeneration of course sessions.
+
+Revising one module of an approved outline should not regenerate a 20-session
+course from scratch. Every session's materials are recorded in a build
+manifest (``output/<Topic>/.session_build.json``) together with a fingerprint
+of the inputs that produced them:
+
+- the session's fragment of the outline (title, module and listed topics)
+- the research query for the session and the research settings
+- the version of the prompt templates that generate session materials
+- the course-wide inputs (audience, session length, ...)
+
+On a rerun, sessions whose fingerprint is unchanged and whose files are still
+on disk are skipped. Only stale sessions are researched, and the content tasks
+are told to leave every other session alone.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+from crewai import Task
+from pydantic import BaseModel, Field
+
+from comprehensive_curriculum_creator.research_fanout import (
+    FanoutSettings,
+    ResearchUnit,
+    build_unit_query,
+    load_fanout_settings,
+)
+from comprehensive_curriculum_creator.tools.custom_tool import curriculum_base_path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".session_build.json"
+TASKS_CONFIG_PATH = Path(__file__).parent / "config" / "tasks.yaml"
+
+# Tasks whose prompts shape the materials of each session
+SESSION_TASKS = ("research_course_content", "develop_learning_materials", "organize_course_structure")
+# Tasks that are told which sessions to regenerate
+SCOPED_TASKS = ("develop_learning_materials", "organize_course_structure")
+SESSION_FILES = ("slides_presentation.md", "course_material.md", "homework_questions.md", "homework_keys.md")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def prompt_template_version(config_path: Path = TASKS_CONFIG_PATH) -> str:
+    """Hash of the task templates that generate session materials."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return _digest({name: config.get(name) for name in SESSION_TASKS})[:16]
+
+
+class SessionRecord(BaseModel):
+    """Build manifest entry of one generated session."""
+    fingerprint: str = Field(..., description="Hash of every input that produced the session")
+    components: Dict[str, str] = Field(default_factory=dict, description="Hash of each input, to explain rebuilds")
+    directory: str = Field(..., description="Session folder the materials were written to")
+    built_at: str = Field(..., description="UTC time the session was recorded")
+
+
+class BuildPlan(BaseModel):
+    """Which sessions of the outline need regenerating."""
+    stale: List[ResearchUnit] = Field(default_factory=list, description="Sessions to regenerate")
+    fresh: List[ResearchUnit] = Field(default_factory=list, description="Sessions that are up to date")
+    reasons: Dict[str, str] = Field(default_factory=dict, description="Why each stale session is rebuilt")
+    components: Dict[str, Dict[str, str]] = Field(default_factory=dict, description="Input hashes per session")
+
+    @property
+    def incremental(self) -> bool:
+        """Whether only part of the course is regenerated."""
+        return bool(self.stale) and bool(self.fresh)
+
+    @property
+    def up_to_date(self) -> bool:
+        """Whether there is nothing to regenerate."""
+        return not self.stale and bool(self.fresh)
+
+
+class SessionBuild:
+    """Build manifest of the sessions generated for one curriculum.
+
+    Args:
+        inputs: Curriculum inputs; changing any of them rebuilds every session
+        output_dir: Directory the curriculum folders are created in
+        settings: Research fan-out settings, loaded from research_config.yaml by default
+        prompt_version: Template version, computed from tasks.yaml by default
+    """
+
+    def __init__(
+        self,
+        inputs: Dict[str, Any],
+        output_dir: str = "./output",
+        settings: Optional[FanoutSettings] = None,
+        prompt_version: Optional[str] = None,
+    ):
+        self.inputs = inputs
+        self.topic = inputs.get("topic", "")
+        self.base_path = curriculum_base_path(self.topic, output_dir)
+        self.manifest_path = self.base_path / MANIFEST_NAME
+        self.settings = settings or load_fanout_settings()
+        self.prompt_version = prompt_version or prompt_template_version()
+
+    def load(self) -> Dict[str, SessionRecord]:
+        """Recorded sessions keyed by their outline label."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {key: SessionRecord(**record) for key, record in data.get("sessions", {}).items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable build manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _save(self, records: Dict[str, SessionRecord]) -> None:
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        data = {"sessions": {key: record.model_dump() for key, record in records.items()}}
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.base_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def input_components(self, unit: ResearchUnit) -> Dict[str, str]:
+        """Hash of each input that produces a session's materials."""
+        course_inputs = {key: value for key, value in self.inputs.items() if key != "revision_notes"}
+        research = {
+            "query": build_unit_query(unit, self.topic),
+            "research_mode": self.settings.research_mode,
+            "max_sources": self.settings.max_sources,
+        }
+        return {
+            "outline": _digest(unit.model_dump()),
+            "research": _digest(research),
+            "prompts": self.prompt_version,
+            "inputs": _digest(course_inputs),
+        }
+
+    def find_session_dir(self, unit: ResearchUnit) -> Optional[Path]:
+        """Locate the folder a session's materials were written to."""
+        if unit.session is None or not self.base_path.exists():
+            return None
+        candidates = [path for path in self.base_path.rglob(f"Session_{unit.session}") if path.is_dir()]
+        if unit.week is not None:
+            candidates = [path for path in candidates if f"Week_{unit.week}" in path.parts] or candidates
+        if len(candidates) > 1 and unit.module is not None:
+            module_markers = {f"Module_{unit.module}", f"Module_{unit.module_title.replace(' ', '_')}"}
+            candidates = [path for path in candidates if module_markers & set(path.parts)] or candidates
+        return candidates[0] if candidates else None
+
+    @staticmethod
+    def _has_materials(directory: Path) -> bool:
+        names = {path.name for path in directory.rglob("*") if path.is_file()}
+        return all(name in names for name in SESSION_FILES)
+
+    def plan(self, units: List[ResearchUnit]) -> BuildPlan:
+        """Compare the outline's sessions with the build manifest.
+
+        A session is stale when it was never built, any of its inputs changed,
+        or its materials are missing from disk. Outlines without session
+        markers cannot be tracked, so every unit is stale.
+        """
+        plan = BuildPlan()
+        if any(unit.session is None for unit in units):
+            plan.stale = list(units)
+            plan.reasons = {unit.label: "outline has no sessions to track" for unit in units}
+            return plan
+
+        records = self.load()
+        for unit in units:
+            components = self.input_components(unit)
+            plan.components[unit.label] = components
+            record = records.get(unit.label)
+
+            if record is None:
+                reason = "not built yet"
+            elif record.fingerprint != _digest(components):
+                changed = [name for name, value in components.items() if record.components.get(name) != value]
+                reason = f"{', '.join(changed) or 'inputs'} changed"
+            elif not Path(record.directory).is_dir() or not self._has_materials(Path(record.directory)):
+                reason = "materials missing"
+            else:
+                plan.fresh.append(unit)
+                continue
+
+            plan.stale.append(unit)
+            plan.reasons[unit.label] = reason
+        return plan
+
+    def record(self, plan: BuildPlan) -> int:
+        """Record the fingerprints of regenerated sessions whose materials are on disk.
+
+        Sessions that are no longer in the outline are dropped from the manifest.
+
+        Returns:
+            Number of sessions recorded
+        """
+        if not plan.components:
+            return 0
+        records = {key: record for key, record in self.load().items() if key in plan.components}
+        built_at = datetime.now(timezone.utc).isoformat()
+        recorded = 0
+
+        for unit in plan.stale:
+            directory = self.find_session_dir(unit)
+            if directory is None or not self._has_materials(directory):
+                logger.warning(f"No materials found for {unit.label}; it will be regenerated next time")
+                records.pop(unit.label, None)
+                continue
+            components = plan.components[unit.label]
+            records[unit.label] = SessionRecord(
+                fingerprint=_digest(components),
+                components=components,
+                directory=str(directory),
+                built_at=built_at,
+            )
+            recorded += 1
+
+        self._save(records)
+        return recorded
+
+
+def scope_tasks_to_sessions(tasks: List[Task], plan: BuildPlan) -> None:
+    """Tell the content tasks to regenerate only the stale sessions.
+
+    Must be called before the crew is kicked off, while task descriptions
+    are still templates.
+    """
+    # Braces would be taken for template variables when inputs are interpolated
+    stale = "\n".join(
+        f"- {unit.label}: {unit.title}".replace("{", "(").replace("}", ")") for unit in plan.stale
+    )
+    note = (
+        "\n\n**INCREMENTAL UPDATE:** Materials for the other "
+        f"{len(plan.fresh)} sessions are up to date in the course folder. Do not rewrite them. "
+        f"Regenerate ONLY these sessions, then recreate the zip file:\n{stale}"
+    )
+    for task in tasks:
+        if task.name in SCOPED_TASKS:
+            task.description += note
@@ -0,0 +1,209 @@
+"""Cold-start profiling for the crew and the deep research graph.
+
+Each target module is imported in a fresh interpreter with ``-X importtime``
+so the report reflects a real cold start: total wall time, the slowest
+modules by self and cumulative import time, and the time spent compiling
+LangGraph ``StateGraph``s while the target was imported.
+
+Budgets (in seconds) keep cold start predictable for autoscaled workers.
+Defaults are in ``DEFAULT_BUDGETS`` and can be overridden per target with
+``STARTUP_BUDGET_<TARGET>`` environment variables, e.g.
+``STARTUP_BUDGET_CREW=8``.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+STARTUP_TARGETS = {
+    "crew": "comprehensive_curriculum_creator.crew",
+    "deep_researcher": "open_deep_research.deep_researcher",
+}
+
+DEFAULT_BUDGETS = {
+    "crew": 15.0,
+    "deep_researcher": 10.0,
+}
+
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Runs in the child interpreter: times the import, and every StateGraph.compile
+# call during it. The timer starts before langgraph is imported so that it counts.
+_PROBE = """
+import json, time
+start = time.perf_counter()
+compiles = []
+try:
+    from langgraph.graph import StateGraph
+    _compile = StateGraph.compile
+    def _timed_compile(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return _compile(self, *args, **kwargs)
+        finally:
+            compiles.append({{"graph": self.state_schema.__name__, "seconds": time.perf_counter() - start}})
+    StateGraph.compile = _timed_compile
+except ImportError:
+    pass
+import {module}
+total = time.perf_counter() - start
+print("STARTUP_PROFILE " + json.dumps({{"seconds": total, "compiles": compiles}}))
+"""
+
+
+class ImportTiming(BaseModel):
+    """Import time of one module, as reported by ``-X importtime``."""
+    module: str = Field(..., description="Fully qualified module name")
+    self_seconds: float = Field(..., description="Time spent in the module body itself")
+    cumulative_seconds: float = Field(..., description="Time including nested imports")
+    depth: int = Field(default=0, description="Nesting level in the import tree")
+
+
+class GraphCompileTiming(BaseModel):
+    """Time spent compiling one StateGraph."""
+    graph: str = Field(..., description="Name of the graph's state schema")
+    seconds: float = Field(..., description="Compile time")
+
+
+class StartupProfile(BaseModel):
+    """Cold-start profile of one target."""
+    target: str
+    module: str
+    total_seconds: float = Field(..., description="Wall time of the import in the child interpreter")
+    imports: List[ImportTiming] = Field(default_factory=list)
+    graph_compiles: List[GraphCompileTiming] = Field(default_factory=list)
+
+    @property
+    def graph_compile_seconds(self) -> float:
+        """Total time spent compiling graphs."""
+        return sum(timing.seconds for timing in self.graph_compiles)
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the stderr of ``python -X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(
+                module=module,
+                self_seconds=int(self_us) / 1e6,
+                cumulative_seconds=int(cumulative_us) / 1e6,
+                depth=max(len(indent) - 1, 0) // 2,
+            ))
+    return timings
+
+
+def get_budget(target: str) -> float:
+    """Startup budget in seconds for a target, honouring the environment override."""
+    override = os.getenv(f"STARTUP_BUDGET_{target.upper()}")
+    return float(override) if override else DEFAULT_BUDGETS[target]
+
+
+def profile_import(target: str, timeout: int = 300) -> StartupProfile:
+    """Import a target in a fresh interpreter and profile it.
+
+    Args:
+        target: Key of ``STARTUP_TARGETS``
+        timeout: Seconds before the child interpreter is killed
+
+    Returns:
+        Profile with total time, per-module import times and graph compile times
+
+    Raises:
+        RuntimeError: If the import fails in the child interpreter
+    """
+    module = STARTUP_TARGETS[target]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(DEFAULT_RESEARCH_SRC_PATH), env.get("PYTHONPATH")]))
+    env.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=timeout,
+    )
+    marker = next((line for line in result.stdout.splitlines() if line.startswith("STARTUP_PROFILE ")), None)
+    if result.returncode != 0 or marker is None:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output"
+        raise RuntimeError(f"Importing {module} failed: {error}")
+
+    probe = json.loads(marker[len("STARTUP_PROFILE "):])
+    return StartupProfile(
+        target=target,
+        module=module,
+        total_seconds=probe["seconds"],
+        imports=parse_importtime(result.stderr),
+        graph_compiles=[GraphCompileTiming(**timing) for timing in probe["compiles"]],
+    )
+
+
+def package_totals(profile: StartupProfile) -> List[Tuple[str, float]]:
+    """Import time per top-level package, slowest first."""
+    totals: Dict[str, float] = {}
+    for timing in profile.imports:
+        package = timing.module.split(".")[0]
+        totals[package] = totals.get(package, 0.0) + timing.self_seconds
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def format_report(profile: StartupProfile, top: int = 15, budget: Optional[float] = None) -> str:
+    """Render a profile as a plain-text report."""
+    lines = [f"=== {profile.target} ({profile.module}) ==="]
+    status = ""
+    if budget is not None:
+        status = "  [OK]" if profile.total_seconds <= budget else "  [OVER BUDGET]"
+        lines.append(f"Total import time: {profile.total_seconds:.2f}s (budget {budget:.2f}s){status}")
+    else:
+        lines.append(f"Total import time: {profile.total_seconds:.2f}s")
+
+    if profile.graph_compiles:
+        lines.append(f"Graph compilation: {profile.graph_compile_seconds:.2f}s")
+        for timing in profile.graph_compiles:
+            lines.append(f"  {timing.seconds:8.3f}s  {timing.graph}")
+
+    lines.append("Slowest packages (sum of module self time):")
+    for package, seconds in package_totals(profile)[:top]:
+        lines.append(f"  {seconds:8.3f}s  {package}")
+
+    lines.append("Slowest modules (self):")
+    for timing in sorted(profile.imports, key=lambda t: -t.self_seconds)[:top]:
+        lines.append(f"  {timing.self_seconds:8.3f}s  {timing.module}")
+    return "\n".join(lines)
+
+
+def profile_startup(targets: Optional[List[str]] = None, top: int = 15) -> Dict[str, StartupProfile]:
+    """Profile each target, print a report and return the profiles.
+
+    Targets that could not be profiled are reported and left out of the result.
+
+    Raises:
+        ValueError: If a target is not in ``STARTUP_TARGETS``
+    """
+    targets = targets or list(STARTUP_TARGETS)
+    unknown = [target for target in targets if target not in STARTUP_TARGETS]
+    if unknown:
+        raise ValueError(
+            f"Unknown startup target(s): {', '.join(unknown)}; choose from: {', '.join(STARTUP_TARGETS)}"
+        )
+
+    profiles = {}
+    for target in targets:
+        try:
+            profiles[target] = profile_import(target)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"=== {target} ===\nCould not profile: {e}\n")
+            continue
+        print(format_report(profiles[target], top=top, budget=get_budget(target)))
+        print()
+    return profiles
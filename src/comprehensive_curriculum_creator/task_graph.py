@@ -0,0 +1,108 @@
+"""Dependency-aware scheduling of crew tasks.
+
+The crew runs with ``Process.sequential``, but several tasks only depend on
+earlier ones through their ``context:`` entries in tasks.yaml. For example,
+``research_course_content`` and ``design_project_based_activities`` both only
+need ``continue_course_development``. This module groups tasks into
+dependency levels and marks the tasks of a level ``async_execution`` so
+CrewAI runs them concurrently and joins them before the next synchronous
+task. Wall-clock time then follows the critical path of the task graph
+instead of the sum of all tasks.
+"""
+
+import logging
+from typing import Dict, List
+
+from crewai import Task
+
+logger = logging.getLogger(__name__)
+
+
+def task_levels(tasks: List[Task]) -> List[List[Task]]:
+    """Group tasks into dependency levels.
+
+    A task's level is one more than the highest level of the tasks in its
+    context. Context tasks that are not part of ``tasks`` (for example ones
+    already completed) count as satisfied. Tasks keep their relative order
+    within a level.
+
+    Args:
+        tasks: Crew tasks in execution order
+
+    Returns:
+        Lists of tasks, one per level, in execution order
+
+    Raises:
+        ValueError: If a task depends on a task that comes after it
+    """
+    positions = {id(task): i for i, task in enumerate(tasks)}
+    level_of: Dict[int, int] = {}
+
+    for task in tasks:
+        level = 0
+        for dependency in task.context if isinstance(task.context, list) else []:
+            if id(dependency) not in positions:
+                continue
+            if id(dependency) not in level_of:
+                raise ValueError(
+                    f"Task '{task.name}' depends on '{dependency.name}', which runs after it"
+                )
+            level = max(level, level_of[id(dependency)] + 1)
+        level_of[id(task)] = level
+
+    levels: List[List[Task]] = [[] for _ in range(max(level_of.values(), default=-1) + 1)]
+    for task in tasks:
+        levels[level_of[id(task)]].append(task)
+    return levels
+
+
+def _can_run_concurrently(level: List[Task]) -> bool:
+    # Agents keep per-execution state, so one agent must not run two tasks at once
+    roles = [task.agent.role for task in level if task.agent is not None]
+    return len(level) > 1 and len(roles) == len(set(roles)) == len(level)
+
+
+def schedule_parallel(tasks: List[Task]) -> List[Task]:
+    """Order tasks by dependency level and run independent ones concurrently.
+
+    Every task of a level with several independent tasks is marked
+    ``async_execution``; CrewAI joins them when it reaches the next
+    synchronous task. Two rules keep the schedule valid:
+
+    - The first task of a level that follows concurrent tasks stays
+      synchronous, so it joins them before anything that needs their output
+      starts.
+    - The last task of the crew stays synchronous, since a crew may not end
+      with several asynchronous tasks.
+
+    Args:
+        tasks: Crew tasks in execution order
+
+    Returns:
+        The same tasks, reordered by level, with ``async_execution`` set
+    """
+    levels = task_levels(tasks)
+    ordered: List[Task] = []
+    previous_concurrent = False
+
+    for level in levels:
+        concurrent = _can_run_concurrently(level)
+        for i, task in enumerate(level):
+            task.async_execution = concurrent and not (i == 0 and previous_concurrent)
+            ordered.append(task)
+        previous_concurrent = concurrent
+
+    if ordered:
+        ordered[-1].async_execution = False
+
+    parallel = [task.name for task in ordered if task.async_execution]
+    if parallel:
+        logger.info(f"Running independent tasks concurrently: {', '.join(parallel)}")
+    return ordered
+
+
+def schedule_sequential(tasks: List[Task]) -> List[Task]:
+    """Run every task synchronously, one after another."""
+    for task in tasks:
+        task.async_execution = False
+    return tasks
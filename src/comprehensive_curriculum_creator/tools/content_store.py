@@ -0,0 +1,256 @@
+"""Content-addressed blob store for generated course files.
+
+Courses repeat a lot of boilerplate (homework templates, rubrics, shared
+slides) across sessions. Content written through the store is saved once
+under ``output/.store/<sha256[:2]>/<sha256>`` and course files are made from
+their blob in one of three ways:
+
+- ``reflink`` (default): a copy-on-write clone where the filesystem supports
+  it (Btrfs, XFS, APFS), otherwise a plain copy. Course files are independent
+  and writable; clones share disk blocks until edited.
+- ``copy``: always a plain copy.
+- ``hardlink``: the course file *is* the blob, so disk usage follows unique
+  content exactly. Blobs are read-only, but an in-place edit (e.g. by root)
+  still changes every file sharing the content, so only use it for output
+  that is never edited by hand.
+
+Blob mtimes carry a stamp derived from the digest; a hardlinked file whose
+mtime no longer matches was edited in place and is not trusted to hold its
+blob's content any more. Cloned and copied files get the same stamp, and
+their inode is appended to an index in the store root, so ``digest_of``
+knows their content without reading it in every mode.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: clones are not attempted
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = "./output/.store"
+STORE_PATH_ENV = "CONTENT_STORE_PATH"
+LINK_MODES = ("reflink", "copy", "hardlink")
+FILE_INDEX_NAME = "files.idx"
+
+# Linux FICLONE ioctl: clone a whole file on copy-on-write filesystems
+_FICLONE = 0x40049409
+
+
+def _stamp(digest: str) -> int:
+    """Nanosecond part of a blob's mtime, so in-place edits are detectable."""
+    return int(digest[:8], 16) % 1_000_000_000
+
+
+def _stamped_mtime_ns(path, digest: str) -> int:
+    """Set the nanosecond part of a file's mtime to the digest's stamp and return the mtime."""
+    mtime_ns = os.stat(path).st_mtime_ns // 1_000_000_000 * 1_000_000_000 + _stamp(digest)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return mtime_ns
+
+
+def _clone_or_copy(source: Path, dest: Path) -> None:
+    """Clone ``source`` to a new file ``dest``, copying where cloning is unsupported."""
+    with open(source, "rb") as src, open(dest, "xb") as dst:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return
+            except OSError:
+                pass
+        shutil.copyfileobj(src, dst)
+
+
+def resolve_store_path(path: Optional[str] = DEFAULT_STORE_PATH) -> Optional[str]:
+    """Absolute content store path, or None when the store is disabled.
+
+    ``CONTENT_STORE_PATH`` overrides ``path``; set it to an empty string to
+    write plain files.
+    """
+    path = os.environ.get(STORE_PATH_ENV, path)
+    return os.path.abspath(os.path.expanduser(path)) if path else None
+
+
+class ContentStore:
+    """Deduplicating store of file contents, addressed by SHA-256.
+
+    Args:
+        root: Directory holding the blobs
+        link_mode: How course files are made from blobs: 'reflink', 'copy'
+            or 'hardlink'
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE_PATH, link_mode: str = "reflink"):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of: {', '.join(LINK_MODES)}")
+        self.root = Path(root)
+        self.link_mode = link_mode
+        self._inode_index: Optional[Dict[Tuple[int, int], str]] = None
+        self._file_index: Dict[Tuple[int, int], Tuple[int, str]] = {}
+        self._file_index_offset = 0
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> Path:
+        """Where the blob for a digest is stored."""
+        return self.root / digest[:2] / digest
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store content and return its digest; existing blobs are not rewritten."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            _stamped_mtime_ns(tmp_path, digest)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._remember(path, digest)
+        return digest
+
+    def materialize(self, digest: str, dest: Path) -> None:
+        """Atomically make ``dest`` a clone, copy or link of a stored blob."""
+        blob = self.blob_path(digest)
+        dest = Path(dest)
+        if dest.exists() and self.link_mode == "hardlink" and os.path.samefile(blob, dest):
+            return
+
+        tmp_path = dest.parent / f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            linked = False
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(blob, tmp_path)
+                    linked = True
+                except OSError as e:
+                    logger.debug(f"Hardlinking {blob} failed ({e}); copying instead")
+                    shutil.copyfile(blob, tmp_path)
+            elif self.link_mode == "reflink":
+                _clone_or_copy(blob, tmp_path)
+            else:
+                shutil.copyfile(blob, tmp_path)
+            if not linked:
+                # Record the file's own inode before it is visible under ``dest``
+                _stamped_mtime_ns(tmp_path, digest)
+                self._record_file(tmp_path, digest)
+            os.replace(tmp_path, dest)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def write_text(self, dest: Path, content: str, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Write text to ``dest`` through the store and return its digest."""
+        digest = self.put_bytes(content.encode(encoding, errors))
+        self.materialize(digest, dest)
+        return digest
+
+    def _remember(self, blob: Path, digest: str) -> None:
+        with self._lock:
+            if self._inode_index is not None:
+                blob_stat = blob.stat()
+                self._inode_index[(blob_stat.st_dev, blob_stat.st_ino)] = digest
+
+    def _record_file(self, path: Path, digest: str) -> None:
+        """Append a cloned or copied file's inode to the file index shared by every process."""
+        file_stat = os.stat(path)
+        line = f"{file_stat.st_dev} {file_stat.st_ino} {file_stat.st_size} {digest}\n".encode()
+        # One small O_APPEND write per entry, so concurrent writers never interleave lines
+        fd = os.open(self.root / FILE_INDEX_NAME, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def _refresh_file_index(self) -> None:
+        """Read entries appended to the file index since the last read; later entries win."""
+        try:
+            with open(self.root / FILE_INDEX_NAME, "rb") as f:
+                f.seek(self._file_index_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        complete = data.rfind(b"\n") + 1
+        self._file_index_offset += complete
+        for line in data[:complete].splitlines():
+            try:
+                dev, ino, size, digest = line.decode().split()
+                self._file_index[(int(dev), int(ino))] = (int(size), digest)
+            except ValueError:
+                continue
+
+    def _build_inode_index(self) -> Dict[Tuple[int, int], str]:
+        index = {}
+        if self.root.exists():
+            for shard in os.scandir(self.root):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        entry_stat = entry.stat()
+                        index[(entry_stat.st_dev, entry_stat.st_ino)] = entry.name
+        return index
+
+    def digest_of(self, path: Path) -> Optional[str]:
+        """Digest of a file made from a blob, without reading it.
+
+        Returns:
+            The blob's digest, or None if the file was not written through the
+            store or was edited in place since it was stored
+        """
+        file_stat = os.stat(path)
+        key = (file_stat.st_dev, file_stat.st_ino)
+        with self._lock:
+            if file_stat.st_nlink >= 2:
+                if self._inode_index is None:
+                    self._inode_index = self._build_inode_index()
+                digest = self._inode_index.get(key)
+            else:
+                self._refresh_file_index()
+                size, digest = self._file_index.get(key, (None, None))
+                if size is not None and size != file_stat.st_size:
+                    digest = None
+        if digest is not None and file_stat.st_mtime_ns % 1_000_000_000 != _stamp(digest):
+            logger.debug(f"{path} was modified in place; not trusting its stored digest")
+            return None
+        return digest
+
+    def prune(self) -> int:
+        """Delete blobs no course file links to any more.
+
+        Only meaningful in hardlink mode, where a blob's link count shows
+        whether it is still referenced.
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        if self.link_mode != "hardlink" or not self.root.exists():
+            return removed
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file() and entry.stat().st_nlink == 1:
+                    os.unlink(entry.path)
+                    removed += 1
+        with self._lock:
+            self._inode_index = None
+        return removed
@@ -1,24 +1,82 @@
+import json
 import os
-import zipfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Type, List
+from typing import Type, List, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from comprehensive_curriculum_creator.instrumentation import timed_tool
+from comprehensive_curriculum_creator.tools.content_store import ContentStore
+from comprehensive_curriculum_creator.tools.zip_packager import COMPRESSION_MODES, ZipPackager
+
+
+def _safe_name(name: str) -> str:
+    """Keep only filesystem-safe characters of a name"""
+    return "".join(c for c in str(name) if c.isalnum() or c in (' ', '-', '_')).rstrip()
+
+
+def curriculum_base_path(topic: str, output_dir: str = "./output") -> Path:
+    """Folder the curriculum for a topic is organized in"""
+    safe_topic = _safe_name(topic) or "Curriculum"
+    return Path(output_dir) / safe_topic.replace(' ', '_')
+
+
+def plan_curriculum_directories(base_path: Path, content_structure: dict) -> List[Path]:
+    """Compute every directory of the curriculum folder structure in one pass.
+
+    Returns:
+        Deduplicated directories in creation order (parents before children)
+    """
+    plan = {base_path: None, base_path / "Course_Overview_and_Guide": None}
+
+    for module_index, (module_name, module_data) in enumerate(content_structure.items(), start=1):
+        safe_module_name = _safe_name(module_name) or f"Module_{module_index}"
+        module_path = base_path / f"Module_{safe_module_name.replace(' ', '_')}"
+        plan[module_path] = None
+
+        if not isinstance(module_data, dict):
+            continue
+
+        for week_num, week_data in module_data.items():
+            week_path = module_path / f"Week_{week_num}"
+            plan[week_path] = None
+
+            if not isinstance(week_data, dict):
+                continue
+
+            for session_num in week_data:
+                session_path = week_path / f"Session_{session_num}"
+                plan[session_path] = None
+                plan[session_path / "Classwork"] = None
+                plan[session_path / "Homework"] = None
+
+    return list(plan)
+
+
+def _leaf_directories(directories: List[Path]) -> List[Path]:
+    """Directories that are not a parent of another planned directory"""
+    parents = {directory.parent for directory in directories}
+    return [directory for directory in directories if directory not in parents]
+
 
 class FileOrganizerInput(BaseModel):
     """Input schema for FileOrganizerTool."""
     topic: str = Field(..., description="The main topic of the curriculum")
     content_structure: dict = Field(..., description="Dictionary containing the curriculum structure with modules, weeks, and sessions")
+    dry_run: bool = Field(False, description="Only return the directory plan without creating anything")
 
 
 class FileOrganizerTool(BaseTool):
     name: str = "Curriculum File Organizer"
     description: str = "Organizes curriculum files into the specified folder structure: Topic/Module/Week/Session/Classwork & Homework folders"
     args_schema: Type[BaseModel] = FileOrganizerInput
+    max_workers: int = Field(default=8, description="Directories created in parallel")
 
-    def _run(self, topic: str, content_structure: dict) -> str:
-        """Creates the complete folder structure for the curriculum"""
+    @timed_tool
+    def _run(self, topic: str, content_structure: dict, dry_run: bool = False) -> str:
+        """Creates the complete folder structure for the curriculum and returns the plan as JSON"""
         try:
             if not topic or not isinstance(topic, str):
                 raise ValueError("Topic must be a non-empty string")
@@ -27,74 +85,34 @@ class FileOrganizerTool(BaseTool):
                 raise ValueError("Content structure must be a non-empty dictionary")
 
             # Sanitize topic name for filesystem
-            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            if not safe_topic:
-                safe_topic = "Curriculum"
-
-            base_path = Path(f"./output/{safe_topic.replace(' ', '_')}")
-
-            # Create base directory with error handling
-            try:
-                base_path.mkdir(parents=True, exist_ok=True)
-            except PermissionError:
-                return f"Permission denied: Cannot create directory at {base_path}"
-            except OSError as e:
-                return f"OS error creating base directory: {str(e)}"
-
-            # Create course overview folder
-            overview_path = base_path / "Course_Overview_and_Guide"
-            try:
-                overview_path.mkdir(exist_ok=True)
-            except OSError as e:
-                return f"Error creating overview directory: {str(e)}"
-
-            # Process each module
-            for module_name, module_data in content_structure.items():
-                try:
-                    safe_module_name = "".join(c for c in str(module_name) if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                    if not safe_module_name:
-                        safe_module_name = f"Module_{list(content_structure.keys()).index(module_name) + 1}"
-
-                    module_path = base_path / f"Module_{safe_module_name.replace(' ', '_')}"
-                    module_path.mkdir(exist_ok=True)
-
-                    # Validate module_data structure
-                    if not isinstance(module_data, dict):
-                        continue
-
-                    # Process each week
-                    for week_num, week_data in module_data.items():
+            base_path = curriculum_base_path(topic)
+            directories = plan_curriculum_directories(base_path, content_structure)
+
+            if dry_run:
+                message = f"Dry run: {len(directories)} directories planned for '{topic}' at {base_path}"
+            else:
+                # os.makedirs creates the parents of each leaf, so only leaves are submitted
+                with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+                    futures = {
+                        pool.submit(os.makedirs, leaf, exist_ok=True): leaf
+                        for leaf in _leaf_directories(directories)
+                    }
+                    for future, leaf in futures.items():
                         try:
-                            week_path = module_path / f"Week_{week_num}"
-                            week_path.mkdir(exist_ok=True)
-
-                            # Validate week_data structure
-                            if not isinstance(week_data, dict):
-                                continue
-
-                            # Process each session
-                            for session_num, session_data in week_data.items():
-                                try:
-                                    session_path = week_path / f"Session_{session_num}"
-                                    session_path.mkdir(exist_ok=True)
-
-                                    # Create Classwork and Homework folders
-                                    classwork_path = session_path / "Classwork"
-                                    homework_path = session_path / "Homework"
-
-                                    classwork_path.mkdir(exist_ok=True)
-                                    homework_path.mkdir(exist_ok=True)
-
-                                except OSError as e:
-                                    return f"Error creating session {session_num} in week {week_num}: {str(e)}"
-
+                            future.result()
+                        except PermissionError:
+                            return f"Permission denied: Cannot create directory at {leaf}"
                         except OSError as e:
-                            return f"Error creating week {week_num} in module {module_name}: {str(e)}"
-
-                except OSError as e:
-                    return f"Error creating module {module_name}: {str(e)}"
+                            return f"Error creating directory {leaf}: {str(e)}"
+                message = f"Successfully created curriculum folder structure for '{topic}' at {base_path}"
 
-            return f"Successfully created curriculum folder structure for '{topic}' at {base_path}"
+            return json.dumps({
+                "message": message,
+                "dry_run": dry_run,
+                "base_path": str(base_path),
+                "directory_count": len(directories),
+                "directories": [directory.as_posix() for directory in directories],
+            }, indent=2)
 
         except ValueError as e:
             return f"Validation error: {str(e)}"
@@ -106,14 +124,19 @@ class ZipCreatorInput(BaseModel):
     """Input schema for ZipCreatorTool."""
     source_path: str = Field(..., description="Path to the folder to be zipped")
     zip_name: str = Field(..., description="Name for the output zip file (without .zip extension)")
+    compression: str = Field("auto", description="Compression: auto, deflate, store or zstd")
+    incremental: bool = Field(True, description="Only recompress files changed since the last zip")
 
 
 class ZipCreatorTool(BaseTool):
     name: str = "Curriculum Zip Creator"
     description: str = "Creates a zip file from the specified curriculum folder for easy distribution"
     args_schema: Type[BaseModel] = ZipCreatorInput
+    max_workers: Optional[int] = Field(default=None, description="Compression threads (defaults to the CPU count, up to 8)")
+    content_store_path: Optional[str] = Field(default=None, description="Content store the course was written through, e.g. ./output/.store; None to disable")
 
-    def _run(self, source_path: str, zip_name: str) -> str:
+    @timed_tool
+    def _run(self, source_path: str, zip_name: str, compression: str = "auto", incremental: bool = True) -> str:
         """Creates a zip file from the source directory"""
         try:
             if not source_path or not isinstance(source_path, str):
@@ -144,29 +167,31 @@ class ZipCreatorTool(BaseTool):
             except OSError as e:
                 return f"Error creating output directory: {str(e)}"
 
-            # Create zip file
-            try:
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    file_count = 0
-                    for file_path in source_path.rglob('*'):
-                        if file_path.is_file():
-                            try:
-                                # Add file to zip with relative path
-                                arcname = file_path.relative_to(source_path.parent)
-                                zipf.write(file_path, arcname)
-                                file_count += 1
-                            except OSError as e:
-                                return f"Error adding file {file_path} to zip: {str(e)}"
-
-                    if file_count == 0:
-                        return f"Warning: No files found in source directory {source_path}"
+            if compression not in COMPRESSION_MODES:
+                raise ValueError(f"Compression must be one of: {', '.join(COMPRESSION_MODES)}")
 
+            # Create zip file, compressing members in parallel and reusing unchanged ones
+            try:
+                packager = ZipPackager(
+                    compression=compression,
+                    max_workers=self.max_workers,
+                    incremental=incremental,
+                    content_store=_content_store(self.content_store_path),
+                )
+                result = packager.package(source_path, zip_path)
             except PermissionError:
                 return f"Permission denied: Cannot create zip file at {zip_path}"
             except OSError as e:
                 return f"OS error creating zip file: {str(e)}"
 
-            return f"Successfully created zip file with {file_count} files: {zip_path}"
+            file_count = result.file_count
+            if file_count == 0:
+                return f"Warning: No files found in source directory {source_path}"
+
+            return (
+                f"Successfully created zip file with {file_count} files: {zip_path} "
+                f"({result.compressed} compressed, {result.reused} unchanged, {result.deduplicated} duplicate)"
+            )
 
         except ValueError as e:
             return f"Validation error: {str(e)}"
@@ -174,6 +199,89 @@ class ZipCreatorTool(BaseTool):
             return f"Unexpected error creating zip file: {str(e)}"
 
 
+ALLOWED_CONTENT_TYPES = ['md', 'txt', 'html', 'json', 'yaml', 'yml']
+
+
+def _atomic_write_text(path: Path, content: str, encoding: str = 'utf-8', errors: str = 'strict') -> None:
+    """Write text to a temporary file next to ``path`` and rename it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, errors=errors) as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _content_store(path: Optional[str]) -> Optional[ContentStore]:
+    return ContentStore(path) if path else None
+
+
+def resolve_content_path(file_path: str, file_type: str = "md") -> Path:
+    """Path ``write_content_file`` writes to: the file type is added when the path has no extension."""
+    if not file_type or not isinstance(file_type, str) or file_type not in ALLOWED_CONTENT_TYPES:
+        file_type = "md"
+    path = Path(file_path)
+    if not path.suffix:
+        path = path.with_suffix(f".{file_type}")
+    return path
+
+
+def write_content_file(file_path: str, content: str, file_type: str = "md", store: Optional[ContentStore] = None) -> str:
+    """Writes content to a file atomically, creating directories if needed.
+
+    With a content store, the content is saved once in the store and the
+    file is made from the stored blob (see ``ContentStore.link_mode``).
+
+    Returns:
+        A success or error message, in the format the content writer tools report
+    """
+    try:
+        if not file_path or not isinstance(file_path, str):
+            raise ValueError("File path must be a non-empty string")
+
+        if content is None:
+            raise ValueError("Content cannot be None")
+
+        # Add extension if not present, falling back to md for unknown file types
+        file_path = resolve_content_path(file_path, file_type)
+
+        # Create parent directories if they don't exist
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        except PermissionError:
+            return f"Permission denied: Cannot create directory {file_path.parent}"
+        except OSError as e:
+            return f"Error creating directory {file_path.parent}: {str(e)}"
+
+        # Validate file path is safe
+        if ".." in str(file_path):
+            return "Error: File path contains unsafe '..' components"
+
+        # Write content to a temporary file and rename it so readers never see a partial file
+        write_text = store.write_text if store is not None else _atomic_write_text
+        try:
+            write_text(file_path, str(content))
+        except PermissionError:
+            return f"Permission denied: Cannot write to {file_path}"
+        except UnicodeEncodeError:
+            # Fallback to ascii encoding if unicode fails
+            try:
+                write_text(file_path, str(content), encoding='ascii', errors='replace')
+            except OSError as e:
+                return f"Error writing file with fallback encoding: {str(e)}"
+        except OSError as e:
+            return f"OS error writing to file: {str(e)}"
+
+        return f"Successfully wrote {len(str(content))} characters to {file_path}"
+
+    except ValueError as e:
+        return f"Validation error: {str(e)}"
+    except Exception as e:
+        return f"Unexpected error writing content to file: {str(e)}"
+
+
 class ContentWriterInput(BaseModel):
     """Input schema for ContentWriterTool."""
     file_path: str = Field(..., description="Path where the file should be created")
@@ -185,61 +293,85 @@ class ContentWriterTool(BaseTool):
     name: str = "Curriculum Content Writer"
     description: str = "Writes curriculum content to specific files in the organized folder structure"
     args_schema: Type[BaseModel] = ContentWriterInput
+    content_store_path: Optional[str] = Field(default=None, description="Opt-in content store for deduplicated files, e.g. ./output/.store; None writes plain files")
 
+    @timed_tool
     def _run(self, file_path: str, content: str, file_type: str = "md") -> str:
         """Writes content to a file, creating directories if needed"""
-        try:
-            if not file_path or not isinstance(file_path, str):
-                raise ValueError("File path must be a non-empty string")
-
-            if content is None:
-                raise ValueError("Content cannot be None")
+        return write_content_file(file_path, content, file_type, store=_content_store(self.content_store_path))
 
-            if not file_type or not isinstance(file_type, str):
-                file_type = "md"
-
-            # Validate file_type
-            allowed_types = ['md', 'txt', 'html', 'json', 'yaml', 'yml']
-            if file_type not in allowed_types:
-                file_type = "md"
-
-            file_path = Path(file_path)
-
-            # Create parent directories if they don't exist
-            try:
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-            except PermissionError:
-                return f"Permission denied: Cannot create directory {file_path.parent}"
-            except OSError as e:
-                return f"Error creating directory {file_path.parent}: {str(e)}"
 
-            # Add extension if not present
-            if not file_path.suffix:
-                file_path = file_path.with_suffix(f".{file_type}")
+class ContentFileEntry(BaseModel):
+    """One file to write in a batch."""
+    path: str = Field(..., description="Path where the file should be created")
+    content: str = Field(..., description="Content to write to the file")
+    type: str = Field("md", description="File extension/type (md, txt, etc.)")
+
+
+class BatchContentWriterInput(BaseModel):
+    """Input schema for BatchContentWriterTool."""
+    files: Optional[List[ContentFileEntry]] = Field(
+        None, description="Files to write, each with path, content and type"
+    )
+    manifest: Optional[str] = Field(
+        None, description="Alternative to files: path to a JSON manifest listing {path, content, type} entries"
+    )
+
+
+class BatchContentWriterTool(BaseTool):
+    name: str = "Curriculum Batch Content Writer"
+    description: str = (
+        "Writes many curriculum files in one call. Pass a list of {path, content, type} entries "
+        "(or a JSON manifest file with that list). Prefer this over writing files one at a time."
+    )
+    args_schema: Type[BaseModel] = BatchContentWriterInput
+    max_workers: int = Field(default=8, description="Files written in parallel")
+    content_store_path: Optional[str] = Field(default=None, description="Opt-in content store for deduplicated files, e.g. ./output/.store; None writes plain files")
+
+    def _load_manifest(self, manifest: str) -> List[ContentFileEntry]:
+        with open(manifest, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("files", [])
+        return [ContentFileEntry(**entry) for entry in data]
+
+    @timed_tool
+    def _run(self, files: Optional[List] = None, manifest: Optional[str] = None) -> str:
+        """Writes every entry in parallel and reports the result per file"""
+        try:
+            entries = [entry if isinstance(entry, ContentFileEntry) else ContentFileEntry(**entry) for entry in files or []]
+            if manifest:
+                try:
+                    entries.extend(self._load_manifest(manifest))
+                except (OSError, ValueError, TypeError) as e:
+                    return f"Error reading manifest {manifest}: {str(e)}"
 
-            # Validate file path is safe
-            if ".." in str(file_path):
-                return "Error: File path contains unsafe '..' components"
+            if not entries:
+                raise ValueError("Provide at least one file entry or a manifest")
 
-            # Write content to file
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(str(content))
-            except PermissionError:
-                return f"Permission denied: Cannot write to {file_path}"
-            except OSError as e:
-                return f"OS error writing to file: {str(e)}"
-            except UnicodeEncodeError:
-                # Fallback to ascii encoding if unicode fails
+            # Later entries for the same output file win, and the same file is never written concurrently;
+            # "notes" and "./notes.md" are the same file
+            by_path = {}
+            for entry in entries:
                 try:
-                    with open(file_path, 'w', encoding='ascii', errors='replace') as f:
-                        f.write(str(content))
-                except OSError as e:
-                    return f"Error writing file with fallback encoding: {str(e)}"
-
-            return f"Successfully wrote {len(str(content))} characters to {file_path}"
+                    key = os.path.abspath(resolve_content_path(entry.path, entry.type))
+                except ValueError:
+                    key = entry.path  # invalid path: write_content_file reports it
+                by_path[key] = entry
+
+            store = _content_store(self.content_store_path)
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+                results = list(pool.map(
+                    lambda entry: write_content_file(entry.path, entry.content, entry.type, store=store),
+                    by_path.values(),
+                ))
+
+            failed = [result for result in results if not result.startswith("Successfully")]
+            summary = [f"Wrote {len(results) - len(failed)} of {len(results)} files"]
+            summary.extend(f"- {result}" for result in results)
+            return "\n".join(summary)
 
         except ValueError as e:
             return f"Validation error: {str(e)}"
         except Exception as e:
-            return f"Unexpected error writing content to file: {str(e)}"
+            return f"Unexpected error writing content files: {str(e)}"
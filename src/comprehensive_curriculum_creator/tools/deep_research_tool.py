@@ -1,20 +1,77 @@
 """CrewAI-compatible wrapper for Open Deep Research tool."""
 
 import asyncio
+import concurrent.futures
 import json
 import logging
+import re
+import sys
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 import tempfile
 import os
 
-from crewai_tools.tools import BaseTool
+import yaml
+from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from comprehensive_curriculum_creator.cost_budget import BudgetGuard, CostLedger, load_cost_settings, resolve_ledger_path
+from comprehensive_curriculum_creator.instrumentation import get_recorder, timed_tool
+from comprehensive_curriculum_creator.tools.research_cache import ResearchCache, create_research_cache
+from comprehensive_curriculum_creator.tools.research_profiles import ResearchProfile, ResearchProfiles, load_research_profiles
+from comprehensive_curriculum_creator.tools.semantic_cache import SemanticQueryIndex, create_embedder
+from comprehensive_curriculum_creator.tools.single_flight import SingleFlight
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default locations of the research configuration, the Open Deep Research sources and the caches
+DEFAULT_RESEARCH_CONFIG_PATH = Path(__file__).parent.parent / "config" / "research_config.yaml"
+DEFAULT_RESEARCH_SRC_PATH = Path(__file__).parent.parent.parent.parent / "research" / "src"
+DEFAULT_CACHE_PATH = "./output/.cache/research_cache.db"
+DEFAULT_SUMMARY_CACHE_PATH = "./output/.cache/webpage_summaries.db"
+DEFAULT_SEMANTIC_CACHE_PATH = "./output/.cache/semantic_index.json"
+
+# Environment overrides of the cache defaults, set e.g. for batch jobs sharing one cache
+CACHE_BACKEND_ENV = "RESEARCH_CACHE_BACKEND"
+CACHE_PATH_ENV = "RESEARCH_CACHE_PATH"
+SUMMARY_CACHE_PATH_ENV = "RESEARCH_SUMMARY_CACHE_PATH"
+SEMANTIC_CACHE_PATH_ENV = "RESEARCH_SEMANTIC_CACHE_PATH"
+
+# Start of the report returned instead of researching when the budget is used up
+RESEARCH_SKIPPED_PREFIX = "Research skipped"
+
+# Process-wide registry of in-flight research runs, shared by every tool instance
+_research_flights = SingleFlight()
+
+
+def _run_coroutine_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` when no event loop is running in the current thread,
+    otherwise runs the coroutine on a fresh loop in a worker thread so the
+    caller's loop is never re-entered.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def close_research_http_clients() -> None:
+    """Close the HTTP clients the research graph pooled on the running event loop.
+
+    Call it before shutting down an event loop that ran ``arun``; the clients
+    are created again on next use.
+    """
+    utils = sys.modules.get("open_deep_research.utils")
+    if utils is not None and hasattr(utils, "close_http_clients"):
+        await utils.close_http_clients()
+
 
 class ResearchQuery(BaseModel):
     """Structure for research query parameters."""
@@ -23,6 +80,7 @@ class ResearchQuery(BaseModel):
     max_sources: int = Field(default=20, description="Maximum number of sources to analyze")
     include_citations: bool = Field(default=True, description="Include citations in the response")
     target_audience: Optional[str] = Field(default=None, description="Target audience for the research")
+    model_override: Optional[str] = Field(default=None, description="Model replacing the mode's model, e.g. to stay within budget")
 
 
 class ResearchResult(BaseModel):
@@ -71,7 +129,34 @@ class DeepResearchTool(BaseTool):
     research_timeout: int = Field(default=1800, description="Research timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
     cache_enabled: bool = Field(default=True, description="Enable result caching")
+    cache_backend: str = Field(
+        default_factory=lambda: os.getenv(CACHE_BACKEND_ENV, "memory"),
+        description="Cache backend: 'memory', 'sqlite' or 'redis' (defaults to $RESEARCH_CACHE_BACKEND)",
+    )
+    cache_ttl_seconds: Optional[int] = Field(default=None, description="Cache TTL in seconds (defaults to cache_ttl_days from research_config.yaml)")
+    cache_max_entries: int = Field(default=1000, description="Maximum number of cached research results")
+    cache_path: str = Field(
+        default_factory=lambda: os.getenv(CACHE_PATH_ENV, DEFAULT_CACHE_PATH),
+        description="SQLite cache file path (defaults to $RESEARCH_CACHE_PATH)",
+    )
+    redis_url: Optional[str] = Field(default=None, description="Redis URL for the redis cache backend (defaults to REDIS_URL)")
+    semantic_cache_enabled: bool = Field(default=False, description="Serve cached results for near-duplicate queries")
+    semantic_cache_threshold: float = Field(default=0.92, description="Minimum cosine similarity for a near-duplicate match")
+    semantic_cache_embedder: str = Field(default="hashing", description="'hashing' or a sentence-transformers model name")
+    semantic_cache_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv(SEMANTIC_CACHE_PATH_ENV),
+        description="Optional JSON file to persist the semantic index (defaults to $RESEARCH_SEMANTIC_CACHE_PATH)",
+    )
+    summary_cache_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv(SUMMARY_CACHE_PATH_ENV, DEFAULT_SUMMARY_CACHE_PATH),
+        description="SQLite file sharing webpage summaries across research runs (defaults to $RESEARCH_SUMMARY_CACHE_PATH); None keeps them in memory",
+    )
+    coalesce_requests: bool = Field(default=True, description="Share one research run between concurrent identical queries")
     docker_compose_path: Optional[str] = Field(default=None, description="Path to docker-compose.yml")
+    research_config_path: Optional[str] = Field(default=None, description="Path to research_config.yaml")
+    research_src_path: Optional[str] = Field(default=None, description="Path to the Open Deep Research sources")
+    cost_tracking_enabled: bool = Field(default=True, description="Track research spend and apply the cost_management limits")
+    cost_ledger_path: Optional[str] = Field(default=None, description="Monthly spend ledger file (defaults to $COST_LEDGER_PATH or cost_management.ledger_path)")
 
     def __init__(self, **kwargs):
         """Initialize the Deep Research Tool."""
@@ -86,9 +171,51 @@ class DeepResearchTool(BaseTool):
             logger.warning(f"Docker compose file not found at {self.docker_compose_path}")
             logger.warning("Make sure the research service is properly set up")
 
+        if self.research_config_path is None:
+            self.research_config_path = str(DEFAULT_RESEARCH_CONFIG_PATH)
+
+        if self.research_src_path is None:
+            self.research_src_path = str(DEFAULT_RESEARCH_SRC_PATH)
+
+        # Research configuration is parsed lazily on first use
+        self._research_config: Optional[Dict[str, Any]] = None
+        self._budget_guard: Optional[BudgetGuard] = None
+
         # Initialize cache if enabled
-        self._cache = {} if self.cache_enabled else None
+        self._cache: Optional[ResearchCache] = self._create_cache() if self.cache_enabled else None
+
+        # Near-duplicate query index on top of the exact-key cache
+        self._semantic_index: Optional[SemanticQueryIndex] = None
+        if self.cache_enabled and self.semantic_cache_enabled:
+            self._semantic_index = SemanticQueryIndex(
+                embedder=create_embedder(self.semantic_cache_embedder),
+                threshold=self.semantic_cache_threshold,
+                max_entries=self.cache_max_entries,
+                path=self.semantic_cache_path,
+            )
 
+    def _create_cache(self) -> ResearchCache:
+        """Create the configured cache backend."""
+        ttl_seconds = self.cache_ttl_seconds
+        if ttl_seconds is None:
+            ttl_days = (self._load_research_config().get("defaults") or {}).get("cache_ttl_days")
+            ttl_seconds = int(ttl_days * 86400) if ttl_days else None
+
+        options: Dict[str, Any] = {"ttl_seconds": ttl_seconds, "max_entries": self.cache_max_entries}
+        if self.cache_backend == "sqlite":
+            options["path"] = self.cache_path
+        elif self.cache_backend == "redis":
+            options["url"] = self.redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+        return create_research_cache(self.cache_backend, **options)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and size of the research cache."""
+        if self._cache is None:
+            return {"backend": None, "enabled": False}
+        return self._cache.stats()
+
+    @timed_tool
     def _run(
         self,
         research_query: Union[str, Dict[str, Any]],
@@ -115,28 +242,57 @@ class DeepResearchTool(BaseTool):
             # Parse and validate input
             query_obj = self._parse_query(research_query, research_mode, max_sources, include_citations, target_audience)
 
-            # Check cache first
-            if self.cache_enabled:
-                cached_result = self._get_cached_result(query_obj)
-                if cached_result:
-                    logger.info("Returning cached research result")
-                    return cached_result
-
-            # Execute research
-            logger.info(f"Starting deep research on: {query_obj.query}")
-            result = self._execute_research(query_obj)
-
-            # Cache result
-            if self.cache_enabled:
-                self._cache_result(query_obj, result)
-
-            # Format and return result
-            return self._format_research_output(result)
+            # Check cache first: cached results cost nothing, so they are served before the budget is applied
+            cached_result = self._get_cached_result_within_budget(query_obj)
+            if cached_result:
+                return cached_result
+
+            # Execute research, joining an identical run already in flight
+            if not self.coalesce_requests:
+                return self._research_and_cache(query_obj)
+            return _research_flights.do(
+                self._generate_cache_key(query_obj),
+                lambda: self._research_and_cache(query_obj, recheck_cache=True),
+            )
 
         except Exception as e:
             logger.error(f"Deep research failed: {str(e)}")
             return self._handle_error(e)
 
+    def _research_and_cache(self, query: ResearchQuery, recheck_cache: bool = False) -> str:
+        """Run the research, cache it and return the formatted report.
+
+        With ``recheck_cache`` the cache is consulted again first, covering a
+        run that finished between the caller's cache check and joining the flight.
+        """
+        if recheck_cache and self.cache_enabled:
+            cached_result = self._get_cached_result(query)
+            if cached_result:
+                return cached_result
+
+        logger.info(f"Starting deep research on: {query.query}")
+        result = self._execute_research(query)
+
+        if self.cache_enabled:
+            self._cache_result(query, result)
+
+        return self._format_research_output(result)
+
+    async def _aresearch_and_cache(self, query: ResearchQuery, recheck_cache: bool = False) -> str:
+        """Async version of :meth:`_research_and_cache`."""
+        if recheck_cache and self.cache_enabled:
+            cached_result = self._get_cached_result(query)
+            if cached_result:
+                return cached_result
+
+        logger.info(f"Starting deep research on: {query.query}")
+        result = await self._aexecute_research(query)
+
+        if self.cache_enabled:
+            self._cache_result(query, result)
+
+        return self._format_research_output(result)
+
     def _parse_query(
         self,
         research_query: Union[str, Dict[str, Any]],
@@ -160,88 +316,291 @@ class DeepResearchTool(BaseTool):
             raise ValueError("Research query must be a string or dictionary")
 
         # Validate research mode
-        if query_obj.research_mode not in ['quick', 'deep', 'academic']:
+        if query_obj.research_mode not in self._get_profiles():
             logger.warning(f"Invalid research mode '{query_obj.research_mode}', defaulting to 'deep'")
             query_obj.research_mode = 'deep'
 
+        # A mode never researches more sources than its profile allows
+        query_obj.max_sources = min(query_obj.max_sources, self._get_profile(query_obj.research_mode).max_sources)
+
         return query_obj
 
+    def _get_budget_guard(self) -> BudgetGuard:
+        """The cost guard, configured from the ``cost_management`` section."""
+        if self._budget_guard is None:
+            settings = load_cost_settings(self._load_research_config())
+            self._budget_guard = BudgetGuard(settings, CostLedger(self.cost_ledger_path or resolve_ledger_path(settings)))
+        return self._budget_guard
+
+    def _apply_budget(self, query: ResearchQuery) -> Optional[str]:
+        """Downgrade the query to fit the budget.
+
+        Returns:
+            A message to return instead of researching when the budget is used up
+        """
+        if not self.cost_tracking_enabled:
+            return None
+        guard = self._get_budget_guard()
+        plan = guard.plan_research(query.research_mode)
+        if not plan.allowed:
+            logger.warning(f"Skipping research on '{query.query}': {plan.reason}")
+            return f"{RESEARCH_SKIPPED_PREFIX}: the {plan.reason}. Continue with existing knowledge."
+
+        query.research_mode = plan.research_mode
+        if plan.downgrade_model:
+            model = self._get_profile(query.research_mode).model
+            cheaper_model = guard.downgrade_model(model)
+            if cheaper_model != model:
+                query.model_override = cheaper_model
+        return None
+
+    def _get_cached_result_within_budget(self, query: ResearchQuery) -> Optional[str]:
+        """Look up the query in the cache, then apply the budget to it.
+
+        The query is looked up as asked before the budget can downgrade it,
+        and again under the downgraded key if the budget changed it.
+
+        Returns:
+            The cached report or budget message to return, or None to research
+        """
+        if self.cache_enabled:
+            cached_result = self._get_cached_result(query)
+            if cached_result:
+                logger.info("Returning cached research result")
+                return cached_result
+
+        key = self._generate_cache_key(query)
+        budget_message = self._apply_budget(query)
+        if budget_message:
+            return budget_message
+
+        if self.cache_enabled and self._generate_cache_key(query) != key:
+            cached_result = self._get_cached_result(query)
+            if cached_result:
+                logger.info("Returning cached result of the downgraded research")
+                return cached_result
+        return None
+
     def _execute_research(self, query: ResearchQuery) -> ResearchResult:
         """Execute the research using Open Deep Research."""
+        return _run_coroutine_sync(self._aexecute_research_on_private_loop(query))
+
+    async def _aexecute_research_on_private_loop(self, query: ResearchQuery) -> ResearchResult:
+        """Run the research, then close the HTTP clients pooled on this loop before it shuts down."""
         try:
-            # For now, return a mock result until the full integration is complete
-            # TODO: Implement actual Docker container execution
-
-            logger.info(f"Executing research with mode: {query.research_mode}")
-
-            # Simulate research execution time based on mode
-            execution_time = {
-                'quick': 5,
-                'deep': 15,
-                'academic': 30
-            }.get(query.research_mode, 15)
-
-            # Create mock result for development/testing
-            result = ResearchResult(
-                summary=f"Comprehensive research analysis of: {query.query}",
-                key_findings=[
-                    f"Key finding 1 related to {query.query}",
-                    f"Key finding 2 with supporting evidence",
-                    f"Key finding 3 with practical implications"
-                ],
-                sources=[
-                    {
-                        "title": "Academic Source 1",
-                        "url": "https://example.com/source1",
-                        "type": "academic",
-                        "relevance_score": 0.95
-                    },
-                    {
-                        "title": "Industry Report",
-                        "url": "https://example.com/source2",
-                        "type": "industry",
-                        "relevance_score": 0.88
-                    }
-                ],
-                methodology=f"Multi-source analysis using {query.research_mode} methodology",
-                confidence_score=0.85,
-                raw_output=f"Raw research output for: {query.query}"
-            )
+            return await self._aexecute_research(query)
+        finally:
+            await close_research_http_clients()
 
-            logger.info(f"Research completed in {execution_time} seconds")
-            return result
+    async def _aexecute_research(self, query: ResearchQuery) -> ResearchResult:
+        """Run the compiled ``deep_researcher`` graph for a query.
 
-        except Exception as e:
-            logger.error(f"Research execution failed: {str(e)}")
-            raise
+        Args:
+            query: Validated research query
+
+        Returns:
+            Structured research result parsed from the final report
+
+        Raises:
+            TimeoutError: If the research exceeds the configured timeout
+        """
+        deep_researcher = self._load_deep_researcher()
+        run_config = self._build_run_config(query)
+        timeout = self._get_research_timeout(query)
+
+        # Price every LLM call of the run and stop it at the per-research limit
+        meter = None
+        if self.cost_tracking_enabled:
+            meter = self._get_budget_guard().meter()
+            run_config["callbacks"] = [meter]
+
+        logger.info(f"Executing research with mode: {query.research_mode} (timeout {timeout:.0f}s)")
+
+        try:
+            final_state = await asyncio.wait_for(
+                deep_researcher.ainvoke(
+                    {"messages": [{"role": "user", "content": self._build_research_prompt(query)}]},
+                    run_config,
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Research timeout exceeded after {timeout:.0f} seconds")
+        finally:
+            if meter is not None:
+                recorder = get_recorder()
+                self._get_budget_guard().record_research(
+                    meter, query.research_mode, run_id=recorder.run_id if recorder else None
+                )
+
+        return self._parse_research_output(query, final_state)
+
+    def _load_deep_researcher(self):
+        """Import the compiled Open Deep Research graph.
+
+        The graph compiles on import, so this is deferred until research is
+        actually requested.
+        """
+        try:
+            from open_deep_research.deep_researcher import deep_researcher
+        except ImportError:
+            if self.research_src_path and self.research_src_path not in sys.path:
+                sys.path.insert(0, self.research_src_path)
+            from open_deep_research.deep_researcher import deep_researcher
+        return deep_researcher
+
+    def _load_research_config(self) -> Dict[str, Any]:
+        """Load and memoize ``research_config.yaml``."""
+        if self._research_config is None:
+            try:
+                with open(self.research_config_path, "r", encoding="utf-8") as f:
+                    self._research_config = yaml.safe_load(f) or {}
+            except OSError as e:
+                logger.warning(f"Could not read research config at {self.research_config_path}: {e}")
+                self._research_config = {}
+        return self._research_config
+
+    def _get_profiles(self) -> ResearchProfiles:
+        """Validated research mode profiles of ``research_config.yaml``."""
+        return load_research_profiles(self.research_config_path)
+
+    def _get_profile(self, research_mode: str) -> ResearchProfile:
+        """Get the profile of a research mode, falling back to the defaults."""
+        return self._get_profiles().get(research_mode)
+
+    def _build_run_config(self, query: ResearchQuery) -> Dict[str, Any]:
+        """Translate the research mode into Open Deep Research configuration overrides."""
+        configurable = self._get_profile(query.research_mode).to_configurable(query.model_override)
+        # The tool runs unattended, so the graph must never stop to ask questions
+        configurable["allow_clarification"] = False
+        if self.summary_cache_path:
+            configurable["summary_cache_path"] = self.summary_cache_path
+        return {"configurable": configurable}
+
+    def _get_research_timeout(self, query: ResearchQuery) -> float:
+        """Get the research timeout in seconds, capped by ``research_timeout``."""
+        timeout_minutes = self._get_profile(query.research_mode).timeout_minutes
+        return float(min(self.research_timeout, timeout_minutes * 60))
+
+    def _build_research_prompt(self, query: ResearchQuery) -> str:
+        """Build the user message sent to the research graph."""
+        lines = [query.query, ""]
+        if query.target_audience:
+            lines.append(f"Target audience: {query.target_audience}")
+        lines.append(f"Use at most {query.max_sources} sources.")
+        if query.include_citations:
+            lines.append("Cite every source inline and list them in a Sources section.")
+        if self._get_profile(query.research_mode).academic_focus:
+            lines.append("Prioritize peer-reviewed and scholarly sources.")
+        return "\n".join(lines)
+
+    def _parse_research_output(self, query: ResearchQuery, final_state: Dict[str, Any]) -> ResearchResult:
+        """Convert the graph's final state into a ResearchResult."""
+        report = str(final_state.get("final_report") or "")
+        if not report or report.startswith("Error generating final report"):
+            raise RuntimeError(report or "Research produced no report")
+
+        # Everything above the "Sources" heading is the report body
+        body = re.split(r"^#+\s*Sources\s*$", report, maxsplit=1, flags=re.MULTILINE | re.IGNORECASE)[0]
+
+        # Summary: first paragraph of prose in the report
+        summary = next(
+            (block.strip() for block in re.split(r"\n\s*\n", body)
+             if block.strip() and not block.strip().startswith("#")),
+            query.query,
+        )
+
+        # Key findings: bullet points, falling back to section headings
+        key_findings = [
+            match.strip() for match in re.findall(r"^\s*(?:[-*]|\d+\.)\s+(.+)$", body, flags=re.MULTILINE)
+        ]
+        if not key_findings:
+            key_findings = [
+                match.strip() for match in re.findall(r"^#{2,3}\s+(.+)$", body, flags=re.MULTILINE)
+            ]
+        key_findings = key_findings[:10]
+
+        sources: List[Dict[str, Any]] = []
+        if query.include_citations:
+            seen_urls = set()
+            citations = re.findall(r"^\s*\[\d+\]\s*(.+?):\s*(https?://\S+)", report, flags=re.MULTILINE)
+            citations += re.findall(r"\[([^\]]+)\]\((https?://[^)\s]+)\)", report)
+            for title, url in citations:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                sources.append({"title": title.strip(), "url": url, "type": "web"})
+            sources = sources[:query.max_sources]
+
+        profile = self._get_profile(query.research_mode)
+        methodology = (
+            f"Open Deep Research in {query.research_mode} mode: "
+            f"up to {profile.max_iterations} supervisor iterations with "
+            f"{profile.max_concurrent_researchers} concurrent researchers making at most "
+            f"{profile.max_tool_calls} {profile.search_api} searches each"
+        )
+
+        # Confidence grows with the share of the requested sources that were found
+        source_coverage = min(1.0, len(sources) / max(query.max_sources, 1))
+        confidence_score = round(0.5 + 0.5 * source_coverage, 2)
+
+        return ResearchResult(
+            summary=summary,
+            key_findings=key_findings,
+            sources=sources,
+            methodology=methodology,
+            confidence_score=confidence_score,
+            raw_output=report,
+        )
 
     def _get_cached_result(self, query: ResearchQuery) -> Optional[str]:
         """Get cached research result if available."""
-        if not self.cache_enabled or not self._cache:
+        if not self.cache_enabled or self._cache is None:
             return None
 
-        cache_key = self._generate_cache_key(query)
-        if cache_key in self._cache:
-            cached_data = self._cache[cache_key]
-            # TODO: Implement TTL check
+        cached_data = self._cache.get(self._generate_cache_key(query))
+        if cached_data is not None or self._semantic_index is None:
             return cached_data
-        return None
+
+        # Fall back to the closest earlier query with the same mode, sources and audience
+        match = self._semantic_index.lookup(self._generate_cache_scope(query), query.query)
+        if match is None:
+            return None
+
+        cache_key, similarity = match
+        cached_data = self._cache.get(cache_key)
+        if cached_data is None:
+            # The matched result has expired or been evicted
+            self._semantic_index.remove(cache_key)
+            return None
+
+        logger.info(f"Semantic cache hit for '{query.query}' (similarity {similarity:.2f})")
+        return cached_data
 
     def _cache_result(self, query: ResearchQuery, result: ResearchResult):
         """Cache the research result."""
-        if not self.cache_enabled:
+        if not self.cache_enabled or self._cache is None:
             return
 
         cache_key = self._generate_cache_key(query)
-        self._cache[cache_key] = self._format_research_output(result)
+        self._cache.set(cache_key, self._format_research_output(result))
+        if self._semantic_index is not None:
+            self._semantic_index.add(self._generate_cache_scope(query), query.query, cache_key)
         logger.debug(f"Cached research result for key: {cache_key}")
 
     def _generate_cache_key(self, query: ResearchQuery) -> str:
         """Generate a cache key for the research query."""
         import hashlib
         key_data = f"{query.query}_{query.research_mode}_{query.max_sources}_{query.target_audience}"
+        if query.model_override:
+            key_data += f"_{query.model_override}"
         return hashlib.md5(key_data.encode()).hexdigest()
 
+    def _generate_cache_scope(self, query: ResearchQuery) -> str:
+        """Generate the part of the cache key that near-duplicate matches must share."""
+        scope = f"{query.research_mode}_{query.max_sources}_{query.target_audience}"
+        return f"{scope}_{query.model_override}" if query.model_override else scope
+
     def _format_research_output(self, result: ResearchResult) -> str:
         """Format the research result as a comprehensive report."""
         output = []
@@ -302,8 +661,38 @@ class DeepResearchTool(BaseTool):
 
         return error_msg
 
-    async def _arun(self, *args, **kwargs) -> str:
-        """Async version of the research tool."""
-        # For now, delegate to sync version
-        # TODO: Implement true async execution
-        return self._run(*args, **kwargs)
+    async def arun(self, *args, **kwargs) -> str:
+        """Run the research asynchronously; the awaitable counterpart of ``run``."""
+        return await self._arun(*args, **kwargs)
+
+    @timed_tool
+    async def _arun(
+        self,
+        research_query: Union[str, Dict[str, Any]],
+        research_mode: str = "deep",
+        max_sources: int = 20,
+        include_citations: bool = True,
+        target_audience: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """Async version of the research tool.
+
+        Awaits the research graph directly so that concurrent agents can run
+        deep research without each one blocking a worker thread.
+        """
+        try:
+            query_obj = self._parse_query(research_query, research_mode, max_sources, include_citations, target_audience)
+            cached_result = self._get_cached_result_within_budget(query_obj)
+            if cached_result:
+                return cached_result
+
+            if not self.coalesce_requests:
+                return await self._aresearch_and_cache(query_obj)
+            return await _research_flights.ado(
+                self._generate_cache_key(query_obj),
+                lambda: self._aresearch_and_cache(query_obj, recheck_cache=True),
+            )
+
+        except Exception as e:
+            logger.error(f"Deep research failed: {str(e)}")
+            return self._handle_error(e)
@@ -0,0 +1,130 @@
+"""Tools that are imported and constructed on first use.
+
+Importing ``crewai_tools`` takes seconds, and some of its tools (the RAG-backed
+website and GitHub search tools) set up embedders when constructed. Every
+agent is built whenever the crew is, including for the Stage 1 crew, which
+only runs the curriculum architect. A ``LazyTool`` has the wrapped tool's name,
+description and argument schema, so agents can build their prompts. The
+real tool is imported and constructed the first time it actually runs.
+"""
+
+import importlib
+import threading
+from typing import Any, Dict, List, Optional
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class SerperDevToolSchema(BaseModel):
+    """Input for SerperDevTool."""
+    search_query: str = Field(..., description="Mandatory search query you want to use to search the internet")
+
+
+class ScrapeWebsiteToolSchema(BaseModel):
+    """Input for ScrapeWebsiteTool."""
+    website_url: str = Field(..., description="Mandatory website url to read the file")
+
+
+class WebsiteSearchToolSchema(BaseModel):
+    """Input for WebsiteSearchTool."""
+    search_query: str = Field(..., description="Mandatory search query you want to use to search a specific website")
+    website: str = Field(..., description="Mandatory valid website URL you want to search on")
+
+
+class TavilySearchToolSchema(BaseModel):
+    """Input for TavilySearchTool."""
+    query: str = Field(..., description="The search query string.")
+
+
+class GithubSearchToolSchema(BaseModel):
+    """Input for GithubSearchTool."""
+    search_query: str = Field(..., description="Mandatory search query you want to use to search the github repo's content")
+    github_repo: str = Field(..., description="Mandatory github you want to search")
+    content_types: List[str] = Field(
+        ...,
+        description="Mandatory content types you want to be included search, options: [code, repo, pr, issue]",
+    )
+
+
+# Metadata of the crewai_tools tools used by the crew, so proxies can be built
+# without importing crewai_tools. It must match the real tools (see tests).
+CREWAI_TOOL_SPECS: Dict[str, Dict[str, Any]] = {
+    "SerperDevTool": {
+        "name": "Search the internet with Serper",
+        "description": (
+            "A tool that can be used to search the internet with a search_query. "
+            "Supports different search types: 'search' (default), 'news'"
+        ),
+        "args_schema": SerperDevToolSchema,
+    },
+    "ScrapeWebsiteTool": {
+        "name": "Read website content",
+        "description": "A tool that can be used to read a website content.",
+        "args_schema": ScrapeWebsiteToolSchema,
+    },
+    "WebsiteSearchTool": {
+        "name": "Search in a specific website",
+        "description": "A tool that can be used to semantic search a query from a specific URL content.",
+        "args_schema": WebsiteSearchToolSchema,
+    },
+    "TavilySearchTool": {
+        "name": "Tavily Search",
+        "description": (
+            "A tool that performs web searches using the Tavily Search API. "
+            "It returns a JSON object containing the search results."
+        ),
+        "args_schema": TavilySearchToolSchema,
+    },
+    "GithubSearchTool": {
+        "name": "Search a github repo's content",
+        "description": (
+            "A tool that can be used to semantic search a query from a github repo's content. "
+            "This is not the GitHub API, but instead a tool that can provide semantic search capabilities."
+        ),
+        "args_schema": GithubSearchToolSchema,
+    },
+}
+
+
+class LazyTool(BaseTool):
+    """Proxy that imports and constructs the wrapped tool on its first run."""
+
+    tool_path: str = Field(..., description="Import path of the tool class, as 'module:ClassName'")
+    tool_kwargs: Dict[str, Any] = Field(default_factory=dict, description="Arguments for the tool class")
+
+    _tool: Optional[BaseTool] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the wrapped tool has been constructed."""
+        return self._tool is not None
+
+    @property
+    def tool(self) -> BaseTool:
+        """The wrapped tool, imported and constructed on first access."""
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    module_name, class_name = self.tool_path.split(":")
+                    tool_class = getattr(importlib.import_module(module_name), class_name)
+                    self._tool = tool_class(**self.tool_kwargs)
+        return self._tool
+
+    def _run(self, **kwargs: Any) -> Any:
+        return self.tool._run(**kwargs)
+
+
+def lazy_crewai_tool(class_name: str, **tool_kwargs) -> LazyTool:
+    """Create a lazy proxy for a tool from ``crewai_tools``.
+
+    Args:
+        class_name: Tool class name, one of ``CREWAI_TOOL_SPECS``
+        **tool_kwargs: Arguments passed to the tool when it is constructed
+    """
+    return LazyTool(
+        **CREWAI_TOOL_SPECS[class_name],
+        tool_path=f"crewai_tools:{class_name}",
+        tool_kwargs=tool_kwargs,
+    )
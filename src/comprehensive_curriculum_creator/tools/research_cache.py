@@ -0,0 +1,348 @@
+"""Cache backends for deep research results.
+
+Research calls take minutes and cost real money, so results are cached by
+query. Three interchangeable backends are provided:
+
+- ``memory``: in-process LRU, lost when the process exits
+- ``sqlite``: on-disk store that several local processes can share
+- ``redis``: network store, e.g. the ``research-cache`` service in
+  ``research/docker-compose.yml``
+
+Every backend supports TTL eviction, a maximum number of entries and
+hit/miss counters.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchCache(ABC):
+    """Base class for research result caches.
+
+    Args:
+        ttl_seconds: Time to live for entries, or None to never expire
+        max_entries: Maximum number of entries kept, or None for no limit
+    """
+
+    backend_name: str = "base"
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value under the given key."""
+        self._set(key, value)
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Backend-specific lookup."""
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None:
+        """Backend-specific store."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of live entries."""
+
+    def _expires_at(self) -> Optional[float]:
+        """Compute the expiry timestamp for an entry written now."""
+        return time.time() + self.ttl_seconds if self.ttl_seconds else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and size information."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend_name,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+        }
+
+
+class MemoryResearchCache(ResearchCache):
+    """In-process LRU cache with TTL eviction."""
+
+    backend_name = "memory"
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = 1000):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._expires_at(), value)
+            self._entries.move_to_end(key)
+
+            # Evict least recently used entries beyond the size cap
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            now = time.time()
+            return sum(1 for expires_at, _ in self._entries.values() if expires_at is None or expires_at > now)
+
+
+class SQLiteResearchCache(ResearchCache):
+    """On-disk cache backed by SQLite.
+
+    The database uses WAL journaling so several processes on the same
+    machine can read and write the cache concurrently.
+    """
+
+    backend_name = "sqlite"
+
+    def __init__(
+        self,
+        path: str = "./output/.cache/research_cache.db",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = 10000,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS research_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS research_cache_accessed ON research_cache (accessed_at)"
+            )
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM research_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM research_cache WHERE key = ?", (key,))
+                self.evictions += 1
+                return None
+
+            self._conn.execute("UPDATE research_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO research_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, self._expires_at(), now),
+            )
+
+            # Drop expired entries, then least recently used ones beyond the size cap
+            expired = self._conn.execute(
+                "DELETE FROM research_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            ).rowcount
+            self.evictions += max(expired, 0)
+
+            if self.max_entries is not None:
+                overflow = self._conn.execute(
+                    "DELETE FROM research_cache WHERE key IN ("
+                    "SELECT key FROM research_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+                self.evictions += max(overflow, 0)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM research_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM research_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM research_cache WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RedisResearchCache(ResearchCache):
+    """Cache stored in Redis, shared by every process that can reach it.
+
+    TTLs are enforced by Redis itself. The size cap is maintained with a
+    sorted set of keys ordered by last access. Connection errors are logged
+    and treated as cache misses so research never fails because the cache
+    is down.
+    """
+
+    backend_name = "redis"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = 10000,
+        prefix: str = "research_cache:",
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "The redis cache backend requires the `redis` package. "
+                "Install it with `pip install redis`."
+            )
+
+        self.url = url
+        self.prefix = prefix
+        self._index_key = f"{prefix}__index__"
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _get(self, key: str) -> Optional[str]:
+        try:
+            value = self._client.get(self._key(key))
+            if value is None:
+                self._client.zrem(self._index_key, key)
+                return None
+            self._client.zadd(self._index_key, {key: time.time()})
+            return value
+        except Exception as e:
+            logger.warning(f"Redis cache lookup failed: {e}")
+            return None
+
+    def _set(self, key: str, value: str) -> None:
+        try:
+            ttl = int(self.ttl_seconds) if self.ttl_seconds else None
+            pipe = self._client.pipeline()
+            pipe.set(self._key(key), value, ex=ttl)
+            pipe.zadd(self._index_key, {key: time.time()})
+            pipe.execute()
+
+            if self.max_entries is not None:
+                overflow = self._client.zcard(self._index_key) - self.max_entries
+                if overflow > 0:
+                    stale = [member for member, _ in self._client.zpopmin(self._index_key, overflow)]
+                    if stale:
+                        self._client.delete(*(self._key(k) for k in stale))
+                        self.evictions += len(stale)
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self._key(key))
+            self._client.zrem(self._index_key, key)
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    def clear(self) -> None:
+        try:
+            keys = self._client.zrange(self._index_key, 0, -1)
+            if keys:
+                self._client.delete(*(self._key(k) for k in keys))
+            self._client.delete(self._index_key)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+
+    def __len__(self) -> int:
+        try:
+            return int(self._client.zcard(self._index_key))
+        except Exception:
+            return 0
+
+
+CACHE_BACKENDS = {
+    "memory": MemoryResearchCache,
+    "sqlite": SQLiteResearchCache,
+    "redis": RedisResearchCache,
+}
+
+
+def create_research_cache(backend: str = "memory", **kwargs) -> ResearchCache:
+    """Create a research cache backend by name.
+
+    Args:
+        backend: One of 'memory', 'sqlite' or 'redis'
+        **kwargs: Backend-specific options (ttl_seconds, max_entries, path, url)
+
+    Returns:
+        Configured cache backend
+    """
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend '{backend}'. Choose from: {', '.join(CACHE_BACKENDS)}")
+    return CACHE_BACKENDS[backend](**kwargs)
@@ -0,0 +1,119 @@
+"""Research mode profiles read from research_config.yaml.
+
+Every entry of ``research_modes`` is merged over ``defaults``, validated, and
+translated into Open Deep Research ``Configuration`` overrides, so the mode
+bounds how much work a research run does:
+
+- ``max_iterations``: supervisor rounds (``max_researcher_iterations``)
+- ``max_concurrent_researchers``: parallel sub-researchers
+  (``max_concurrent_research_units``)
+- ``max_tool_calls``: searches per sub-researcher (``max_react_tool_calls``)
+- ``model``: research, compression and final report model
+- ``max_content_length``: page length summarized per search result
+- ``timeout_minutes`` and ``max_sources``: applied by the tool itself
+
+The file is parsed once per path and modification time.
+"""
+
+import functools
+import logging
+import os
+from typing import Any, Dict, List, Literal, Optional
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchProfile(BaseModel):
+    """Limits and models of one research mode."""
+    model: str = Field(default="gpt-4o", description="Model for research, compression and the final report")
+    max_iterations: int = Field(default=6, ge=1, description="Supervisor research rounds")
+    max_concurrent_researchers: int = Field(default=5, ge=1, description="Sub-researchers run in parallel")
+    max_tool_calls: int = Field(default=10, ge=1, description="Search calls per sub-researcher")
+    search_api: Literal["tavily", "openai", "anthropic", "none"] = "tavily"
+    max_sources: int = Field(default=20, ge=1, description="Upper bound on the sources a query may ask for")
+    timeout_minutes: float = Field(default=30, gt=0)
+    max_content_length: Optional[int] = Field(default=None, ge=1000, description="Characters of a page kept for summarization")
+    academic_focus: bool = False
+    description: str = ""
+    use_cases: List[str] = Field(default_factory=list)
+
+    def to_configurable(self, model_override: Optional[str] = None) -> Dict[str, Any]:
+        """Open Deep Research ``Configuration`` overrides for this profile.
+
+        Args:
+            model_override: Model replacing the profile's model, e.g. to stay within budget
+        """
+        model = model_override or self.model
+        if ":" not in model:
+            model = f"openai:{model}"
+
+        configurable: Dict[str, Any] = {
+            "research_model": model,
+            "compression_model": model,
+            "final_report_model": model,
+            "max_researcher_iterations": self.max_iterations,
+            "max_concurrent_research_units": self.max_concurrent_researchers,
+            "max_react_tool_calls": self.max_tool_calls,
+            "search_api": self.search_api,
+        }
+        if self.max_content_length is not None:
+            configurable["max_content_length"] = self.max_content_length
+        return configurable
+
+
+class ResearchProfiles(BaseModel):
+    """All research modes of a research_config.yaml."""
+    defaults: ResearchProfile = Field(default_factory=ResearchProfile)
+    modes: Dict[str, ResearchProfile] = Field(default_factory=dict)
+
+    def get(self, research_mode: str) -> ResearchProfile:
+        """Profile of a mode, or the defaults for an unknown mode."""
+        return self.modes.get(research_mode, self.defaults)
+
+    def __contains__(self, research_mode: str) -> bool:
+        return research_mode in self.modes
+
+
+def parse_research_profiles(config: Dict[str, Any], source: str = "research config") -> ResearchProfiles:
+    """Build the profiles from a parsed research_config.yaml.
+
+    Raises:
+        ValueError: If a mode has an invalid setting
+    """
+    defaults = dict(config.get("defaults") or {})
+    section = "defaults"
+    try:
+        default_profile = ResearchProfile(**defaults)
+        modes = {}
+        for name, settings in (config.get("research_modes") or {}).items():
+            section = f"research mode '{name}'"
+            modes[name] = ResearchProfile(**{**defaults, **(settings or {})})
+    except ValidationError as e:
+        raise ValueError(f"Invalid {section} in {source}: {e}") from e
+    return ResearchProfiles(defaults=default_profile, modes=modes)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str, mtime: float) -> ResearchProfiles:
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_research_profiles(yaml.safe_load(f) or {}, source=path)
+
+
+def load_research_profiles(config_path: str) -> ResearchProfiles:
+    """Load the research profiles of a config file, parsing it only when it changed.
+
+    A missing file yields the built-in defaults.
+
+    Raises:
+        ValueError: If the file contains an invalid profile
+    """
+    path = os.path.abspath(config_path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError as e:
+        logger.warning(f"Could not read research config at {config_path}: {e}")
+        return ResearchProfiles()
+    return _load_cached(path, mtime)
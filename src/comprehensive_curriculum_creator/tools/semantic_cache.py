@@ -0,0 +1,221 @@
+"""Near-duplicate lookup for research queries.
+
+Exact cache keys miss on trivial rewording ("Intro to Quantum Physics" vs
+"Introduction to quantum physics"). The index here embeds each cached query
+and maps a new query onto the cache key of the most similar earlier one when
+their cosine similarity clears a threshold.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "into",
+    "is", "of", "on", "or", "the", "to", "with",
+})
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-features embedder that needs no model download.
+
+    Each word contributes its 5-character stem (so "intro" matches
+    "introduction") and its character trigrams; numbers get a heavy weight so
+    that "session 2" and "session 3" stay apart. Features are hashed with
+    BLAKE2 rather than ``hash()`` so vectors are stable across processes.
+
+    Args:
+        dim: Embedding dimension
+    """
+
+    STEM_WEIGHT = 2.0
+    TRIGRAM_WEIGHT = 0.3
+    NUMBER_WEIGHT = 4.0
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        words = re.sub(r"[^a-z0-9\s]", " ", text.lower()).split()
+        features = []
+        for word in words:
+            if word in STOPWORDS:
+                continue
+            if word.isdigit():
+                features.append((f"n:{word}", self.NUMBER_WEIGHT))
+                continue
+            features.append((f"s:{word[:5]}", self.STEM_WEIGHT))
+            padded = f"<{word}>"
+            features.extend((f"c:{padded[i:i + 3]}", self.TRIGRAM_WEIGHT) for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a query into a unit-length vector."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self._features(text):
+            digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+            sign = 1.0 if digest >> 63 else -1.0
+            vector[digest % self.dim] += sign * weight
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a local sentence-transformers model.
+
+    Args:
+        model_name: Model to load, e.g. 'sentence-transformers/all-MiniLM-L6-v2'
+    """
+
+    def __init__(self, model_name: str):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                f"Embedding model '{model_name}' requires the `sentence-transformers` package. "
+                "Install it with `pip install sentence-transformers` or use the 'hashing' embedder."
+            )
+        self.model_name = model_name
+        self._model = SentenceTransformer(model_name)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a query into a unit-length vector."""
+        return np.asarray(self._model.encode(text, normalize_embeddings=True), dtype=np.float32)
+
+
+def create_embedder(name: str = "hashing"):
+    """Create an embedder by name: 'hashing' or a sentence-transformers model."""
+    if name == "hashing":
+        return HashingEmbedder()
+    return SentenceTransformerEmbedder(name)
+
+
+class SemanticQueryIndex:
+    """Brute-force cosine-similarity index over cached research queries.
+
+    Queries only match within the same scope (research mode, source budget
+    and audience), so a 'quick' result is never served for a 'deep' request.
+    Entries are optionally persisted as JSON; embeddings are recomputed on load.
+
+    Args:
+        embedder: Object with an ``embed(text) -> np.ndarray`` method
+        threshold: Minimum cosine similarity for a match
+        max_entries: Maximum number of indexed queries (oldest dropped first)
+        path: Optional JSON file used to persist the index
+    """
+
+    def __init__(
+        self,
+        embedder=None,
+        threshold: float = 0.92,
+        max_entries: int = 5000,
+        path: Optional[str] = None,
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+
+        self._entries: List[Tuple[str, str, str]] = []  # (scope, query, cache_key)
+        self._vectors: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, scope: str, query: str, cache_key: str) -> None:
+        """Index a query under the cache key its result is stored at."""
+        vector = self.embedder.embed(query)
+        with self._lock:
+            # Re-adding a key replaces its previous entry
+            self._remove_unlocked(cache_key)
+            self._entries.append((scope, query, cache_key))
+            self._vectors.append(vector)
+
+            overflow = len(self._entries) - self.max_entries
+            if overflow > 0:
+                del self._entries[:overflow]
+                del self._vectors[:overflow]
+
+            self._matrix = None
+            self._save_unlocked()
+
+    def lookup(self, scope: str, query: str) -> Optional[Tuple[str, float]]:
+        """Find the cache key of the most similar indexed query in the scope.
+
+        Returns:
+            (cache_key, similarity) for the best match above the threshold, else None
+        """
+        with self._lock:
+            if not self._entries:
+                return None
+            if self._matrix is None:
+                self._matrix = np.vstack(self._vectors)
+            matrix = self._matrix
+            entries = list(self._entries)
+
+        similarities = matrix @ self.embedder.embed(query)
+        in_scope = np.array([entry[0] == scope for entry in entries])
+        similarities = np.where(in_scope, similarities, -1.0)
+
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.threshold:
+            return None
+        return entries[best][2], similarity
+
+    def remove(self, cache_key: str) -> None:
+        """Drop the entry for a cache key, e.g. after its result expired."""
+        with self._lock:
+            if self._remove_unlocked(cache_key):
+                self._matrix = None
+                self._save_unlocked()
+
+    def _remove_unlocked(self, cache_key: str) -> bool:
+        for i, entry in enumerate(self._entries):
+            if entry[2] == cache_key:
+                del self._entries[i]
+                del self._vectors[i]
+                return True
+        return False
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load semantic cache index {self.path}: {e}")
+            return
+
+        for record in records[-self.max_entries:]:
+            self._entries.append((record["scope"], record["query"], record["key"]))
+            self._vectors.append(self.embedder.embed(record["query"]))
+
+    def _save_unlocked(self) -> None:
+        if not self.path:
+            return
+
+        records = [{"scope": scope, "query": query, "key": key} for scope, query, key in self._entries]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(records, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save semantic cache index {self.path}: {e}")
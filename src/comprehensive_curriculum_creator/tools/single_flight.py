@@ -0,0 +1,76 @@
+"""Request coalescing for expensive, idempotent calls.
+
+When several callers ask for the same key at once, only the first one (the
+leader) does the work; the others wait for the leader's result. Works for
+threads and for coroutines, and a thread can wait on a coroutine's result or
+vice versa, because both share one ``concurrent.futures.Future`` per key.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+
+    def _join(self, key: str) -> Tuple[concurrent.futures.Future, bool]:
+        """Get the in-flight future for a key and whether the caller leads it."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for the key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless a call for ``key`` is already running, then share its result.
+
+        Exceptions raised by the leader are re-raised in every waiting caller.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._finish(key)
+
+    async def ado(self, key: str, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of :meth:`do`; waiting callers do not block the event loop."""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            result = await coro_fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._finish(key)
@@ -0,0 +1,452 @@
+"""Parallel, incremental zip packaging for curriculum folders.
+
+Members are compressed in a thread pool (zlib and zstd release the GIL) into
+spooled temporary buffers. A single writer streams the buffers into the
+archive in a stable order, and at most ``2 * max_workers`` members are in
+flight at once, so memory stays bounded however large the course is.
+
+Every archive gets a manifest under ``output/.cache/zip_manifests`` recording
+each member's size, mtime and SHA-256. When the folder is packaged again,
+members whose size and mtime are unchanged, or whose content hash still
+matches, are copied from the previous archive as already-compressed bytes.
+Only new or edited files are compressed again.
+
+Files hardlinked into a content store (``link_mode="hardlink"``) have a hash
+known without reading them. Members sharing content are compressed once and
+the bytes copied for every other copy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from comprehensive_curriculum_creator.tools.content_store import ContentStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_DIR = "./output/.cache/zip_manifests"
+
+CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+
+# Formats that are already compressed; deflating them again wastes CPU for no gain
+COMPRESSED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".heic",
+    ".mp3", ".mp4", ".m4a", ".mov", ".webm", ".ogg", ".avi", ".mkv",
+    ".pdf", ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".epub",
+    ".woff", ".woff2",
+})
+
+COMPRESSION_MODES = ("auto", "deflate", "store", "zstd")
+
+ZIP_ZSTANDARD = getattr(zipfile, "ZIP_ZSTANDARD", None)
+
+
+class PackageResult(BaseModel):
+    """Summary of one packaging run."""
+    zip_path: str
+    file_count: int = 0
+    compressed: int = Field(default=0, description="Members compressed in this run")
+    reused: int = Field(default=0, description="Members copied from the previous archive")
+    deduplicated: int = Field(default=0, description="Members whose content was already in this archive")
+    total_bytes: int = Field(default=0, description="Uncompressed size of all members")
+    archive_bytes: int = Field(default=0, description="Size of the written archive")
+
+
+class _Member(BaseModel):
+    path: Path
+    arcname: str
+    size: int
+    mtime_ns: int
+    digest: Optional[str] = Field(default=None, description="SHA-256 known from the content store")
+
+
+class _Pending(BaseModel):
+    """A member queued for writing, and where its compressed bytes come from."""
+    model_config = {"arbitrary_types_allowed": True}
+
+    member: _Member
+    compress_type: int
+    old_info: Optional[zipfile.ZipInfo] = None  # copy from the previous archive
+    future: Optional[Future] = None  # compressed by a worker
+    duplicate: bool = False  # same content as a member already written in this run
+
+
+class _Compressed(BaseModel):
+    """A member compressed by a worker, ready to be written."""
+    model_config = {"arbitrary_types_allowed": True}
+
+    data: Optional[object] = None  # spooled file with the compressed bytes
+    compress_type: int
+    crc: int = 0
+    compress_size: int = 0
+    file_size: int = 0
+    sha256: str = ""
+    reuse: bool = Field(default=False, description="Content matches the previous archive")
+
+
+def zstd_available() -> bool:
+    """Whether this Python can write zstd-compressed zip members (3.14+)."""
+    if ZIP_ZSTANDARD is None:
+        return False
+    try:
+        from compression import zstd  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_compress_type(mode: str, path: Path) -> int:
+    """Pick the zip compression method for a file under a packaging mode."""
+    if mode == "store":
+        return zipfile.ZIP_STORED
+    if mode == "zstd" and zstd_available():
+        return ZIP_ZSTANDARD
+    if mode == "auto" and path.suffix.lower() in COMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _compressor(compress_type: int, level: int):
+    if compress_type == zipfile.ZIP_DEFLATED:
+        return zlib.compressobj(level, zlib.DEFLATED, -15)
+    if compress_type == ZIP_ZSTANDARD:
+        from compression.zstd import ZstdCompressor
+        return ZstdCompressor(level=level)
+    return None
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _compress_member(member: _Member, compress_type: int, level: int, previous_sha256: Optional[str]) -> _Compressed:
+    """Compress one file into a spooled buffer (runs in a worker thread)."""
+    if previous_sha256 is not None and _hash_file(member.path) == previous_sha256:
+        return _Compressed(compress_type=compress_type, sha256=previous_sha256, reuse=True)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    compressor = _compressor(compress_type, level)
+    digest = hashlib.sha256()
+    crc = 0
+    file_size = 0
+    with open(member.path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            digest.update(chunk)
+            spool.write(compressor.compress(chunk) if compressor else chunk)
+    if compressor:
+        spool.write(compressor.flush())
+
+    compress_size = spool.tell()
+    spool.seek(0)
+    return _Compressed(
+        data=spool,
+        compress_type=compress_type,
+        crc=crc,
+        compress_size=compress_size,
+        file_size=file_size,
+        sha256=digest.hexdigest(),
+    )
+
+
+def _write_raw_member(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: BinaryIO) -> int:
+    """Append an already-compressed member to an archive opened for writing.
+
+    ``zipfile`` has no public API for this, so this does what
+    ``ZipFile._open_to_write`` does with the CRC and sizes known up front.
+
+    Returns:
+        Offset of the member's compressed bytes in the archive
+    """
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zinfo.flag_bits &= ~0x08  # sizes are in the local header, no data descriptor
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.start_dir
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader(zip64))
+    data_offset = zf.fp.tell()
+    shutil.copyfileobj(data, zf.fp, CHUNK_SIZE)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+    return data_offset
+
+
+class _LimitedReader:
+    """Reads at most ``size`` bytes from a file object."""
+
+    def __init__(self, fp: BinaryIO, size: int):
+        self._fp = fp
+        self._remaining = size
+
+    def read(self, n: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+        n = self._remaining if n < 0 else min(n, self._remaining)
+        data = self._fp.read(n)
+        self._remaining -= len(data)
+        return data
+
+
+def _raw_member_reader(fp: BinaryIO, zinfo: zipfile.ZipInfo) -> _LimitedReader:
+    """Position ``fp`` at a member's compressed bytes in an existing archive."""
+    fp.seek(zinfo.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    fp.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+    return _LimitedReader(fp, zinfo.compress_size)
+
+
+class ZipPackager:
+    """Packages a directory into a zip archive, reusing unchanged members.
+
+    Args:
+        compression: 'auto' (store already-compressed formats, deflate the rest),
+            'deflate', 'store' or 'zstd' (falls back to deflate where unsupported)
+        level: Compression level for deflate/zstd
+        max_workers: Compression threads
+        incremental: Reuse unchanged members from the previous archive
+        manifest_dir: Where per-archive manifests are kept
+        content_store: Store the course files were written through; files
+            sharing a blob are compressed once and copied within the archive
+    """
+
+    def __init__(
+        self,
+        compression: str = "auto",
+        level: int = 6,
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        manifest_dir: str = DEFAULT_MANIFEST_DIR,
+        content_store: Optional[ContentStore] = None,
+    ):
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown compression '{compression}'. Choose from: {', '.join(COMPRESSION_MODES)}")
+        if compression == "zstd" and not zstd_available():
+            logger.warning("zstd zip members need Python 3.14+; using deflate instead")
+
+        self.compression = compression
+        self.level = level
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.incremental = incremental
+        self.manifest_dir = Path(manifest_dir)
+        self.content_store = content_store
+
+    def _manifest_path(self, zip_path: Path) -> Path:
+        key = hashlib.sha256(str(zip_path.resolve()).encode()).hexdigest()[:16]
+        return self.manifest_dir / f"{zip_path.stem}-{key}.json"
+
+    def _load_manifest(self, zip_path: Path) -> Dict[str, Dict]:
+        path = self._manifest_path(zip_path)
+        if not self.incremental or not zip_path.exists() or not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable zip manifest {path}: {e}")
+            return {}
+
+        # The archive must be the one the manifest describes
+        stat = zip_path.stat()
+        if manifest.get("archive_size") != stat.st_size or manifest.get("archive_mtime_ns") != stat.st_mtime_ns:
+            return {}
+        return manifest.get("members", {})
+
+    def _save_manifest(self, zip_path: Path, members: Dict[str, Dict]) -> None:
+        path = self._manifest_path(zip_path)
+        stat = zip_path.stat()
+        record = {
+            "archive": str(zip_path),
+            "archive_size": stat.st_size,
+            "archive_mtime_ns": stat.st_mtime_ns,
+            "members": members,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save zip manifest {path}: {e}")
+
+    def _scan(self, source_path: Path) -> List[_Member]:
+        members = []
+        # Packaging a folder that holds the store must not add the blobs themselves
+        store_root = os.path.abspath(self.content_store.root) + os.sep if self.content_store else None
+        for file_path in sorted(source_path.rglob("*")):
+            if store_root and os.path.abspath(file_path).startswith(store_root):
+                continue
+            if file_path.is_file():
+                stat = file_path.stat()
+                members.append(_Member(
+                    path=file_path,
+                    arcname=file_path.relative_to(source_path.parent).as_posix(),
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    digest=self.content_store.digest_of(file_path) if self.content_store else None,
+                ))
+        return members
+
+    def package(self, source_path: Path, zip_path: Path) -> PackageResult:
+        """Package ``source_path`` into ``zip_path``.
+
+        Member names are relative to the source folder's parent, so the
+        archive unpacks into a folder named like the source.
+
+        Raises:
+            OSError: If reading a file or writing the archive fails
+        """
+        source_path = Path(source_path)
+        zip_path = Path(zip_path)
+        members = self._scan(source_path)
+        result = PackageResult(zip_path=str(zip_path), file_count=len(members))
+        if not members:
+            return result
+
+        manifest = self._load_manifest(zip_path)
+        old_zip = zipfile.ZipFile(zip_path) if manifest else None
+        run = _PackageRun(old_zip=old_zip, manifest=manifest, result=result)
+
+        zip_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(zip_path.parent), suffix=".zip.tmp")
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zf, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                run.zf = zf
+                pending: Deque[_Pending] = deque()
+                window = self.max_workers * 2
+                queued_digests = set()
+
+                for member in members:
+                    pending.append(self._plan_member(member, manifest, old_zip, queued_digests, pool))
+                    while len(pending) >= window:
+                        run.write(pending.popleft())
+                while pending:
+                    run.write(pending.popleft())
+
+            os.replace(tmp_path, zip_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        finally:
+            if old_zip is not None:
+                old_zip.close()
+
+        result.archive_bytes = zip_path.stat().st_size
+        self._save_manifest(zip_path, run.new_manifest)
+        return result
+
+    def _plan_member(self, member: _Member, manifest, old_zip, queued_digests, pool) -> _Pending:
+        """Decide whether a member is deduplicated, reused or compressed."""
+        compress_type = resolve_compress_type(self.compression, member.path)
+
+        if member.digest is not None:
+            if (member.digest, compress_type) in queued_digests:
+                return _Pending(member=member, compress_type=compress_type, duplicate=True)
+            queued_digests.add((member.digest, compress_type))
+
+        previous = manifest.get(member.arcname)
+        old_info = None
+        if previous and old_zip is not None and previous.get("compress_type") == compress_type:
+            try:
+                old_info = old_zip.getinfo(member.arcname)
+            except KeyError:
+                previous = None
+
+        if old_info is not None and previous["size"] == member.size and previous["mtime_ns"] == member.mtime_ns:
+            return _Pending(member=member, compress_type=compress_type, old_info=old_info)
+
+        previous_sha256 = previous["sha256"] if old_info is not None else None
+        return _Pending(
+            member=member,
+            compress_type=compress_type,
+            old_info=old_info,
+            future=pool.submit(_compress_member, member, compress_type, self.level, previous_sha256),
+        )
+
+
+class _PackageRun:
+    """Writer-side state of one packaging run."""
+
+    def __init__(self, old_zip: Optional[zipfile.ZipFile], manifest: Dict[str, Dict], result: PackageResult):
+        self.zf: Optional[zipfile.ZipFile] = None
+        self.old_zip = old_zip
+        self.manifest = manifest
+        self.result = result
+        self.new_manifest: Dict[str, Dict] = {}
+        # (digest, compress_type) -> (written member info, offset of its compressed bytes)
+        self.written: Dict[Tuple[str, int], Tuple[zipfile.ZipInfo, int]] = {}
+
+    def write(self, item: _Pending) -> None:
+        member = item.member
+        compressed = item.future.result() if item.future is not None else None
+        zinfo = zipfile.ZipInfo.from_file(member.path, member.arcname, strict_timestamps=False)
+        # Read-only store blobs must not extract as read-only course files
+        zinfo.external_attr |= 0o200 << 16  # owner write
+
+        if item.duplicate:
+            # Same content already written in this archive: copy its compressed bytes
+            source, source_offset = self.written[(member.digest, item.compress_type)]
+            self._copy_info(zinfo, source)
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as spool:
+                self.zf.fp.seek(source_offset)
+                shutil.copyfileobj(_LimitedReader(self.zf.fp, source.compress_size), spool, CHUNK_SIZE)
+                spool.seek(0)
+                data_offset = _write_raw_member(self.zf, zinfo, spool)
+            sha256 = member.digest
+            self.result.deduplicated += 1
+        elif compressed is None or compressed.reuse:
+            # Unchanged content: copy the previous archive's compressed bytes
+            self._copy_info(zinfo, item.old_info)
+            data_offset = _write_raw_member(self.zf, zinfo, _raw_member_reader(self.old_zip.fp, item.old_info))
+            sha256 = self.manifest[member.arcname]["sha256"]
+            self.result.reused += 1
+        else:
+            zinfo.compress_type = compressed.compress_type
+            zinfo.CRC = compressed.crc
+            zinfo.compress_size = compressed.compress_size
+            zinfo.file_size = compressed.file_size
+            with compressed.data:
+                data_offset = _write_raw_member(self.zf, zinfo, compressed.data)
+            sha256 = compressed.sha256
+            self.result.compressed += 1
+
+        if member.digest is not None and not item.duplicate:
+            self.written[(member.digest, zinfo.compress_type)] = (zinfo, data_offset)
+
+        self.result.total_bytes += zinfo.file_size
+        self.new_manifest[member.arcname] = {
+            "size": zinfo.file_size,
+            "mtime_ns": member.mtime_ns,
+            "sha256": sha256,
+            "compress_type": zinfo.compress_type,
+        }
+
+    @staticmethod
+    def _copy_info(zinfo: zipfile.ZipInfo, source: zipfile.ZipInfo) -> None:
+        zinfo.compress_type = source.compress_type
+        zinfo.CRC = source.CRC
+        zinfo.compress_size = source.compress_size
+        zinfo.file_size = source.file_size
@@ -0,0 +1,193 @@
+"""Unit tests for batch curriculum generation."""
+
+import json
+
+import pytest
+
+from comprehensive_curriculum_creator.batch import (
+    COMPLETED,
+    FAILED,
+    OUTLINE_READY,
+    BatchRunner,
+    JobState,
+    approve_outline,
+    enter_job_dir,
+    load_specs,
+    shared_state_env,
+)
+from comprehensive_curriculum_creator.checkpoint import inputs_fingerprint
+
+SPEC = {
+    "topic": "Applied AI",
+    "duration": "4 weeks",
+    "sessions": 2,
+    "session_duration": "1 hour",
+    "project_based": "Yes",
+    "audience_level": "Non-tech",
+}
+
+
+@pytest.fixture
+def jsonl_specs(tmp_path):
+    """Catalog with two curricula."""
+    path = tmp_path / "catalog.jsonl"
+    second = dict(SPEC, topic="Data Literacy", id="data-101")
+    path.write_text(json.dumps(SPEC) + "\n\n" + json.dumps(second) + "\n")
+    return path
+
+
+class TestLoadSpecs:
+    """Test reading curriculum specs."""
+
+    def test_jsonl(self, jsonl_specs):
+        """Test specs are validated and normalized to crew inputs."""
+        specs = load_specs(str(jsonl_specs))
+
+        assert len(specs) == 2
+        assert specs[0].inputs["sessions"] == "2"
+        assert specs[0].inputs["project_based"] == "yes"
+        assert specs[0].job_id.startswith("Applied_AI_")
+        assert specs[1].job_id == "data-101"
+
+    def test_csv(self, tmp_path):
+        """Test CSV rows are read with the header as field names."""
+        path = tmp_path / "catalog.csv"
+        path.write_text(
+            "topic,duration,sessions,session_duration,project_based,audience_level\n"
+            "Applied AI,4 weeks,8,1 hour,no,Managers\n"
+        )
+
+        specs = load_specs(str(path))
+        assert specs[0].inputs["audience_level"] == "Managers"
+        assert specs[0].sessions == 8
+
+    def test_invalid_spec_reports_line(self, tmp_path):
+        """Test validation errors name the offending line."""
+        path = tmp_path / "catalog.jsonl"
+        path.write_text(json.dumps(SPEC) + "\n" + json.dumps(dict(SPEC, sessions=500)) + "\n")
+
+        with pytest.raises(ValueError, match="line 2"):
+            load_specs(str(path))
+
+    def test_duplicate_job_ids(self, tmp_path):
+        """Test two identical specs are rejected."""
+        path = tmp_path / "catalog.jsonl"
+        path.write_text(json.dumps(SPEC) + "\n" + json.dumps(SPEC) + "\n")
+
+        with pytest.raises(ValueError, match="Duplicate job id"):
+            load_specs(str(path))
+
+    def test_unsupported_type(self, tmp_path):
+        """Test unknown file types are rejected."""
+        path = tmp_path / "catalog.txt"
+        path.write_text("")
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            load_specs(str(path))
+
+
+class TestApprovalPolicy:
+    """Test the non-interactive approval checkpoint."""
+
+    OUTLINE = "## Module 1: Basics\n- Session 1: Intro\n- Session 2: Tools"
+
+    def test_policies(self, jsonl_specs):
+        """Test each policy's decision on an outline."""
+        spec = load_specs(str(jsonl_specs))[0]
+
+        assert approve_outline("auto", spec, "anything") is None
+        assert approve_outline("check", spec, self.OUTLINE) is None
+        assert "1 sessions" in approve_outline("check", spec, "## Module 1: Basics\n- Session 1: Intro")
+        assert approve_outline("outline-only", spec, self.OUTLINE) is not None
+
+
+class TestBatchRunner:
+    """Test progress tracking and resuming."""
+
+    def test_invalid_policy(self, tmp_path):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            BatchRunner(str(tmp_path), policy="always")
+
+    def test_completed_jobs_are_skipped(self, tmp_path, jsonl_specs):
+        """Test a rerun only runs jobs that did not complete."""
+        specs = load_specs(str(jsonl_specs))
+        progress = {
+            specs[0].job_id: JobState(status=COMPLETED, inputs_fingerprint=inputs_fingerprint(specs[0].inputs)),
+            specs[1].job_id: JobState(status=FAILED, inputs_fingerprint=inputs_fingerprint(specs[1].inputs)),
+        }
+
+        assert BatchRunner(str(tmp_path)).pending_jobs(specs, progress) == [specs[1]]
+
+    def test_changed_inputs_rerun(self, tmp_path, jsonl_specs):
+        """Test a completed job reruns when its spec changed."""
+        specs = load_specs(str(jsonl_specs))
+        progress = {specs[1].job_id: JobState(status=COMPLETED, inputs_fingerprint="old")}
+
+        assert specs[1] in BatchRunner(str(tmp_path)).pending_jobs(specs, progress)
+
+    def test_reviewed_outlines_continue_with_another_policy(self, tmp_path, jsonl_specs):
+        """Test outlines kept for review are developed once approved."""
+        specs = load_specs(str(jsonl_specs))[:1]
+        progress = {specs[0].job_id: JobState(status=OUTLINE_READY, inputs_fingerprint=inputs_fingerprint(specs[0].inputs))}
+
+        assert BatchRunner(str(tmp_path), policy="outline-only").pending_jobs(specs, progress) == []
+        assert BatchRunner(str(tmp_path), policy="auto").pending_jobs(specs, progress) == specs
+
+    def test_progress_round_trip(self, tmp_path, jsonl_specs):
+        """Test a batch with nothing to do keeps its progress file."""
+        specs = load_specs(str(jsonl_specs))
+        runner = BatchRunner(str(tmp_path))
+        runner.batch_dir.mkdir(parents=True, exist_ok=True)
+        runner._save_progress({
+            spec.job_id: JobState(status=COMPLETED, inputs_fingerprint=inputs_fingerprint(spec.inputs))
+            for spec in specs
+        })
+
+        progress = runner.run(specs)
+        assert {state.status for state in progress.values()} == {COMPLETED}
+        assert set(runner.load_progress()) == {spec.job_id for spec in specs}
+
+
+class TestSharedState:
+    """Test jobs in their own directories share the ledger and caches."""
+
+    @pytest.fixture
+    def shared_env(self, tmp_path, monkeypatch):
+        """Shared state resolved in the parent; the environment is restored afterwards."""
+        monkeypatch.chdir(tmp_path)
+        for var in ("COST_LEDGER_PATH", "RESEARCH_CACHE_BACKEND", "RESEARCH_CACHE_PATH",
+                    "RESEARCH_SUMMARY_CACHE_PATH", "RESEARCH_SEMANTIC_CACHE_PATH"):
+            monkeypatch.delenv(var, raising=False)
+        env = shared_state_env()
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
+        return env
+
+    def test_paths_are_absolute_and_the_cache_is_shareable(self, shared_env, tmp_path):
+        """Test every path is resolved against the parent and memory caching is replaced."""
+        assert shared_env["COST_LEDGER_PATH"] == str(tmp_path / "output" / ".cache" / "cost_ledger.json")
+        assert shared_env["RESEARCH_CACHE_PATH"] == str(tmp_path / "output" / ".cache" / "research_cache.db")
+        assert shared_env["RESEARCH_CACHE_BACKEND"] == "sqlite"
+
+    def test_two_jobs_share_one_ledger_and_research_cache(self, shared_env, tmp_path):
+        """Test spend and research of one job are seen by another job in another directory."""
+        from comprehensive_curriculum_creator.tools.deep_research_tool import DeepResearchTool, ResearchQuery
+
+        query = ResearchQuery(query="Photosynthesis", research_mode="quick", max_sources=10)
+        for job in ("job-a", "job-b"):
+            (tmp_path / "batch" / job).mkdir(parents=True)
+
+        enter_job_dir(str(tmp_path / "batch" / "job-a"), shared_env)
+        first = DeepResearchTool()
+        first._cache.set(first._generate_cache_key(query), "# Shared report")
+        first._get_budget_guard().ledger.add(2.0, "crew")
+
+        enter_job_dir(str(tmp_path / "batch" / "job-b"), shared_env)
+        second = DeepResearchTool()
+        second._get_budget_guard().ledger.add(1.0, "crew")
+
+        assert second._get_cached_result(query) == "# Shared report"
+        assert second._get_budget_guard().ledger.spent() == pytest.approx(3.0)
+        assert second._build_run_config(query)["configurable"]["summary_cache_path"] == shared_env["RESEARCH_SUMMARY_CACHE_PATH"]
+        assert not (tmp_path / "batch" / "job-a" / "output").exists()
@@ -0,0 +1,104 @@
+"""Unit tests for task output checkpoints."""
+
+import pytest
+from crewai.tasks.task_output import TaskOutput
+
+from comprehensive_curriculum_creator.checkpoint import CheckpointStore
+
+
+@pytest.fixture
+def inputs():
+    """Curriculum inputs the checkpoint belongs to."""
+    return {
+        'topic': 'Applied AI',
+        'duration': '4 weeks',
+        'sessions': '8',
+        'session_duration': '1 hour',
+        'project_based': 'yes',
+        'audience_level': 'Non-tech'
+    }
+
+
+@pytest.fixture
+def outline_output():
+    """Stage 1 outline task output."""
+    return TaskOutput(
+        name="create_curriculum_outline",
+        description="Create a comprehensive curriculum outline",
+        raw="## Module 1: Foundations\n- Session 1: What is AI?",
+        agent="Curriculum Architect"
+    )
+
+
+class TestCheckpointStore:
+    """Test cases for saving and loading task outputs."""
+
+    def test_round_trip(self, tmp_path, inputs, outline_output):
+        """Test a saved output loads back unchanged."""
+        store = CheckpointStore(str(tmp_path))
+        store.save("create_curriculum_outline", outline_output, inputs)
+
+        loaded = store.load("create_curriculum_outline", inputs)
+
+        assert loaded.raw == outline_output.raw
+        assert loaded.agent == "Curriculum Architect"
+        assert loaded.name == "create_curriculum_outline"
+
+    def test_different_inputs_are_ignored(self, tmp_path, inputs, outline_output):
+        """Test a checkpoint for other inputs is not reused."""
+        store = CheckpointStore(str(tmp_path))
+        store.save("create_curriculum_outline", outline_output, inputs)
+
+        assert store.load("create_curriculum_outline", {**inputs, 'topic': 'Quantum physics'}) is None
+
+    def test_missing_and_corrupt_checkpoints(self, tmp_path, inputs):
+        """Test missing or unreadable checkpoints load as None."""
+        store = CheckpointStore(str(tmp_path))
+        assert store.load("create_curriculum_outline") is None
+
+        (tmp_path / "create_curriculum_outline.json").write_text("{not json")
+        assert store.load("create_curriculum_outline") is None
+
+
+class TestTaskCheckpoints:
+    """Test checkpointing every task of a run for resuming."""
+
+    def _output(self, name):
+        return TaskOutput(name=name, description=f"Run {name}", raw=f"{name} result", agent="Agent")
+
+    def test_saver_checkpoints_task_outputs(self, tmp_path, inputs):
+        """Test the task callback stores each finished task under its name."""
+        store = CheckpointStore(str(tmp_path))
+        save = store.saver(inputs)
+        save(self._output("continue_course_development"))
+        save(self._output("research_course_content"))
+
+        completed = store.load_all(inputs)
+        assert set(completed) == {"continue_course_development", "research_course_content"}
+        assert completed["research_course_content"].raw == "research_course_content result"
+        assert store.load_all({**inputs, 'topic': 'Other'}) == {}
+
+    def test_saver_never_raises(self, tmp_path, inputs):
+        """Test a failed checkpoint write does not fail the crew."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        save = CheckpointStore(str(blocker)).saver(inputs)
+
+        save(self._output("continue_course_development"))
+
+    def test_load_inputs(self, tmp_path, inputs, outline_output):
+        """Test the inputs of a checkpointed run can be recovered for resuming."""
+        store = CheckpointStore(str(tmp_path))
+        assert store.load_inputs("create_curriculum_outline") is None
+
+        store.save("create_curriculum_outline", outline_output, inputs)
+        assert store.load_inputs("create_curriculum_outline") == inputs
+
+    def test_clear_keeps_selected_tasks(self, tmp_path, inputs, outline_output):
+        """Test a new run clears outputs of the previous one but keeps the outline."""
+        store = CheckpointStore(str(tmp_path))
+        store.save("create_curriculum_outline", outline_output, inputs)
+        store.save("develop_learning_materials", self._output("develop_learning_materials"), inputs)
+
+        store.clear(keep=["create_curriculum_outline"])
+        assert store.task_names() == ["create_curriculum_outline"]
@@ -0,0 +1,232 @@
+"""Unit tests for the content-addressed output store."""
+
+import os
+import stat
+import zipfile
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.content_store import FILE_INDEX_NAME, ContentStore, resolve_store_path
+from comprehensive_curriculum_creator.tools.custom_tool import (
+    BatchContentWriterTool,
+    ContentWriterTool,
+    ZipCreatorTool,
+    write_content_file,
+)
+from comprehensive_curriculum_creator.tools.zip_packager import ZipPackager
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(str(tmp_path / ".store"), link_mode="hardlink")
+
+
+class TestContentStore:
+    """Test storing, linking and pruning blobs."""
+
+    def test_identical_files_share_one_blob(self, store, tmp_path):
+        """Test files with the same content are hardlinks to a single blob."""
+        first = store.write_text(tmp_path / "a.md", "# Rubric")
+        second = store.write_text(tmp_path / "b.md", "# Rubric")
+
+        assert first == second
+        assert os.path.samefile(tmp_path / "a.md", tmp_path / "b.md")
+        assert os.path.samefile(tmp_path / "a.md", store.blob_path(first))
+        assert len(list(store.root.rglob("*"))) == 2  # shard directory and blob
+
+    def test_blobs_are_read_only(self, store, tmp_path):
+        """Test stored blobs cannot be written in place."""
+        digest = store.write_text(tmp_path / "a.md", "content")
+
+        assert not os.stat(store.blob_path(digest)).st_mode & 0o222
+
+    def test_rewriting_a_linked_file_leaves_others_alone(self, store, tmp_path):
+        """Test the writer replaces a linked file instead of editing the shared blob."""
+        store.write_text(tmp_path / "a.md", "shared")
+        store.write_text(tmp_path / "b.md", "shared")
+
+        result = write_content_file(str(tmp_path / "a.md"), "edited", store=store)
+
+        assert result.startswith("Successfully wrote")
+        assert (tmp_path / "a.md").read_text() == "edited"
+        assert (tmp_path / "b.md").read_text() == "shared"
+
+    def test_digest_of(self, store, tmp_path):
+        """Test the digest of a linked file is known; unlinked files have none."""
+        digest = store.write_text(tmp_path / "a.md", "content")
+        (tmp_path / "plain.md").write_text("content")
+
+        assert ContentStore(str(store.root)).digest_of(tmp_path / "a.md") == digest
+        assert store.digest_of(tmp_path / "plain.md") is None
+
+    def test_digest_of_edited_in_place(self, store, tmp_path):
+        """Test a linked file edited in place is no longer trusted to match its blob."""
+        store.write_text(tmp_path / "a.md", "content")
+        store.write_text(tmp_path / "b.md", "content")
+        os.chmod(tmp_path / "a.md", 0o644)
+        (tmp_path / "a.md").write_text("edited")
+
+        assert store.digest_of(tmp_path / "b.md") is None
+
+    def test_default_mode_writes_independent_writable_files(self, tmp_path):
+        """Test the default mode gives every course file its own writable copy."""
+        store = ContentStore(str(tmp_path / ".store"))
+        digest = store.write_text(tmp_path / "a.md", "shared")
+        store.write_text(tmp_path / "b.md", "shared")
+
+        assert not os.path.samefile(tmp_path / "a.md", tmp_path / "b.md")
+        assert os.stat(tmp_path / "a.md").st_mode & stat.S_IWUSR
+        (tmp_path / "a.md").write_text("edited")
+        assert (tmp_path / "b.md").read_text() == "shared"
+        assert store.blob_path(digest).read_text() == "shared"
+        assert store.digest_of(tmp_path / "a.md") is None
+
+    @pytest.mark.parametrize("link_mode", ["reflink", "copy"])
+    def test_digest_of_cloned_and_copied_files(self, tmp_path, link_mode):
+        """Test independent files are known to any store instance until they are edited."""
+        store = ContentStore(str(tmp_path / ".store"), link_mode=link_mode)
+        digest = store.write_text(tmp_path / "a.md", "shared")
+        store.write_text(tmp_path / "b.md", "shared")
+        (tmp_path / "plain.md").write_text("shared")
+
+        fresh = ContentStore(str(store.root))
+        assert fresh.digest_of(tmp_path / "a.md") == digest
+        assert fresh.digest_of(tmp_path / "b.md") == digest
+        assert fresh.digest_of(tmp_path / "plain.md") is None
+
+        (tmp_path / "a.md").write_text("edits!")  # same size, new mtime
+        (tmp_path / "b.md").write_text("longer edit")
+        assert fresh.digest_of(tmp_path / "a.md") is None
+        assert fresh.digest_of(tmp_path / "b.md") is None
+
+    def test_copy_mode(self, tmp_path):
+        """Test copy mode writes independent files."""
+        store = ContentStore(str(tmp_path / ".store"), link_mode="copy")
+        store.write_text(tmp_path / "a.md", "content")
+
+        assert (tmp_path / "a.md").read_text() == "content"
+        assert os.stat(tmp_path / "a.md").st_nlink == 1
+        assert store.prune() == 0
+
+    def test_prune_removes_unreferenced_blobs(self, store, tmp_path):
+        """Test blobs no file links to are removed."""
+        kept = store.write_text(tmp_path / "a.md", "kept")
+        dropped = store.write_text(tmp_path / "b.md", "dropped")
+        (tmp_path / "b.md").unlink()
+
+        assert store.prune() == 1
+        assert store.blob_path(kept).exists()
+        assert not store.blob_path(dropped).exists()
+
+    def test_invalid_link_mode(self, tmp_path):
+        """Test an unknown link mode is rejected."""
+        with pytest.raises(ValueError):
+            ContentStore(str(tmp_path), link_mode="symlink")
+
+    def test_writer_tool_uses_store(self, tmp_path):
+        """Test the content writer tool writes through the configured store."""
+        tool = ContentWriterTool(content_store_path=str(tmp_path / ".store"))
+        tool._run(str(tmp_path / "a.md"), "same")
+        tool._run(str(tmp_path / "b.md"), "same")
+
+        assert (tmp_path / "b.md").read_text() == "same"
+        assert len([p for p in (tmp_path / ".store").rglob("*") if p.is_file() and p.name != FILE_INDEX_NAME]) == 1
+
+    def test_writer_tool_store_is_opt_in(self, tmp_path):
+        """Test the content writer tool writes plain files by default."""
+        assert ContentWriterTool().content_store_path is None
+
+
+class TestStoreConfiguration:
+    """Test the pipeline writes and packages course files through one store."""
+
+    def test_resolve_store_path(self, tmp_path, monkeypatch):
+        """Test the path is absolute, the environment overrides it and an empty value disables it."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CONTENT_STORE_PATH", raising=False)
+        assert resolve_store_path() == str(tmp_path / "output" / ".store")
+        assert resolve_store_path(None) is None
+
+        monkeypatch.setenv("CONTENT_STORE_PATH", str(tmp_path / "shared"))
+        assert resolve_store_path() == str(tmp_path / "shared")
+        monkeypatch.setenv("CONTENT_STORE_PATH", "")
+        assert resolve_store_path() is None
+
+    def test_crew_tools_share_the_configured_store(self, tmp_path, monkeypatch):
+        """Test the organizer's writer and zip tools all use the configured store."""
+        from comprehensive_curriculum_creator.crew import ComprehensiveCurriculumCreatorCrew
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CONTENT_STORE_PATH", raising=False)
+        tools = ComprehensiveCurriculumCreatorCrew().course_structure_organizer().tools
+
+        paths = {type(tool).__name__: tool.content_store_path for tool in tools if hasattr(tool, "content_store_path")}
+        assert set(paths) == {"ZipCreatorTool", "ContentWriterTool", "BatchContentWriterTool"}
+        assert set(paths.values()) == {str(tmp_path / "output" / ".store")}
+
+    def test_written_course_is_deduplicated_in_the_zip(self, tmp_path, monkeypatch):
+        """Test files written by the tools in the default mode are compressed once when zipped."""
+        monkeypatch.chdir(tmp_path)
+        store_path = str(tmp_path / "output" / ".store")
+        homework = "# Homework template\n" + "Answer every question.\n" * 200
+
+        ContentWriterTool(content_store_path=store_path)._run("output/course/README.md", "# Course")
+        BatchContentWriterTool(content_store_path=store_path)._run(files=[
+            {"path": f"output/course/Session_{session}/homework.md", "content": homework} for session in range(1, 4)
+        ])
+        result = ZipCreatorTool(content_store_path=store_path)._run("output", "course")
+
+        assert "with 4 files" in result
+        assert "(2 compressed, 0 unchanged, 2 duplicate)" in result
+        with zipfile.ZipFile(tmp_path / "output" / "course.zip") as zf:
+            assert zf.testzip() is None
+            assert sorted(zf.namelist()) == [
+                "output/course/README.md",
+                *(f"output/course/Session_{session}/homework.md" for session in range(1, 4)),
+            ]
+            assert zf.read("output/course/Session_2/homework.md").decode() == homework
+
+
+class TestZipDeduplication:
+    """Test packaging files that share content."""
+
+    def test_identical_members_are_compressed_once(self, store, tmp_path):
+        """Test duplicates are copied within the archive and read back correctly."""
+        course = tmp_path / "course"
+        content = "# Homework template\n" + "Answer every question.\n" * 200
+        for session in range(1, 4):
+            store.write_text(_mkdir(course / f"Session_{session}") / "homework.md", content)
+        store.write_text(course / "README.md", "# Course")
+
+        zip_path = tmp_path / "course.zip"
+        result = ZipPackager(content_store=store, manifest_dir=str(tmp_path / "manifests")).package(course, zip_path)
+
+        assert result.file_count == 4
+        assert result.compressed == 2
+        assert result.deduplicated == 2
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            for session in range(1, 4):
+                assert zf.read(f"course/Session_{session}/homework.md").decode() == content
+            assert zf.read("course/README.md") == b"# Course"
+
+        again = ZipPackager(content_store=store, manifest_dir=str(tmp_path / "manifests")).package(course, zip_path)
+        assert again.compressed == 0
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+
+    def test_members_of_read_only_blobs_extract_writable(self, store, tmp_path):
+        """Test hardlinked files do not become read-only members."""
+        course = tmp_path / "course"
+        store.write_text(_mkdir(course) / "README.md", "# Course")
+
+        zip_path = tmp_path / "course.zip"
+        ZipPackager(content_store=store, manifest_dir=str(tmp_path / "manifests")).package(course, zip_path)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert (zf.getinfo("course/README.md").external_attr >> 16) & stat.S_IWUSR
+
+
+def _mkdir(path):
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,93 @@
+"""Unit tests for the content writer tools."""
+
+import json
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.custom_tool import BatchContentWriterTool, ContentWriterTool
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path_factory, monkeypatch):
+    """Keep the default content store out of the working tree and the written folders."""
+    monkeypatch.chdir(tmp_path_factory.mktemp("cwd"))
+
+
+class TestContentWriterTool:
+    """Test single-file writes."""
+
+    def test_writes_file_and_adds_extension(self, tmp_path):
+        """Test content is written with the file type as extension."""
+        result = ContentWriterTool()._run(str(tmp_path / "Session_1" / "notes"), "# Notes", "md")
+
+        assert result.startswith("Successfully wrote 7 characters")
+        assert (tmp_path / "Session_1" / "notes.md").read_text() == "# Notes"
+
+    def test_no_temporary_files_left(self, tmp_path):
+        """Test the atomic write leaves only the target file behind."""
+        ContentWriterTool()._run(str(tmp_path / "notes.md"), "first")
+        ContentWriterTool()._run(str(tmp_path / "notes.md"), "second")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["notes.md"]
+        assert (tmp_path / "notes.md").read_text() == "second"
+
+
+class TestBatchContentWriterTool:
+    """Test writing many files in one call."""
+
+    def test_writes_all_entries(self, tmp_path):
+        """Test every entry is written and reported."""
+        files = [
+            {"path": str(tmp_path / "Module_1" / f"session_{i}"), "content": f"Session {i}", "type": "md"}
+            for i in range(20)
+        ]
+
+        result = BatchContentWriterTool(max_workers=4)._run(files=files)
+
+        assert result.splitlines()[0] == "Wrote 20 of 20 files"
+        assert len(result.splitlines()) == 21
+        assert (tmp_path / "Module_1" / "session_7.md").read_text() == "Session 7"
+
+    def test_manifest_and_failures(self, tmp_path):
+        """Test manifest entries are written and failures reported per file."""
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"files": [
+            {"path": str(tmp_path / "guide.md"), "content": "Guide"},
+            {"path": str(tmp_path / "a" / ".." / "escape.md"), "content": "Nope"},
+        ]}))
+
+        result = BatchContentWriterTool()._run(manifest=str(manifest))
+
+        assert result.splitlines()[0] == "Wrote 1 of 2 files"
+        assert "unsafe '..'" in result
+        assert (tmp_path / "guide.md").read_text() == "Guide"
+
+    def test_duplicate_paths_keep_last_entry(self, tmp_path):
+        """Test a path listed twice is written once with the last content."""
+        path = str(tmp_path / "overview.md")
+
+        result = BatchContentWriterTool()._run(files=[
+            {"path": path, "content": "draft"},
+            {"path": path, "content": "final"},
+        ])
+
+        assert result.splitlines()[0] == "Wrote 1 of 1 files"
+        assert (tmp_path / "overview.md").read_text() == "final"
+
+    def test_paths_resolving_to_one_file_keep_last_entry(self, tmp_path):
+        """Test entries that differ only by the added extension are written once."""
+        result = BatchContentWriterTool()._run(files=[
+            {"path": str(tmp_path / "overview"), "content": "draft", "type": "md"},
+            {"path": str(tmp_path / "." / "overview.md"), "content": "final"},
+        ])
+
+        assert result.splitlines()[0] == "Wrote 1 of 1 files"
+        assert (tmp_path / "overview.md").read_text() == "final"
+
+    def test_empty_batch(self):
+        """Test a call without entries is a validation error."""
+        assert BatchContentWriterTool()._run().startswith("Validation error")
+
+    def test_missing_manifest(self, tmp_path):
+        """Test an unreadable manifest is reported."""
+        assert BatchContentWriterTool()._run(manifest=str(tmp_path / "missing.json")).startswith("Error reading manifest")
@@ -0,0 +1,226 @@
+"""Unit tests for cost tracking and budget enforcement."""
+
+import subprocess
+import sys
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from comprehensive_curriculum_creator.cost_budget import (
+    BudgetExceededError,
+    BudgetGuard,
+    CostLedger,
+    CostMeter,
+    CostSettings,
+    resolve_ledger_path,
+)
+from comprehensive_curriculum_creator.llm_registry import LLMRegistry
+from comprehensive_curriculum_creator.tools.deep_research_tool import DeepResearchTool, ResearchQuery
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """Empty ledger in a temporary directory."""
+    return CostLedger(str(tmp_path / "cost_ledger.json"))
+
+
+def make_guard(ledger, **settings):
+    """Guard with a $100 monthly budget unless overridden."""
+    return BudgetGuard(CostSettings(**{"monthly_budget_limit": 100.0, **settings}), ledger)
+
+
+def llm_result(model, input_tokens, output_tokens):
+    """LangChain chat result with usage metadata."""
+    message = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": input_tokens, "output_tokens": output_tokens,
+                        "total_tokens": input_tokens + output_tokens},
+        response_metadata={"model_name": model},
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+class TestCostLedger:
+    """Test persisted monthly totals."""
+
+    def test_totals_per_kind_run_and_mode(self, ledger):
+        """Test spend is summed per month, kind, run and research mode."""
+        ledger.add(1.5, "research", run_id="run-1", research_mode="deep")
+        ledger.add(0.5, "research", run_id="run-1", research_mode="deep")
+        total = ledger.add(2.0, "crew", run_id="run-1")
+
+        month = CostLedger(str(ledger.path)).month()
+        assert total == pytest.approx(4.0)
+        assert month["research_usd"] == pytest.approx(2.0)
+        assert month["crew_usd"] == pytest.approx(2.0)
+        assert month["research_calls"] == 2
+        assert month["runs"]["run-1"] == pytest.approx(4.0)
+        assert ledger.average_research_cost("deep") == pytest.approx(1.0)
+        assert ledger.average_research_cost("quick") is None
+
+
+class TestSharedLedger:
+    """Test every process resolves the same absolute ledger."""
+
+    def test_resolution_order(self, tmp_path, monkeypatch):
+        """Test the environment wins over the config, and relative paths become absolute."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("COST_LEDGER_PATH", raising=False)
+
+        assert resolve_ledger_path() == str(tmp_path / "output" / ".cache" / "cost_ledger.json")
+        assert resolve_ledger_path(CostSettings(ledger_path="shared/ledger.json")) == str(tmp_path / "shared" / "ledger.json")
+        monkeypatch.setenv("COST_LEDGER_PATH", str(tmp_path / "env.json"))
+        assert resolve_ledger_path(CostSettings(ledger_path="shared/ledger.json")) == str(tmp_path / "env.json")
+
+    def test_processes_in_different_directories_share_a_total(self, tmp_path, monkeypatch):
+        """Test two processes with different working directories add to one ledger."""
+        monkeypatch.delenv("COST_LEDGER_PATH", raising=False)
+        ledger_path = tmp_path / "shared" / "cost_ledger.json"
+        config_path = tmp_path / "research_config.yaml"
+        config_path.write_text(f"cost_management:\n  ledger_path: {ledger_path}\n")
+        script = (
+            "import sys\n"
+            "from comprehensive_curriculum_creator.cost_budget import BudgetGuard\n"
+            "BudgetGuard.from_config_file(sys.argv[1]).record_crew(1.5)\n"
+        )
+
+        for job in ("job-a", "job-b"):
+            (tmp_path / job).mkdir()
+            subprocess.run([sys.executable, "-c", script, str(config_path)], cwd=tmp_path / job, check=True)
+
+        assert CostLedger(str(ledger_path)).spent() == pytest.approx(3.0)
+        assert not (tmp_path / "job-a" / "output").exists()
+
+
+class TestBudgetGuard:
+    """Test downgrade and refusal decisions."""
+
+    def test_under_threshold_runs_as_requested(self, ledger):
+        """Test research is unchanged while the budget is healthy."""
+        ledger.add(10.0, "crew")
+        plan = make_guard(ledger).plan_research("deep")
+
+        assert plan.allowed and plan.research_mode == "deep" and not plan.downgrade_model
+
+    def test_near_limit_downgrades(self, ledger):
+        """Test mode and model are downgraded past the alert threshold."""
+        ledger.add(85.0, "crew")
+        guard = make_guard(ledger)
+        plan = guard.plan_research("deep")
+
+        assert plan.allowed
+        assert plan.research_mode == "quick"
+        assert plan.downgrade_model
+        assert guard.crew_model_overrides() == {"gpt-4o": "gpt-4o-mini"}
+        assert guard.downgrade_model("openai:gpt-4o") == "gpt-4o-mini"
+
+    def test_budget_used_up_refuses_research(self, ledger):
+        """Test no research runs once the monthly budget is spent."""
+        ledger.add(100.0, "research")
+        plan = make_guard(ledger).plan_research("quick")
+
+        assert not plan.allowed
+        assert "used up" in plan.reason
+
+    def test_expensive_mode_is_downgraded(self, ledger):
+        """Test a mode averaging above the per-research limit is downgraded."""
+        ledger.add(8.0, "research", research_mode="academic")
+        plan = make_guard(ledger, max_cost_per_research=5.0).plan_research("academic")
+
+        assert plan.research_mode == "deep"
+        assert not plan.downgrade_model
+
+    def test_tracking_disabled(self, ledger):
+        """Test nothing is enforced or recorded when tracking is off."""
+        ledger.add(500.0, "crew")
+        guard = make_guard(ledger, enable_cost_tracking=False)
+
+        assert guard.plan_research("deep").allowed
+        assert guard.crew_model_overrides() == {}
+        guard.record_crew(5.0)
+        assert ledger.spent() == pytest.approx(500.0)
+
+
+class TestCostMeter:
+    """Test pricing LangChain LLM calls."""
+
+    def test_prices_calls_and_enforces_limit(self):
+        """Test usage is priced per model and the run stops above its limit."""
+        meter = CostMeter(limit_usd=1.0)
+        meter.on_llm_end(llm_result("gpt-4o-2024-08-06", 100_000, 10_000))
+        assert meter.cost_usd == pytest.approx(0.35)  # snapshots are priced like their base model
+        meter.on_llm_end(llm_result("gpt-4o", 100_000, 10_000))
+        assert meter.cost_usd == pytest.approx(0.70)
+        assert meter.prompt_tokens == 200_000
+
+        with pytest.raises(BudgetExceededError):
+            meter.on_llm_end(llm_result("gpt-4o", 200_000, 0))
+
+    def test_research_spend_is_recorded(self, ledger):
+        """Test a metered research run is added to the ledger."""
+        guard = make_guard(ledger)
+        meter = guard.meter()
+        meter.on_llm_end(llm_result("gpt-4o-mini", 1_000_000, 0))
+        guard.record_research(meter, "quick", run_id="run-2")
+
+        assert ledger.month()["runs"]["run-2"] == pytest.approx(0.15)
+
+
+class TestModelOverrides:
+    """Test budget model replacements for the crew."""
+
+    def test_overrides_apply_to_agent_settings(self, tmp_path):
+        """Test agents built after an override use the cheaper model."""
+        path = tmp_path / "llm_config.yaml"
+        path.write_text("defaults:\n  model: gpt-4o\n")
+        registry = LLMRegistry(str(path))
+
+        registry.set_model_overrides({"gpt-4o": "gpt-4o-mini"})
+        assert registry.agent_settings("curriculum_architect")["model"] == "gpt-4o-mini"
+        registry.set_model_overrides({})
+        assert registry.agent_settings("curriculum_architect")["model"] == "gpt-4o"
+
+
+class TestDeepResearchToolBudget:
+    """Test the research tool applies the budget before researching."""
+
+    def _tool(self, ledger):
+        return DeepResearchTool(cache_enabled=False, cost_ledger_path=str(ledger.path))
+
+    def test_near_limit_query_is_downgraded(self, ledger):
+        """Test the query runs in a cheaper mode on a cheaper model."""
+        ledger.add(450.0, "crew")
+        tool = self._tool(ledger)
+        query = ResearchQuery(query="Photosynthesis", research_mode="academic")
+
+        assert tool._apply_budget(query) is None
+        assert query.research_mode == "deep"
+        assert query.model_override == "gpt-4o-mini"
+        assert tool._build_run_config(query)["configurable"]["research_model"] == "openai:gpt-4o-mini"
+
+    def test_budget_used_up_skips_research(self, ledger):
+        """Test the tool returns a message instead of researching."""
+        ledger.add(500.0, "crew")
+
+        result = self._tool(ledger)._run("Photosynthesis", research_mode="quick")
+        assert result.startswith("Research skipped")
+
+    def test_cached_result_is_served_before_the_budget(self, ledger):
+        """Test a cached report is returned even when the budget is used up."""
+        tool = DeepResearchTool(cost_ledger_path=str(ledger.path))
+        query = ResearchQuery(query="Photosynthesis", research_mode="academic")
+        tool._cache.set(tool._generate_cache_key(query), "# Cached report")
+        ledger.add(500.0, "crew")
+
+        assert tool._run("Photosynthesis", research_mode="academic") == "# Cached report"
+        assert tool._run("Respiration", research_mode="academic").startswith("Research skipped")
+
+    def test_downgraded_query_uses_its_own_cache_entry(self, ledger):
+        """Test a downgraded query finds the report of an earlier downgraded run."""
+        tool = DeepResearchTool(cost_ledger_path=str(ledger.path))
+        downgraded = ResearchQuery(query="Photosynthesis", research_mode="deep", model_override="gpt-4o-mini")
+        tool._cache.set(tool._generate_cache_key(downgraded), "# Downgraded report")
+        ledger.add(450.0, "crew")
+
+        assert tool._run("Photosynthesis", research_mode="academic") == "# Downgraded report"
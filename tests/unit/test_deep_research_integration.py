@@ -1,8 +1,9 @@
 """Unit tests for Deep Research Tool integration."""
 
+import asyncio
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
 
 # Import the tool to test
@@ -11,6 +12,7 @@ from comprehensive_curriculum_creator.tools.deep_research_tool import (
     ResearchQuery,
     ResearchResult
 )
+from comprehensive_curriculum_creator.tools.research_cache import MemoryResearchCache
 
 
 class TestResearchQuery:
@@ -200,7 +202,7 @@ class TestDeepResearchTool:
     def test_run_method_with_caching(self, mock_execute, tool):
         """Test research execution with caching enabled."""
         # Setup cache
-        tool._cache = {}
+        tool._cache = MemoryResearchCache()
 
         # First call
         mock_result = ResearchResult(
@@ -346,15 +348,98 @@ class TestAsyncFunctionality:
         """Create tool instance for async testing."""
         return DeepResearchTool()
 
-    @patch('comprehensive_curriculum_creator.tools.deep_research_tool.DeepResearchTool._run')
-    async def test_arun_method(self, mock_run, tool):
-        """Test async run method."""
-        mock_run.return_value = "Test result"
+    @pytest.fixture
+    def mock_result(self):
+        """Research result returned by the mocked graph execution."""
+        return ResearchResult(
+            summary="Async summary",
+            key_findings=["Async finding"],
+            sources=[],
+            methodology="Test method",
+            confidence_score=0.8
+        )
+
+    def test_arun_method(self, tool, mock_result):
+        """Test async run method awaits the research graph instead of the sync path."""
+        with patch.object(tool, '_aexecute_research', AsyncMock(return_value=mock_result)) as mock_aexecute, \
+                patch.object(tool, '_run') as mock_run:
+            result = asyncio.run(tool._arun("Test query"))
+
+        assert "Async summary" in result
+        mock_aexecute.assert_awaited_once()
+        mock_run.assert_not_called()
+
+    def test_arun_uses_cache(self, tool, mock_result):
+        """Test async run returns cached results on repeated queries."""
+        with patch.object(tool, '_aexecute_research', AsyncMock(return_value=mock_result)) as mock_aexecute:
+            result1 = asyncio.run(tool._arun("Test query"))
+            result2 = asyncio.run(tool._arun("Test query"))
+
+        assert result1 == result2
+        assert mock_aexecute.await_count == 1
+
+    def test_research_timeout_enforced(self):
+        """Test that a slow research graph is cancelled after the timeout."""
+        tool = DeepResearchTool(cache_enabled=False)
+
+        async def slow_ainvoke(*args, **kwargs):
+            await asyncio.sleep(5)
+
+        graph = Mock(ainvoke=slow_ainvoke)
+        with patch.object(tool, '_load_deep_researcher', return_value=graph), \
+                patch.object(tool, '_get_research_timeout', return_value=0.05):
+            result = tool._run("Test query")
+
+        assert "timeout" in result.lower()
+
+    def test_execute_research_runs_graph(self, tool):
+        """Test the sync path runs the graph and parses its final report."""
+        graph = Mock(ainvoke=AsyncMock(return_value={
+            "final_report": "# Report\n\nIntro paragraph.\n\n- Point one\n- Point two\n\n### Sources\n[1] Example: https://example.com\n"
+        }))
+        query = ResearchQuery(query="Test query", research_mode="quick")
+
+        with patch.object(tool, '_load_deep_researcher', return_value=graph):
+            result = tool._execute_research(query)
+
+        assert result.summary == "Intro paragraph."
+        assert result.key_findings == ["Point one", "Point two"]
+        assert result.sources[0]["url"] == "https://example.com"
+        run_config = graph.ainvoke.call_args[0][1]
+        assert run_config["configurable"]["allow_clarification"] is False
+
+
+class TestResearchModeConfiguration:
+    """Test mapping of research modes onto Open Deep Research configuration."""
+
+    @pytest.fixture
+    def tool(self):
+        """Create tool instance using the packaged research_config.yaml."""
+        return DeepResearchTool()
+
+    def test_quick_mode_overrides(self, tool):
+        """Test quick mode maps to a small, fast research configuration."""
+        query = ResearchQuery(query="Test", research_mode="quick")
+        configurable = tool._build_run_config(query)["configurable"]
+
+        assert configurable["research_model"] == "openai:gpt-4o-mini"
+        assert configurable["max_researcher_iterations"] == 3
+        assert configurable["max_concurrent_research_units"] == 2
+
+    def test_academic_mode_overrides(self, tool):
+        """Test academic mode picks up its own search API."""
+        query = ResearchQuery(query="Test", research_mode="academic")
+        configurable = tool._build_run_config(query)["configurable"]
+
+        assert configurable["search_api"] == "openai"
+        assert configurable["max_researcher_iterations"] == 8
 
-        result = await tool._arun("Test query")
+    def test_timeout_capped_by_research_timeout(self):
+        """Test the mode timeout never exceeds the tool's research_timeout."""
+        tool = DeepResearchTool(research_timeout=300)
 
-        assert result == "Test result"
-        mock_run.assert_called_once_with("Test query")
+        assert tool._get_research_timeout(ResearchQuery(query="Test", research_mode="quick")) == 300
+        assert DeepResearchTool()._get_research_timeout(ResearchQuery(query="Test", research_mode="quick")) == 600
 
 
 class TestIntegrationPoints:
@@ -0,0 +1,69 @@
+"""Unit tests for the curriculum folder organizer."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.custom_tool import FileOrganizerTool, plan_curriculum_directories
+
+STRUCTURE = {
+    "Foundations": {"1": {"1": {}, "2": {}}},
+    "???": {"2": {"3": {}}},
+    "Capstone": "not a dict",
+}
+
+
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    """Run the tool with ./output inside a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestDirectoryPlan:
+    """Test the one-pass directory plan."""
+
+    def test_plan_contents(self):
+        """Test every level is planned once, parents first, with numbered unnamed modules."""
+        plan = [p.as_posix() for p in plan_curriculum_directories(Path("output/AI"), STRUCTURE)]
+
+        assert plan[:2] == ["output/AI", "output/AI/Course_Overview_and_Guide"]
+        assert "output/AI/Module_Module_2/Week_2/Session_3/Homework" in plan
+        assert "output/AI/Module_Capstone" in plan
+        assert len(plan) == len(set(plan)) == 16
+        assert plan.index("output/AI/Module_Foundations/Week_1") < plan.index("output/AI/Module_Foundations/Week_1/Session_1")
+
+    def test_large_structure(self):
+        """Test a 52-week course plans quickly and completely."""
+        structure = {f"Track {t}": {str(w): {str(s): {} for s in range(1, 4)} for w in range(1, 53)} for t in range(4)}
+
+        plan = plan_curriculum_directories(Path("output/Big"), structure)
+
+        assert len(plan) == 2 + 4 * (1 + 52 * (1 + 3 * 3))
+
+
+class TestFileOrganizerTool:
+    """Test creating the folder structure."""
+
+    def test_creates_directories(self, in_tmp):
+        """Test the planned directories exist afterwards and the plan is returned as JSON."""
+        result = json.loads(FileOrganizerTool()._run("Applied AI", STRUCTURE))
+
+        assert result["message"].startswith("Successfully created curriculum folder structure")
+        assert result["directory_count"] == 16
+        for directory in result["directories"]:
+            assert (in_tmp / directory).is_dir()
+
+    def test_dry_run_creates_nothing(self, in_tmp):
+        """Test dry-run only reports the plan."""
+        result = json.loads(FileOrganizerTool()._run("Applied AI", STRUCTURE, dry_run=True))
+
+        assert result["dry_run"] is True
+        assert result["directory_count"] == 16
+        assert not (in_tmp / "output").exists()
+
+    def test_validation(self, in_tmp):
+        """Test invalid input is reported as a validation error."""
+        assert FileOrganizerTool()._run("", STRUCTURE).startswith("Validation error")
+        assert FileOrganizerTool()._run("AI", {}).startswith("Validation error")
@@ -0,0 +1,143 @@
+"""Unit tests for crew run instrumentation."""
+
+import asyncio
+import datetime
+import json
+from types import SimpleNamespace
+
+import pytest
+from crewai import Agent, Crew, LLM, Task
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+
+from comprehensive_curriculum_creator.instrumentation import (
+    MetricsRecorder,
+    get_recorder,
+    set_recorder,
+    timed_tool,
+)
+
+
+class FakeTool:
+    """Minimal tool with instrumented run methods."""
+    name = "Fake Tool"
+
+    @timed_tool
+    def _run(self, fail=False):
+        if fail:
+            raise RuntimeError("broken")
+        return "done"
+
+    @timed_tool
+    async def _arun(self):
+        return "async done"
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """Recorder writing to a temporary directory, reset after the test."""
+    recorder = MetricsRecorder(str(tmp_path / "run.jsonl"), prometheus_path=str(tmp_path / "crew.prom"))
+    set_recorder(recorder)
+    yield recorder
+    set_recorder(None)
+
+
+def read_events(recorder, event):
+    """Events of one type from the JSONL file."""
+    lines = recorder.jsonl_path.read_text().splitlines()
+    return [record for record in map(json.loads, lines) if record["event"] == event]
+
+
+class TestTimedTool:
+    """Test tool call timings."""
+
+    def test_sync_and_async_calls_are_recorded(self, recorder):
+        """Test successful calls are reported with their result size."""
+        tool = FakeTool()
+        assert tool._run() == "done"
+        assert asyncio.run(tool._arun()) == "async done"
+
+        events = read_events(recorder, "tool")
+        assert [event["status"] for event in events] == ["ok", "ok"]
+        assert events[1]["result_chars"] == len("async done")
+        assert recorder.tools["Fake Tool"]["calls"] == 2
+
+    def test_errors_are_recorded_and_raised(self, recorder):
+        """Test a failing call is recorded as an error and still raises."""
+        with pytest.raises(RuntimeError):
+            FakeTool()._run(fail=True)
+
+        assert read_events(recorder, "tool")[0]["error"] == "broken"
+        assert recorder.tools["Fake Tool"]["errors"] == 1
+
+    def test_no_recorder(self):
+        """Test tools run normally when nothing is recording."""
+        set_recorder(None)
+        assert FakeTool()._run() == "done"
+
+
+class TestTaskMetrics:
+    """Test per-task timings, tokens and costs."""
+
+    def _agent(self, prompt, completion):
+        token_process = TokenProcess()
+        token_process.sum_prompt_tokens(prompt)
+        token_process.sum_completion_tokens(completion)
+        return SimpleNamespace(role="Researcher", llm=SimpleNamespace(model="gpt-4o"), _token_process=token_process)
+
+    def test_tasks_of_an_agent_get_their_own_usage(self, recorder):
+        """Test token usage is the agent's usage since its previous task."""
+        agent = self._agent(1000, 100)
+        start = datetime.datetime.now()
+        first = SimpleNamespace(name="research", agent=agent, start_time=start,
+                                end_time=start + datetime.timedelta(seconds=2))
+        recorder.record_task(first)
+
+        agent._token_process.sum_prompt_tokens(500)
+        second = SimpleNamespace(name="design", agent=agent, start_time=start, end_time=start)
+        recorder.record_task(second)
+
+        tasks = read_events(recorder, "task")
+        assert tasks[0]["prompt_tokens"] == 1000
+        assert tasks[0]["seconds"] == 2
+        assert tasks[0]["cost_usd"] == pytest.approx((1000 * 2.5 + 100 * 10) / 1_000_000)
+        assert tasks[1]["prompt_tokens"] == 500
+        assert tasks[1]["completion_tokens"] == 0
+        assert recorder.agents["Researcher"]["tasks"] == 2
+
+    def test_finish_writes_summary_and_prometheus(self, recorder, tmp_path):
+        """Test the run summary and the Prometheus textfile."""
+        agent = self._agent(10, 5)
+        now = datetime.datetime.now()
+        recorder.record_task(SimpleNamespace(name="research", agent=agent, start_time=now, end_time=now))
+        FakeTool()._run()
+
+        summary = recorder.finish()
+
+        assert read_events(recorder, "run")[0]["status"] == "completed"
+        assert summary["tools"]["Fake Tool"]["calls"] == 1
+        assert get_recorder() is None
+        prom = (tmp_path / "crew.prom").read_text()
+        assert 'curriculum_task_tokens{' in prom and 'kind="prompt"} 10' in prom
+        assert 'curriculum_tool_calls{' in prom and 'tool="Fake Tool",status="ok"} 1' in prom
+
+
+class TestAttach:
+    """Test hooking a crew's callbacks."""
+
+    def test_attach_keeps_existing_callbacks(self, recorder):
+        """Test per-task callbacks wrap existing ones and agents get step callbacks."""
+        agent = Agent(role="Writer", goal="Write", backstory="Writes", llm=LLM(model="gpt-4o"))
+        seen = []
+        task = Task(name="write", description="Write", expected_output="Text", agent=agent, callback=seen.append)
+        crew = Crew(agents=[agent], tasks=[task])
+
+        recorder.attach(crew)
+        task.start_time = task.end_time = datetime.datetime.now()
+        task.callback("output")
+        agent.step_callback(SimpleNamespace(tool="Search"))
+
+        assert seen == ["output"]
+        assert read_events(recorder, "task")[0]["task"] == "write"
+        step = read_events(recorder, "step")[0]
+        assert step["agent"] == "Writer" and step["tool"] == "Search"
+        assert recorder.agents["Writer"]["steps"] == 1
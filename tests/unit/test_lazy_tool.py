@@ -0,0 +1,73 @@
+"""Unit tests for lazily constructed tools."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.lazy_tool import CREWAI_TOOL_SPECS, LazyTool, lazy_crewai_tool
+
+
+class TestLazyTool:
+    """Test deferred construction of wrapped tools."""
+
+    def test_run_delegates_to_wrapped_tool(self):
+        """Test running the proxy runs the wrapped tool."""
+        proxy = LazyTool(
+            name="Read file",
+            description="Read a file",
+            tool_path="crewai.tools:BaseTool",
+        )
+        assert not proxy.is_loaded
+
+        proxy._tool = FakeTool()
+        assert proxy.run(path="notes.md") == "read notes.md"
+
+    def test_import_path_resolution(self):
+        """Test the proxy imports and instantiates the configured class."""
+        proxy = LazyTool(
+            name="Curriculum File Organizer",
+            description="Organizes files",
+            tool_path="comprehensive_curriculum_creator.tools.custom_tool:FileOrganizerTool",
+        )
+
+        assert proxy.tool.__class__.__name__ == "FileOrganizerTool"
+        assert proxy.is_loaded
+        assert proxy.tool is proxy.tool
+
+    def test_crew_build_does_not_import_crewai_tools(self):
+        """Test building the crew leaves crewai_tools unimported."""
+        code = (
+            "import sys\n"
+            "from comprehensive_curriculum_creator.crew import ComprehensiveCurriculumCreatorCrew\n"
+            "ComprehensiveCurriculumCreatorCrew().crew()\n"
+            "print('crewai_tools' in sys.modules)\n"
+        )
+        env = {**os.environ, 'OPENAI_API_KEY': 'test-key', 'CREWAI_DISABLE_TELEMETRY': 'true'}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=120)
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+class FakeTool:
+    """Stand-in for a wrapped tool."""
+
+    def _run(self, path):
+        return f"read {path}"
+
+
+@pytest.mark.parametrize("class_name", sorted(CREWAI_TOOL_SPECS))
+def test_specs_match_crewai_tools(class_name):
+    """Test proxies present the same name, description and arguments as the real tools."""
+    crewai_tools = pytest.importorskip("crewai_tools")
+    fields = getattr(crewai_tools, class_name).model_fields
+    proxy = lazy_crewai_tool(class_name)
+
+    assert proxy.name == fields["name"].default
+    assert proxy.description.endswith(fields["description"].default)
+    real_schema = fields["args_schema"].default.model_json_schema()
+    proxy_schema = proxy.args_schema.model_json_schema()
+    assert json.dumps(proxy_schema["properties"], sort_keys=True) == json.dumps(real_schema["properties"], sort_keys=True)
+    assert proxy_schema.get("required") == real_schema.get("required")
@@ -0,0 +1,120 @@
+"""Unit tests for the shared LLM registry."""
+
+import os
+from unittest.mock import patch
+
+import litellm
+import pytest
+
+from comprehensive_curriculum_creator.llm_registry import LLMRegistry
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """LLM config with one overridden agent."""
+    path = tmp_path / "llm_config.yaml"
+    path.write_text(
+        "defaults:\n"
+        "  model: gpt-4o\n"
+        "  temperature: 0.7\n"
+        "agents:\n"
+        "  curriculum_architect: {}\n"
+        "  subject_matter_researcher: {}\n"
+        "  course_structure_organizer:\n"
+        "    model: gpt-4o-mini\n"
+        "    temperature: 0.2\n"
+        "http_pool:\n"
+        "  max_connections: 8\n"
+        "  max_keepalive_connections: 4\n"
+    )
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clean_litellm_session():
+    """Keep the pooled client from leaking into other tests."""
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}), \
+            patch.object(litellm, "client_session", None):
+        yield
+
+
+class TestLLMRegistry:
+    """Test sharing of LLM instances and the HTTP pool."""
+
+    def test_agents_with_same_settings_share_instance(self, config_file):
+        """Test identical settings return the same LLM object."""
+        registry = LLMRegistry(str(config_file))
+
+        architect = registry.for_agent("curriculum_architect")
+        researcher = registry.for_agent("subject_matter_researcher")
+
+        assert architect is researcher
+        assert architect.model == "gpt-4o"
+
+    def test_agent_overrides(self, config_file):
+        """Test per-agent settings produce a separate instance."""
+        registry = LLMRegistry(str(config_file))
+
+        organizer = registry.for_agent("course_structure_organizer")
+
+        assert organizer is not registry.for_agent("curriculum_architect")
+        assert organizer.model == "gpt-4o-mini"
+        assert organizer.temperature == 0.2
+
+    def test_extra_params_are_part_of_key(self, config_file):
+        """Test different parameters never share an instance."""
+        registry = LLMRegistry(str(config_file))
+
+        assert registry.get("gpt-4o", 0.7, max_tokens=100) is registry.get("gpt-4o", 0.7, max_tokens=100)
+        assert registry.get("gpt-4o", 0.7, max_tokens=100) is not registry.get("gpt-4o", 0.7)
+
+    def test_http_pool_installed_once(self, config_file):
+        """Test one pooled client is installed for all LiteLLM calls."""
+        registry = LLMRegistry(str(config_file))
+
+        registry.for_agent("curriculum_architect")
+        client = litellm.client_session
+        registry.for_agent("course_structure_organizer")
+
+        assert client is not None
+        assert litellm.client_session is client
+        assert client._transport._pool._max_connections == 8
+
+    def test_existing_client_is_kept(self, config_file):
+        """Test an application-provided client is not replaced."""
+        sentinel = object()
+        litellm.client_session = sentinel
+
+        LLMRegistry(str(config_file)).for_agent("curriculum_architect")
+
+        assert litellm.client_session is sentinel
+
+    def test_missing_config_uses_defaults(self, tmp_path):
+        """Test a missing config file falls back to gpt-4o."""
+        registry = LLMRegistry(str(tmp_path / "missing.yaml"))
+
+        assert registry.agent_settings("curriculum_architect") == {"model": "gpt-4o", "temperature": 0.7}
+
+
+class TestCostEstimate:
+    """Test cost estimates from the price table."""
+
+    def test_estimate_cost(self, tmp_path):
+        """Test token counts are priced per million tokens, with or without a provider prefix."""
+        path = tmp_path / "llm_config.yaml"
+        path.write_text("pricing:\n  gpt-4o:\n    prompt: 2.5\n    completion: 10\n")
+        registry = LLMRegistry(str(path))
+
+        assert registry.estimate_cost("gpt-4o", 1_000_000, 100_000) == pytest.approx(3.5)
+        assert registry.estimate_cost("openai/gpt-4o", 1_000_000, 0) == pytest.approx(2.5)
+        assert registry.estimate_cost("unknown-model", 1000, 1000) is None
+
+    def test_estimate_cost_of_snapshots(self, tmp_path):
+        """Test dated snapshots use their base model's price, then LiteLLM's cost map."""
+        path = tmp_path / "llm_config.yaml"
+        path.write_text("pricing:\n  gpt-4o:\n    prompt: 2.5\n    completion: 10\n")
+        registry = LLMRegistry(str(path))
+
+        assert registry.estimate_cost("gpt-4o-2024-08-06", 1_000_000, 0) == pytest.approx(2.5)
+        assert registry.estimate_cost("openai:gpt-4o-2024-08-06", 0, 100_000) == pytest.approx(1.0)
+        assert registry.estimate_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0) > 0
@@ -0,0 +1,110 @@
+"""Unit tests for the research cache backends."""
+
+import time
+import pytest
+from unittest.mock import patch
+
+from comprehensive_curriculum_creator.tools.research_cache import (
+    MemoryResearchCache,
+    SQLiteResearchCache,
+    create_research_cache
+)
+from comprehensive_curriculum_creator.tools.deep_research_tool import (
+    DeepResearchTool,
+    ResearchResult
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    """Create each local cache backend."""
+    if request.param == "sqlite":
+        return SQLiteResearchCache(path=str(tmp_path / "cache.db"), max_entries=2)
+    return MemoryResearchCache(max_entries=2)
+
+
+class TestCacheBackends:
+    """Behaviour shared by every cache backend."""
+
+    def test_get_and_set(self, cache):
+        """Test values round-trip and hits/misses are counted."""
+        assert cache.get("missing") is None
+        cache.set("key", "report")
+
+        assert cache.get("key") == "report"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_ttl_expiry(self, cache):
+        """Test expired entries are evicted on read."""
+        cache.ttl_seconds = 0.01
+        cache.set("key", "report")
+        time.sleep(0.05)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_size_cap_evicts_least_recently_used(self, cache):
+        """Test the size cap keeps the most recently used entries."""
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats()["evictions"] >= 1
+
+
+class TestSQLiteCache:
+    """SQLite-specific behaviour."""
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test a second cache instance sees entries written by the first."""
+        path = str(tmp_path / "cache.db")
+        SQLiteResearchCache(path=path).set("key", "report")
+
+        assert SQLiteResearchCache(path=path).get("key") == "report"
+
+
+class TestCacheFactory:
+    """Backend selection."""
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            create_research_cache("unknown")
+
+    def test_tool_uses_configured_ttl(self):
+        """Test the tool picks up cache_ttl_days from research_config.yaml."""
+        tool = DeepResearchTool()
+
+        assert tool._cache.ttl_seconds == 30 * 86400
+
+    def test_tool_with_sqlite_backend(self, tmp_path):
+        """Test repeated research is served from a persistent cache."""
+        cache_path = str(tmp_path / "cache.db")
+        mock_result = ResearchResult(
+            summary="Persistent summary",
+            key_findings=["Finding"],
+            sources=[],
+            methodology="Test",
+            confidence_score=0.8
+        )
+
+        first = DeepResearchTool(cache_backend="sqlite", cache_path=cache_path)
+        with patch.object(first, '_execute_research', return_value=mock_result):
+            result1 = first._run("Test query")
+
+        second = DeepResearchTool(cache_backend="sqlite", cache_path=cache_path)
+        with patch.object(second, '_execute_research') as mock_execute:
+            result2 = second._run("Test query")
+
+        mock_execute.assert_not_called()
+        assert result1 == result2
+        assert second.get_cache_stats()["hits"] == 1
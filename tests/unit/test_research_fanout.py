@@ -0,0 +1,167 @@
+"""Unit tests for the parallel per-session research fan-out."""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from comprehensive_curriculum_creator.research_fanout import (
+    FanoutSettings,
+    ResearchUnit,
+    build_unit_query,
+    parse_outline_units,
+    research_units,
+    run_research_fanout
+)
+
+SAMPLE_OUTLINE = """
+# Applied AI Curriculum
+
+## Module 1: Foundations of AI
+### Week 1
+- **Session 1: What is AI?**
+  - History of AI
+  - Everyday examples
+- **Session 2:** Machine Learning Basics
+  - Supervised vs unsupervised learning
+
+## Module 2: AI in Practice
+### Week 2
+#### Session 3 - Prompt Engineering
+- Writing effective prompts
+"""
+
+
+class TestOutlineParsing:
+    """Test cases for splitting the outline into research units."""
+
+    def test_parses_sessions_with_context(self):
+        """Test sessions pick up their module, week and topic bullets."""
+        units = parse_outline_units(SAMPLE_OUTLINE)
+
+        assert [u.session for u in units] == ["1", "2", "3"]
+        assert units[0].title == "What is AI?"
+        assert units[0].module_title == "Foundations of AI"
+        assert units[0].details == ["History of AI", "Everyday examples"]
+        assert units[1].title == "Machine Learning Basics"
+        assert units[2].module == "2"
+        assert units[2].week == "2"
+
+    def test_falls_back_to_modules(self):
+        """Test an outline without sessions yields one unit per module."""
+        units = parse_outline_units("## Module 1: Basics\n## Module 2: Advanced\n")
+
+        assert [u.title for u in units] == ["Basics", "Advanced"]
+
+    def test_unit_query(self):
+        """Test the research query names topic, session and details."""
+        unit = parse_outline_units(SAMPLE_OUTLINE)[0]
+        query = build_unit_query(unit, "Applied AI")
+
+        assert query.startswith("Applied AI: What is AI?")
+        assert "Foundations of AI" in query
+        assert "History of AI" in query
+
+
+class TestParallelResearch:
+    """Test cases for concurrent research execution."""
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency units run at once."""
+        active = 0
+        peak = 0
+
+        async def fake_arun(query, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return f"Report for {query}"
+
+        units = [ResearchUnit(session=str(i), title=f"Topic {i}") for i in range(8)]
+        tool = Mock(arun=fake_arun)
+
+        reports = asyncio.run(research_units(units, tool, topic="AI", max_concurrency=3))
+
+        assert peak == 3
+        assert reports[5] == "Report for AI: Topic 5"
+
+    def test_pooled_clients_are_closed(self):
+        """Test the research HTTP clients are closed before the loop ends, also when a unit fails."""
+        async def failing_arun(query, **kwargs):
+            raise RuntimeError("boom")
+
+        units = [ResearchUnit(session="1", title="Topic 1")]
+        with patch("comprehensive_curriculum_creator.research_fanout.close_research_http_clients",
+                   new_callable=AsyncMock) as close:
+            with pytest.raises(RuntimeError):
+                asyncio.run(research_units(units, Mock(arun=failing_arun), topic="AI"))
+
+        close.assert_awaited_once()
+
+    def test_run_research_fanout_merges_reports(self):
+        """Test the merged output stands in for the research task."""
+        async def fake_arun(query, **kwargs):
+            return f"Findings on {query}"
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            output = run_research_fanout(
+                {"topic": "Applied AI", "audience_level": "Non-tech"},
+                SAMPLE_OUTLINE,
+                settings=FanoutSettings(),
+                tool=Mock(arun=fake_arun)
+            )
+
+        assert output.name == "research_course_content"
+        assert "## Module 1 / Week 1 / Session 1: What is AI?" in output.raw
+        assert "Findings on Applied AI: Prompt Engineering" in output.raw
+
+    def test_run_research_fanout_falls_back_when_all_fail(self):
+        """Test the agent task is kept when every unit fails."""
+        async def failing_arun(query, **kwargs):
+            return "Deep research failed: API Error"
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            output = run_research_fanout(
+                {"topic": "Applied AI"},
+                SAMPLE_OUTLINE,
+                settings=FanoutSettings(),
+                tool=Mock(arun=failing_arun)
+            )
+
+        assert output is None
+
+    def test_run_research_fanout_falls_back_when_all_are_skipped(self):
+        """Test units skipped by the cost budget count as failed."""
+        async def skipped_arun(query, **kwargs):
+            return "Research skipped: the monthly budget is used up. Continue with existing knowledge."
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            output = run_research_fanout(
+                {"topic": "Applied AI"},
+                SAMPLE_OUTLINE,
+                settings=FanoutSettings(),
+                tool=Mock(arun=skipped_arun)
+            )
+
+        assert output is None
+
+    def test_run_research_fanout_reports_skipped_units(self, caplog):
+        """Test partly skipped research is merged and the skipped units are logged."""
+        async def fake_arun(query, **kwargs):
+            if "Prompt Engineering" in query:
+                return "Research skipped: the monthly budget is used up. Continue with existing knowledge."
+            return f"Findings on {query}"
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}), caplog.at_level("INFO"):
+            output = run_research_fanout(
+                {"topic": "Applied AI"},
+                SAMPLE_OUTLINE,
+                settings=FanoutSettings(),
+                tool=Mock(arun=fake_arun)
+            )
+
+        assert "Findings on Applied AI: What is AI?" in output.raw
+        assert "1 of 3 research units failed or were skipped" in caplog.text
+        assert "Researching 3 sessions in parallel" in caplog.text
@@ -0,0 +1,156 @@
+"""Unit tests for the research graph's pooled HTTP clients."""
+
+import asyncio
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+utils = pytest.importorskip("open_deep_research.utils")
+
+
+@pytest.fixture(autouse=True)
+def no_tavily_proxy(monkeypatch):
+    monkeypatch.delenv("TAVILY_HTTP_PROXY", raising=False)
+    monkeypatch.delenv("TAVILY_HTTPS_PROXY", raising=False)
+
+
+@pytest.fixture
+def http_clients(monkeypatch):
+    """Record the httpx clients the pool creates and the limits they are given."""
+    created = []
+    real_client = utils.httpx.AsyncClient
+
+    def recording_client(**kwargs):
+        client = real_client(**kwargs)
+        created.append((client, kwargs["limits"]))
+        return client
+
+    monkeypatch.setattr(utils.httpx, "AsyncClient", recording_client)
+    return created
+
+
+def run_and_close(main):
+    """Run ``main`` on a fresh loop and close its pooled clients before the loop goes away."""
+    async def wrapper():
+        try:
+            return await main()
+        finally:
+            await utils.close_http_clients()
+
+    return asyncio.run(wrapper())
+
+
+class TestTavilyClient:
+    """Test Tavily clients are pooled per event loop."""
+
+    @pytest.mark.skipif(not utils._TAVILY_ACCEPTS_CLIENT, reason="tavily-python cannot take an HTTP client")
+    def test_reused_within_a_loop_with_the_configured_limits(self, http_clients):
+        """Test one client per key and loop, built with the requested connection limits."""
+        async def main():
+            first = utils.get_tavily_client("key", max_connections=7, max_keepalive_connections=3)
+            second = utils.get_tavily_client("key", max_connections=7, max_keepalive_connections=3)
+            other = utils.get_tavily_client("key", max_connections=9, max_keepalive_connections=3)
+            return first, second, other
+
+        first, second, other = run_and_close(main)
+
+        assert first is second
+        assert other is not first
+        assert len(http_clients) == 2
+        limits = http_clients[0][1]
+        assert (limits.max_connections, limits.max_keepalive_connections) == (7, 3)
+
+    def test_each_loop_gets_its_own_client(self):
+        """Test a client is never shared with another event loop."""
+        async def main():
+            return utils.get_tavily_client("key")
+
+        assert run_and_close(main) is not run_and_close(main)
+
+
+class TestHttpSession:
+    """Test aiohttp sessions are pooled per event loop."""
+
+    def test_reused_within_a_loop_with_the_configured_limit(self):
+        """Test one session per connection limit and loop."""
+        async def main():
+            first = utils.get_http_session(max_connections=5)
+            return first, utils.get_http_session(max_connections=5), first.connector.limit
+
+        first, second, limit = run_and_close(main)
+
+        assert first is second
+        assert limit == 5
+
+    def test_each_loop_gets_its_own_session(self):
+        """Test a session is never shared with another event loop."""
+        async def main():
+            return utils.get_http_session()
+
+        assert run_and_close(main) is not run_and_close(main)
+
+
+class TestCloseHttpClients:
+    """Test closing the running loop's pooled clients."""
+
+    @pytest.mark.skipif(not utils._TAVILY_ACCEPTS_CLIENT, reason="tavily-python cannot take an HTTP client")
+    def test_closes_and_forgets_both_clients(self, http_clients):
+        """Test the clients are closed, removed from the pool and replaced on the next request."""
+        async def main():
+            tavily = utils.get_tavily_client("key")
+            session = utils.get_http_session()
+            loop = asyncio.get_running_loop()
+            await utils.close_http_clients()
+            closed = (http_clients[0][0].is_closed, session.closed, loop in utils._loop_clients)
+            replaced = (utils.get_tavily_client("key") is not tavily, utils.get_http_session() is not session)
+            return closed, replaced
+
+        closed, replaced = run_and_close(main)
+
+        assert closed == (True, True, False)
+        assert replaced == (True, True)
+
+    def test_without_clients_is_a_no_op(self):
+        """Test closing a loop that never created a client does nothing."""
+        asyncio.run(utils.close_http_clients())
+
+
+class TestMcpAccessToken:
+    """Test the MCP token exchange goes through the pooled session."""
+
+    def test_uses_the_pooled_session(self, monkeypatch):
+        """Test the exchange posts on the loop's pooled session instead of opening a new one."""
+        posted = []
+
+        class FakeResponse:
+            status = 200
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def json(self):
+                return {"access_token": "mcp-token"}
+
+        def fake_post(session, url, **kwargs):
+            posted.append((session, url, kwargs["data"]["subject_token"]))
+            return FakeResponse()
+
+        monkeypatch.setattr(utils.aiohttp.ClientSession, "post", fake_post)
+
+        async def main():
+            pooled = utils.get_http_session()
+            tokens = [await utils.get_mcp_access_token("supabase-token", "https://mcp.example/") for _ in range(2)]
+            return pooled, tokens
+
+        pooled, tokens = run_and_close(main)
+
+        assert tokens == [{"access_token": "mcp-token"}] * 2
+        assert [session for session, _, _ in posted] == [pooled, pooled]
+        assert posted[0][1:] == ("https://mcp.example/oauth/token", "supabase-token")
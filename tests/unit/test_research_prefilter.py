@@ -0,0 +1,159 @@
+"""Unit tests for the local prefilter of search results."""
+
+import asyncio
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+utils = pytest.importorskip("open_deep_research.utils")
+
+ARTICLE = (
+    "Photosynthesis converts light energy into chemical energy stored in glucose. "
+    "Chlorophyll in the chloroplast absorbs light, and the light reactions produce ATP and NADPH. "
+    "The Calvin cycle then fixes carbon dioxide into sugars using that energy."
+)
+
+
+def result(content, query="photosynthesis light reactions", title="Page"):
+    return {"title": title, "content": "snippet", "raw_content": content, "query": query}
+
+
+class TestStripBoilerplate:
+    """Test removing navigation and boilerplate from page content."""
+
+    def test_removes_menus_links_and_notices(self):
+        """Test menu runs, link-only lines, notices and repeated lines are dropped."""
+        page = "\n".join([
+            "Home", "About", "Products", "Contact",
+            "[Login](https://example.com/login) | [Register](https://example.com/register)",
+            "We use cookies to improve your experience",
+            "# Photosynthesis",
+            ARTICLE,
+            "Read the [full guide](https://example.com/guide) for details.",
+            ARTICLE,
+            "© 2024 Example Inc.",
+        ])
+
+        cleaned = strip_lines(page)
+        assert cleaned == ["# Photosynthesis", ARTICLE, "Read the full guide for details."]
+
+    def test_keeps_lists_tables_and_data(self):
+        """Test short list items, table rows and numeric lines survive."""
+        page = "\n".join([
+            "Inputs",
+            "- Light",
+            "- Water",
+            "* Carbon dioxide",
+            "| Stage | Output |",
+            "|---|---|",
+            "| Light | ATP |",
+            "",
+            "| Stage | Site |",
+            "|---|---|",
+            "Optimum 25 C",
+            "pH 7",
+        ])
+
+        cleaned = strip_lines(page)
+        assert cleaned.count("|---|---|") == 2
+        for line in ["Inputs", "- Light", "- Water", "* Carbon dioxide", "| Light | ATP |", "Optimum 25 C", "pH 7"]:
+            assert line in cleaned
+
+
+class TestPrefilterSearchResults:
+    """Test selecting which pages are summarized."""
+
+    def test_near_duplicate_keeps_the_more_relevant_page(self):
+        """Test the copy that matches its query better is kept."""
+        results = {
+            "https://mirror.example/a": result(ARTICLE, query="history of botany"),
+            "https://origin.example/a": result(ARTICLE + " Light reactions need light.", query="photosynthesis light reactions"),
+        }
+
+        filtered = utils.prefilter_search_results(results, max_pages=5, near_duplicate_bits=8)
+
+        assert list(filtered) == ["https://origin.example/a"]
+        assert filtered["https://origin.example/a"]["raw_content"]
+
+    def test_top_k_pages_keep_their_content(self):
+        """Test only the most relevant pages are summarized; the rest keep the snippet."""
+        results = {
+            "https://a.example": result("Plants grow in soil and need water every day to survive."),
+            "https://b.example": result("Photosynthesis light reactions make ATP from light in the thylakoid."),
+            "https://c.example": result("Light reactions split water and release oxygen as a by-product."),
+        }
+
+        filtered = utils.prefilter_search_results(results, max_pages=2, near_duplicate_bits=0)
+
+        assert list(filtered) == list(results)
+        assert filtered["https://a.example"]["raw_content"] is None
+        assert filtered["https://a.example"]["content"] == "snippet"
+        assert filtered["https://b.example"]["raw_content"]
+        assert filtered["https://c.example"]["raw_content"]
+
+    def test_pages_without_query_terms_fill_free_slots(self):
+        """Test a page sharing no terms with its query is still summarized when there is room."""
+        results = {"https://a.example": result("Chloroplasts hold the pigments plants use to capture energy.")}
+
+        filtered = utils.prefilter_search_results(results, max_pages=5, near_duplicate_bits=0)
+
+        assert filtered["https://a.example"]["raw_content"]
+
+
+class TestRunUrlClaims:
+    """Test tavily_search claims only the pages it summarizes."""
+
+    def test_only_summarized_pages_are_claimed(self, monkeypatch):
+        """Test known URLs are referenced and pages demoted by the prefilter stay unclaimed."""
+        pages = {
+            "https://known.example": "Earlier research already covered photosynthesis light reactions.",
+            "https://best.example": "Photosynthesis light reactions make ATP from light in the thylakoid.",
+            "https://weak.example": "Plants grow in soil and need water every day to survive.",
+        }
+
+        async def fake_search(queries, **kwargs):
+            return [{"query": queries[0], "results": [
+                {"url": url, "title": url, "content": "snippet", "raw_content": content}
+                for url, content in pages.items()
+            ]}]
+
+        async def fake_summarize(model, content):
+            return f"summary of {content[:20]}"
+
+        monkeypatch.setattr(utils, "tavily_search_async", fake_search)
+        monkeypatch.setattr(utils, "summarize_webpage", fake_summarize)
+        monkeypatch.setattr(utils, "init_chat_model", lambda **kwargs: FakeChatModel())
+
+        registry = utils.RunUrlRegistry({"https://known.example": "Known"})
+        config = {"configurable": {"max_pages_to_summarize": 1, "summary_cache_size": 0}}
+
+        async def main():
+            token = utils.set_run_url_registry(registry)
+            try:
+                return await utils.tavily_search.coroutine(["photosynthesis light reactions"], config=config)
+            finally:
+                utils.reset_run_url_registry(token)
+
+        output = asyncio.run(main())
+
+        assert set(registry.snapshot()) == {"https://known.example", "https://best.example"}
+        assert "ALREADY SUMMARIZED" in output
+        assert "summary of Photosynthesis light" in output
+
+
+class FakeChatModel:
+    """Stand-in for the summarization model; summarize_webpage is patched."""
+
+    def with_structured_output(self, schema):
+        return self
+
+    def with_retry(self, **kwargs):
+        return self
+
+
+def strip_lines(page):
+    return [line for line in utils.strip_boilerplate(page).splitlines() if line]
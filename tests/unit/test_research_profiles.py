@@ -0,0 +1,95 @@
+"""Unit tests for research mode profiles."""
+
+import os
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import (
+    DEFAULT_RESEARCH_CONFIG_PATH,
+    DEFAULT_RESEARCH_SRC_PATH,
+    DeepResearchTool,
+)
+from comprehensive_curriculum_creator.tools.research_profiles import load_research_profiles, parse_research_profiles
+
+
+class TestResearchProfiles:
+    """Test loading and translating research profiles."""
+
+    def test_modes_inherit_defaults(self):
+        """Test a mode only overrides the settings it names."""
+        profiles = parse_research_profiles({
+            "defaults": {"model": "gpt-4o", "max_tool_calls": 10, "timeout_minutes": 30},
+            "research_modes": {"quick": {"model": "gpt-4o-mini", "max_tool_calls": 2}},
+        })
+
+        quick = profiles.get("quick")
+        assert quick.model == "gpt-4o-mini"
+        assert quick.max_tool_calls == 2
+        assert quick.timeout_minutes == 30
+        assert "quick" in profiles and "deep" not in profiles
+        assert profiles.get("deep") == profiles.defaults
+
+    def test_invalid_profile_names_the_mode(self):
+        """Test validation errors say which mode is wrong."""
+        with pytest.raises(ValueError, match="research mode 'quick'"):
+            parse_research_profiles({"research_modes": {"quick": {"max_iterations": 0}}})
+        with pytest.raises(ValueError, match="research mode 'deep'"):
+            parse_research_profiles({"research_modes": {"deep": {"search_api": "bing"}}})
+
+    def test_configurable_matches_open_deep_research(self):
+        """Test every override is a field of the research graph's Configuration."""
+        if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+            sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+        configuration = pytest.importorskip("open_deep_research.configuration")
+
+        profile = load_research_profiles(str(DEFAULT_RESEARCH_CONFIG_PATH)).get("quick")
+        config = configuration.Configuration(**profile.to_configurable())
+
+        assert config.max_react_tool_calls == 3
+        assert config.max_researcher_iterations == 3
+        assert config.research_model == "openai:gpt-4o-mini"
+
+    def test_file_is_reparsed_only_when_changed(self, tmp_path):
+        """Test the loader caches a file until it is modified."""
+        path = tmp_path / "research_config.yaml"
+        path.write_text("research_modes:\n  quick:\n    max_tool_calls: 2\n")
+
+        first = load_research_profiles(str(path))
+        assert load_research_profiles(str(path)) is first
+
+        path.write_text("research_modes:\n  quick:\n    max_tool_calls: 4\n")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        assert load_research_profiles(str(path)).get("quick").max_tool_calls == 4
+
+    def test_missing_file_uses_builtin_defaults(self, tmp_path):
+        """Test a missing config falls back to the default profile."""
+        profiles = load_research_profiles(str(tmp_path / "missing.yaml"))
+        assert profiles.get("quick").max_iterations == 6
+
+
+class TestToolUsesProfiles:
+    """Test the tool applies the profile of the requested mode."""
+
+    def test_quick_mode_is_bounded(self):
+        """Test quick research caps tool calls, page length and sources."""
+        tool = DeepResearchTool()
+        query = tool._parse_query("Test", "quick", 20, True, None)
+        configurable = tool._build_run_config(query)["configurable"]
+
+        assert query.max_sources == 10
+        assert configurable["max_react_tool_calls"] == 3
+        assert configurable["max_content_length"] == 20000
+        assert configurable["allow_clarification"] is False
+        assert configurable["summary_cache_path"].endswith("webpage_summaries.db")
+
+    def test_custom_mode_from_config(self, tmp_path):
+        """Test modes defined in the config file are accepted by the tool."""
+        path = tmp_path / "research_config.yaml"
+        path.write_text("research_modes:\n  survey:\n    model: gpt-4o-mini\n    max_iterations: 1\n")
+        tool = DeepResearchTool(research_config_path=str(path), cache_enabled=False)
+
+        query = tool._parse_query("Test", "survey", 5, True, None)
+        assert query.research_mode == "survey"
+        assert tool._build_run_config(query)["configurable"]["max_researcher_iterations"] == 1
@@ -0,0 +1,269 @@
+"""Unit tests for the research graph's shared rate limits."""
+
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+utils = pytest.importorskip("open_deep_research.utils")
+Configuration = pytest.importorskip("open_deep_research.configuration").Configuration
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters(monkeypatch):
+    """Limiters are process-wide; every test starts with full budgets."""
+    monkeypatch.setattr(utils, "_rate_limiters", {})
+
+
+def run_in_threads(count, main):
+    """Run ``main`` on its own event loop in each of ``count`` threads and return the results."""
+    results = [None] * count
+
+    def worker(index):
+        results[index] = asyncio.run(main())
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+class FakeResponse:
+    """Model response reporting token usage."""
+
+    def __init__(self, total_tokens):
+        self.usage_metadata = {"total_tokens": total_tokens}
+
+
+class FakeModel:
+    """Chat model recording how many calls run at once."""
+
+    def __init__(self, total_tokens=100, delay=0.02):
+        self.total_tokens = total_tokens
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return FakeResponse(self.total_tokens)
+
+
+def run_config(**configurable):
+    return {"configurable": configurable}
+
+
+class TestTokenBucket:
+    """Test the per-minute budget."""
+
+    def test_refills_over_time(self):
+        """Test spent budget comes back at the per-minute rate."""
+        bucket = utils.TokenBucket(600)
+        bucket.available = 0
+        bucket.updated = time.monotonic() - 3
+
+        bucket._refill()
+        assert bucket.available == pytest.approx(30, rel=0.01)
+
+        bucket.updated = time.monotonic() - 120
+        bucket._refill()
+        assert bucket.available == bucket.capacity
+
+    def test_waits_for_refill(self):
+        """Test a request beyond the remaining budget waits for the refill."""
+        bucket = utils.TokenBucket(600)  # 10 per second
+
+        async def main():
+            await bucket.acquire(600)
+            started = time.monotonic()
+            await bucket.acquire(2)
+            return time.monotonic() - started
+
+        assert 0.15 <= asyncio.run(main()) < 1.0
+
+    def test_request_larger_than_capacity_is_clamped(self):
+        """Test a request above the per-minute budget does not wait forever."""
+        bucket = utils.TokenBucket(60)
+
+        asyncio.run(asyncio.wait_for(bucket.acquire(10_000), timeout=1))
+        assert bucket.available == pytest.approx(0, abs=0.1)
+
+
+class TestRateLimiter:
+    """Test concurrency and token limits."""
+
+    def test_settles_against_reported_usage(self):
+        """Test the token budget is corrected once usage is known."""
+        limiter = utils.RateLimiter(max_concurrency=1, tokens_per_minute=1000)
+
+        async def main():
+            async with limiter.slot(800):
+                pass
+
+        asyncio.run(main())
+        assert limiter.tokens.available == pytest.approx(200, abs=1)
+        limiter.settle(800, 300)
+        assert limiter.tokens.available == pytest.approx(700, abs=1)
+        limiter.settle(100, 600)
+        assert limiter.tokens.available == pytest.approx(200, abs=1)
+
+    def test_ainvoke_settles_usage(self):
+        """Test rate_limited_ainvoke charges the estimate and settles the reported usage."""
+        config = run_config(model_tokens_per_minute=6_000)  # 100 per second, so refill stays small
+        model = FakeModel(total_tokens=50, delay=0)
+
+        async def main():
+            await utils.rate_limited_ainvoke(model, "hi", {"model": "openai:gpt-4.1", "max_tokens": 1000}, config)
+            return utils.get_rate_limiter("openai", Configuration.from_runnable_config(config))
+
+        limiter = asyncio.run(main())
+        assert limiter.tokens.available == pytest.approx(6_000 - 50, abs=5)
+
+    def test_provider_overrides(self):
+        """Test provider_rate_limits replace the defaults for that provider only."""
+        configurable = Configuration(
+            max_concurrent_model_calls=7,
+            provider_rate_limits={"anthropic": {"concurrency": 2, "rpm": 60, "tpm": 1000}, "tavily": {"rpm": 30}},
+        )
+
+        async def main():
+            return (
+                utils.get_rate_limiter("anthropic", configurable),
+                utils.get_rate_limiter("openai", configurable),
+                utils.get_rate_limiter("tavily", configurable, kind="search"),
+            )
+
+        anthropic, openai, tavily = asyncio.run(main())
+        assert anthropic._semaphore._value == 2
+        assert anthropic.requests.capacity == 60
+        assert anthropic.tokens.capacity == 1000
+        assert openai._semaphore._value == 7
+        assert openai.requests is None and openai.tokens is None
+        assert tavily.requests.capacity == 30
+
+
+class TestSharedLimiters:
+    """Test every model call of a provider goes through one limiter per process."""
+
+    def test_summaries_and_model_calls_share_a_limiter(self):
+        """Test the summarization and research models of one provider get the same limiter."""
+        configurable = Configuration(summarization_model="openai:gpt-4.1-mini", research_model="openai:gpt-4.1")
+
+        async def limiters():
+            return (
+                utils.get_rate_limiter(utils.get_model_provider(configurable.summarization_model), configurable),
+                utils.get_rate_limiter(utils.get_model_provider(configurable.research_model), configurable),
+            )
+
+        summary, research = asyncio.run(limiters())
+        assert summary is research
+        assert asyncio.run(limiters())[0] is summary  # a new loop shares the limiter
+
+    def test_concurrency_is_shared(self):
+        """Test summaries and rate_limited_ainvoke calls count against one concurrency limit."""
+        config = run_config(max_concurrent_model_calls=2)
+        configurable = Configuration.from_runnable_config(config)
+        model = FakeModel()
+
+        async def summary():
+            limiter = utils.get_rate_limiter(utils.get_model_provider(configurable.summarization_model), configurable)
+            async with limiter.slot(utils.estimate_tokens("page")):
+                return await model.ainvoke("page")
+
+        async def main():
+            calls = [utils.rate_limited_ainvoke(model, "q", {"model": "openai:gpt-4.1"}, config) for _ in range(3)]
+            await asyncio.gather(*calls, *(summary() for _ in range(3)))
+
+        asyncio.run(main())
+        assert model.peak == 2
+
+
+class TestProcessWideLimits:
+    """Test research on separate threads and event loops is throttled together."""
+
+    def test_concurrency_is_shared_across_threads(self):
+        """Test two threads, each running its own loop, share one concurrency limit."""
+        config = run_config(max_concurrent_model_calls=1)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        class ThreadedModel:
+            async def ainvoke(self, messages):
+                with lock:
+                    active.append(messages)
+                    peak.append(len(active))
+                await asyncio.sleep(0.05)
+                with lock:
+                    active.remove(messages)
+                return FakeResponse(10)
+
+        async def main():
+            model = ThreadedModel()
+            await asyncio.gather(*(
+                utils.rate_limited_ainvoke(model, f"q{i}-{threading.get_ident()}", {"model": "openai:gpt-4.1"}, config)
+                for i in range(3)
+            ))
+            return utils.get_rate_limiter("openai", Configuration.from_runnable_config(config))
+
+        first, second = run_in_threads(2, main)
+
+        assert first is second
+        assert len(peak) == 6
+        assert max(peak) == 1
+
+    def test_request_budget_is_shared_across_threads(self):
+        """Test requests from two loops draw from one per-minute budget."""
+        configurable = Configuration(provider_rate_limits={"tavily": {"rpm": 600}})  # 10 per second
+        limiter = utils.get_rate_limiter("tavily", configurable, kind="search")
+        limiter.requests.adjust(-limiter.requests.capacity)  # spend the whole minute
+
+        async def main():
+            started = time.monotonic()
+            for _ in range(2):
+                async with utils.get_rate_limiter("tavily", configurable, kind="search").slot():
+                    pass
+            return time.monotonic() - started
+
+        waited = run_in_threads(2, main)
+
+        # Four requests at 10 per second: the last one waits about 0.4 seconds
+        assert max(waited) >= 0.35
+        assert max(waited) < 2
+
+    def test_cancelled_waiter_passes_its_slot_on(self):
+        """Test a caller cancelled while waiting does not leak the slot."""
+        limiter = utils.RateLimiter(max_concurrency=1)
+
+        async def main():
+            async def hold(delay):
+                async with limiter.slot():
+                    await asyncio.sleep(delay)
+
+            holder = asyncio.create_task(hold(0.05))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(hold(0))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await holder
+            await asyncio.wait_for(hold(0), timeout=1)
+
+        asyncio.run(main())
+        assert limiter._semaphore._value == 1
+
+
+def test_get_model_provider():
+    """Test the provider is the prefix of a provider:model name, defaulting to OpenAI."""
+    assert utils.get_model_provider("anthropic:claude-sonnet-4") == "anthropic"
+    assert utils.get_model_provider("gpt-4o") == "openai"
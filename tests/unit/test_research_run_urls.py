@@ -0,0 +1,155 @@
+"""Unit tests for sharing summarized URLs between the researchers of one run."""
+
+import asyncio
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+utils = pytest.importorskip("open_deep_research.utils")
+deep_researcher = pytest.importorskip("open_deep_research.deep_researcher")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+from open_deep_research.state import ResearcherState  # noqa: E402
+
+SHARED_URL = "https://shared.example/photosynthesis"
+PAGES = {
+    SHARED_URL: "Photosynthesis light reactions make ATP from light in the thylakoid.",
+    "https://leaf.example/light": "Light reactions in the leaf split water and release oxygen.",
+    "https://cycle.example/calvin": "The Calvin cycle fixes carbon dioxide into sugar using ATP.",
+}
+TOPIC_URLS = {
+    "light reactions": [SHARED_URL, "https://leaf.example/light"],
+    "calvin cycle": [SHARED_URL, "https://cycle.example/calvin"],
+}
+CONFIG = {"configurable": {"summary_cache_size": 0, "max_concurrent_research_units": 5}}
+
+
+@pytest.fixture
+def research_run(monkeypatch):
+    """Researchers that search through the real tavily_search; returns the URLs summarized."""
+    summarized = []
+    registries = []
+
+    async def fake_search(queries, **kwargs):
+        await asyncio.sleep(0)  # let the parallel researchers interleave
+        return [{"query": queries[0], "results": [
+            {"url": url, "title": url, "content": "snippet", "raw_content": PAGES[url]}
+            for url in TOPIC_URLS[queries[0]]
+        ]}]
+
+    async def fake_summarize(model, content):
+        summarized.append(next(url for url, page in PAGES.items() if content.startswith(page[:40])))
+        await asyncio.sleep(0)
+        return f"summary of {content[:20]}"
+
+    async def research(state, config):
+        registries.append(utils.get_run_url_registry())
+        output = await utils.tavily_search.coroutine([state["research_topic"]], config=config)
+        return {"compressed_research": output, "raw_notes": [output]}
+
+    researcher = StateGraph(ResearcherState)
+    researcher.add_node("research", research)
+    researcher.add_edge(START, "research")
+    researcher.add_edge("research", END)
+
+    monkeypatch.setattr(utils, "tavily_search_async", fake_search)
+    monkeypatch.setattr(utils, "summarize_webpage", fake_summarize)
+    monkeypatch.setattr(utils, "init_chat_model", lambda **kwargs: FakeChatModel())
+    monkeypatch.setattr(deep_researcher, "researcher_subgraph", researcher.compile())
+    return summarized, registries
+
+
+def supervisor_state(*topics, summarized_urls=None):
+    tool_calls = [
+        {"name": "ConductResearch", "args": {"research_topic": topic}, "id": f"call-{i}"}
+        for i, topic in enumerate(topics)
+    ]
+    state = {"supervisor_messages": [AIMessage(content="", tool_calls=tool_calls)], "research_iterations": 1}
+    if summarized_urls is not None:
+        state["summarized_urls"] = summarized_urls
+    return state
+
+
+def run_supervisor_tools(state):
+    async def main():
+        command = await deep_researcher.supervisor_tools(state, CONFIG)
+        return command, utils.get_run_url_registry()
+
+    return asyncio.run(main())
+
+
+class TestSupervisorUrlSharing:
+    """Test the supervisor shares one URL registry with its parallel researchers."""
+
+    def test_parallel_researchers_share_one_registry(self, research_run):
+        """Test every researcher sees the same registry and a shared page is summarized once."""
+        summarized, registries = research_run
+
+        command, registry_after = run_supervisor_tools(supervisor_state("light reactions", "calvin cycle"))
+
+        assert command.goto == "supervisor"
+        assert len(registries) == 2
+        assert registries[0] is not None and registries[0] is registries[1]
+        assert sorted(summarized) == sorted(PAGES)
+        reports = [message.content for message in command.update["supervisor_messages"]]
+        assert sum("ALREADY SUMMARIZED" in report for report in reports) == 1
+        assert registry_after is None
+
+    def test_claimed_url_is_referenced(self, research_run):
+        """Test a URL claimed in an earlier iteration is referenced instead of summarized again."""
+        summarized, _ = research_run
+
+        command, _ = run_supervisor_tools(
+            supervisor_state("light reactions", summarized_urls={SHARED_URL: "Shared"})
+        )
+
+        assert summarized == ["https://leaf.example/light"]
+        report = command.update["supervisor_messages"][0].content
+        assert f"URL: {SHARED_URL}\n\nALREADY SUMMARIZED" in report
+
+    def test_summarized_urls_carry_over_between_iterations(self, research_run):
+        """Test the URLs claimed in one iteration are returned in state and honoured by the next."""
+        summarized, _ = research_run
+
+        first, _ = run_supervisor_tools(
+            supervisor_state("light reactions", summarized_urls={"https://earlier.example": "Earlier"})
+        )
+        assert first.update["summarized_urls"] == {
+            "https://earlier.example": "Earlier",
+            SHARED_URL: SHARED_URL,
+            "https://leaf.example/light": "https://leaf.example/light",
+        }
+
+        summarized.clear()
+        second, _ = run_supervisor_tools(
+            supervisor_state("calvin cycle", summarized_urls=first.update["summarized_urls"])
+        )
+        assert summarized == ["https://cycle.example/calvin"]
+        assert set(second.update["summarized_urls"]) == {"https://earlier.example", *PAGES}
+
+    def test_registry_is_reset_when_a_researcher_fails(self, research_run, monkeypatch):
+        """Test the registry does not leak into the caller's context when research fails."""
+        async def failing_search(queries, **kwargs):
+            raise RuntimeError("search failed")
+
+        monkeypatch.setattr(utils, "tavily_search_async", failing_search)
+
+        command, registry_after = run_supervisor_tools(supervisor_state("light reactions"))
+
+        assert command.goto == END
+        assert registry_after is None
+
+
+class FakeChatModel:
+    """Stand-in for the summarization model; summarize_webpage is patched."""
+
+    def with_structured_output(self, schema):
+        return self
+
+    def with_retry(self, **kwargs):
+        return self
@@ -0,0 +1,77 @@
+"""Unit tests for the semantic research query index."""
+
+import pytest
+from unittest.mock import patch
+
+from comprehensive_curriculum_creator.tools.semantic_cache import (
+    HashingEmbedder,
+    SemanticQueryIndex
+)
+from comprehensive_curriculum_creator.tools.deep_research_tool import (
+    DeepResearchTool,
+    ResearchResult
+)
+
+
+class TestHashingEmbedder:
+    """Test cases for the deterministic hashing embedder."""
+
+    @pytest.fixture
+    def embedder(self):
+        return HashingEmbedder()
+
+    def test_rewording_is_similar(self, embedder):
+        """Test that trivially reworded queries embed close together."""
+        a = embedder.embed("Intro to Quantum Physics")
+        b = embedder.embed("Introduction to quantum physics")
+
+        assert float(a @ b) > 0.92
+
+    def test_different_topics_are_dissimilar(self, embedder):
+        """Test that different topics and session numbers stay apart."""
+        assert float(embedder.embed("Intro to Quantum Physics") @ embedder.embed("Intro to Classical Mechanics")) < 0.92
+        assert float(embedder.embed("Neural networks session 2") @ embedder.embed("Neural networks session 3")) < 0.92
+
+    def test_deterministic(self, embedder):
+        """Test embeddings are identical across embedder instances."""
+        assert (embedder.embed("Machine learning") == HashingEmbedder().embed("Machine learning")).all()
+
+
+class TestSemanticQueryIndex:
+    """Test cases for the semantic query index."""
+
+    def test_lookup_respects_scope(self):
+        """Test matches are only returned within the same scope."""
+        index = SemanticQueryIndex()
+        index.add("deep_20_None", "Intro to Quantum Physics", "key1")
+
+        assert index.lookup("deep_20_None", "Introduction to quantum physics")[0] == "key1"
+        assert index.lookup("quick_10_None", "Introduction to quantum physics") is None
+
+    def test_persistence(self, tmp_path):
+        """Test the index reloads from disk."""
+        path = str(tmp_path / "index.json")
+        SemanticQueryIndex(path=path).add("deep_20_None", "Intro to Quantum Physics", "key1")
+
+        index = SemanticQueryIndex(path=path)
+        assert len(index) == 1
+        assert index.lookup("deep_20_None", "Introduction to quantum physics")[0] == "key1"
+
+    def test_tool_serves_near_duplicate(self):
+        """Test the research tool reuses a cached report for a reworded query."""
+        tool = DeepResearchTool(semantic_cache_enabled=True)
+        mock_result = ResearchResult(
+            summary="Quantum summary",
+            key_findings=["Finding"],
+            sources=[],
+            methodology="Test",
+            confidence_score=0.8
+        )
+
+        with patch.object(tool, '_execute_research', return_value=mock_result) as mock_execute:
+            result1 = tool._run("Intro to Quantum Physics")
+            result2 = tool._run("Introduction to quantum physics")
+            tool._run("Intro to Classical Mechanics")
+
+        assert result1 == result2
+        assert mock_execute.call_count == 2
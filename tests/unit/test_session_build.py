@@ -0,0 +1,145 @@
+"""Unit tests for incremental session regeneration."""
+
+import pytest
+from crewai import Task
+
+from comprehensive_curriculum_creator.research_fanout import FanoutSettings, parse_outline_units
+from comprehensive_curriculum_creator.session_build import SESSION_FILES, SessionBuild, scope_tasks_to_sessions
+
+OUTLINE = """
+## Module 1: Foundations
+### Week 1
+- **Session 1:** What is AI?
+  - History of AI
+- **Session 2:** Machine learning basics
+## Module 2: Practice
+### Week 2
+- **Session 3:** Building a chatbot
+  - Prompt design
+"""
+
+
+@pytest.fixture
+def inputs():
+    """Curriculum inputs."""
+    return {
+        'topic': 'Applied AI',
+        'duration': '2 weeks',
+        'sessions': '3',
+        'session_duration': '1 hour',
+        'project_based': 'no',
+        'audience_level': 'Non-tech'
+    }
+
+
+@pytest.fixture
+def make_build(tmp_path):
+    """Build manifest factory writing under a temporary output directory."""
+    def make(inputs, prompt_version="v1"):
+        return SessionBuild(inputs, output_dir=str(tmp_path), settings=FanoutSettings(), prompt_version=prompt_version)
+    return make
+
+
+def write_materials(base_path, module, week, session):
+    """Write the four session documents the way the organizer lays them out."""
+    session_dir = base_path / f"Module_{module}" / f"Week_{week}" / f"Session_{session}"
+    for name in SESSION_FILES:
+        folder = session_dir / ("Classwork" if name in ("slides_presentation.md", "course_material.md") else "Homework")
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / name).write_text(f"# {name}")
+
+
+def build_all(build, units):
+    """Simulate a full build and record it."""
+    plan = build.plan(units)
+    write_materials(build.base_path, "Foundations", 1, 1)
+    write_materials(build.base_path, "Foundations", 1, 2)
+    write_materials(build.base_path, "Practice", 2, 3)
+    assert build.record(plan) == 3
+
+
+class TestSessionBuild:
+    """Test staleness detection and recording."""
+
+    def test_first_build_is_full(self, make_build, inputs):
+        """Test every session is stale before anything was built."""
+        plan = make_build(inputs).plan(parse_outline_units(OUTLINE))
+
+        assert len(plan.stale) == 3
+        assert not plan.fresh
+        assert not plan.incremental
+        assert set(plan.reasons.values()) == {"not built yet"}
+
+    def test_rebuild_with_same_inputs_is_up_to_date(self, make_build, inputs):
+        """Test nothing is regenerated when no input changed."""
+        build_all(make_build(inputs), parse_outline_units(OUTLINE))
+
+        plan = make_build(inputs).plan(parse_outline_units(OUTLINE))
+        assert plan.up_to_date
+        assert len(plan.fresh) == 3
+
+    def test_only_revised_session_is_stale(self, make_build, inputs):
+        """Test editing one session's outline only rebuilds that session."""
+        build_all(make_build(inputs), parse_outline_units(OUTLINE))
+
+        revised = OUTLINE.replace("  - Prompt design", "  - Prompt design\n  - Evaluation")
+        plan = make_build(inputs).plan(parse_outline_units(revised))
+
+        assert plan.incremental
+        assert [unit.session for unit in plan.stale] == ["3"]
+        assert "outline" in plan.reasons[plan.stale[0].label]
+
+    def test_prompt_or_input_change_rebuilds_everything(self, make_build, inputs):
+        """Test course-wide changes make every session stale."""
+        build_all(make_build(inputs), parse_outline_units(OUTLINE))
+
+        assert len(make_build(inputs, prompt_version="v2").plan(parse_outline_units(OUTLINE)).stale) == 3
+        changed = dict(inputs, audience_level="Engineers")
+        assert len(make_build(changed).plan(parse_outline_units(OUTLINE)).stale) == 3
+
+    def test_missing_materials_are_stale(self, make_build, inputs):
+        """Test a session whose files were deleted is regenerated."""
+        build = make_build(inputs)
+        build_all(build, parse_outline_units(OUTLINE))
+        (build.base_path / "Module_Foundations" / "Week_1" / "Session_2" / "Homework" / "homework_keys.md").unlink()
+
+        plan = make_build(inputs).plan(parse_outline_units(OUTLINE))
+        assert [unit.session for unit in plan.stale] == ["2"]
+        assert plan.reasons[plan.stale[0].label] == "materials missing"
+
+    def test_sessions_without_materials_are_not_recorded(self, make_build, inputs):
+        """Test a session the crew did not write stays stale."""
+        build = make_build(inputs)
+        plan = build.plan(parse_outline_units(OUTLINE))
+        write_materials(build.base_path, "Foundations", 1, 1)
+
+        assert build.record(plan) == 1
+        assert len(make_build(inputs).plan(parse_outline_units(OUTLINE)).stale) == 2
+
+    def test_outline_without_sessions_is_untracked(self, make_build, inputs):
+        """Test module-only outlines always run a full build."""
+        plan = make_build(inputs).plan(parse_outline_units("## Module 1: Foundations\n## Module 2: Practice"))
+
+        assert len(plan.stale) == 2
+        assert not plan.incremental
+        assert make_build(inputs).record(plan) == 0
+
+
+class TestScopeTasks:
+    """Test restricting the content tasks to stale sessions."""
+
+    def test_only_content_tasks_are_scoped(self, make_build, inputs):
+        """Test the stale sessions are listed in the content tasks only."""
+        build = make_build(inputs)
+        build_all(build, parse_outline_units(OUTLINE))
+        plan = make_build(inputs).plan(parse_outline_units(OUTLINE.replace("Building a chatbot", "Building {bots}")))
+
+        develop = Task(name="develop_learning_materials", description="Develop {topic}", expected_output="Docs")
+        research = Task(name="research_course_content", description="Research {topic}", expected_output="Notes")
+        scope_tasks_to_sessions([develop, research], plan)
+
+        assert "Regenerate ONLY these sessions" in develop.description
+        assert "Session 3: Building (bots)" in develop.description
+        assert research.description == "Research {topic}"
+        develop.interpolate_inputs_and_add_conversation_history({"topic": "AI"})
+        assert develop.description.startswith("Develop AI")
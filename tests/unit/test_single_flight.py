@@ -0,0 +1,108 @@
+"""Unit tests for request coalescing of concurrent research calls."""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from comprehensive_curriculum_creator.tools.single_flight import SingleFlight
+from comprehensive_curriculum_creator.tools.deep_research_tool import (
+    DeepResearchTool,
+    ResearchResult
+)
+
+
+@pytest.fixture
+def mock_result():
+    """Research result shared by the coalescing tests."""
+    return ResearchResult(
+        summary="Shared summary",
+        key_findings=["Finding"],
+        sources=[],
+        methodology="Test",
+        confidence_score=0.8
+    )
+
+
+class TestSingleFlight:
+    """Test cases for the SingleFlight primitive."""
+
+    def test_concurrent_threads_share_one_call(self):
+        """Test that only one of several concurrent callers does the work."""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def work():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flight.do, "key", work)
+            started.wait()
+            followers = [executor.submit(flight.do, "key", work) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert not flight.in_flight("key")
+
+    def test_leader_exception_propagates(self):
+        """Test that followers see the leader's exception."""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                flight.ado("key", failing),
+                flight.ado("key", failing),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestToolCoalescing:
+    """Test that the research tool coalesces identical concurrent queries."""
+
+    def test_sync_run_coalesces(self, mock_result):
+        """Test concurrent _run calls for one query execute research once."""
+        tool = DeepResearchTool(cache_enabled=False)
+
+        def slow_execute(query):
+            time.sleep(0.2)
+            return mock_result
+
+        with patch.object(tool, '_execute_research', side_effect=slow_execute) as mock_execute:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: tool._run("Same topic"), range(4)))
+
+        assert mock_execute.call_count == 1
+        assert len(set(results)) == 1
+
+    def test_async_run_coalesces_across_instances(self, mock_result):
+        """Test concurrent _arun calls from different tool instances share one run."""
+        tools = [DeepResearchTool(cache_enabled=False) for _ in range(3)]
+        calls = []
+
+        async def slow_execute(query):
+            calls.append(query.query)
+            await asyncio.sleep(0.1)
+            return mock_result
+
+        async def main():
+            return await asyncio.gather(*(t._arun("Same topic") for t in tools))
+
+        with patch.object(DeepResearchTool, '_aexecute_research', side_effect=slow_execute):
+            results = asyncio.run(main())
+
+        assert calls == ["Same topic"]
+        assert all("Shared summary" in r for r in results)
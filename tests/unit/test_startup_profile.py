@@ -0,0 +1,107 @@
+"""Unit tests for startup profiling and the cold-start budget."""
+
+import pytest
+
+from comprehensive_curriculum_creator import main, startup_profile
+from comprehensive_curriculum_creator.startup_profile import (
+    StartupProfile,
+    format_report,
+    get_budget,
+    package_totals,
+    parse_importtime,
+    profile_import,
+    profile_startup
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     yaml.error
+import time:      2000 |       2120 |   yaml
+import time:      1500 |       1500 |   crewai.agent
+import time:      3000 |       6620 | comprehensive_curriculum_creator.crew
+"""
+
+
+class TestParseImporttime:
+    """Test parsing of -X importtime output."""
+
+    def test_parses_timings_and_depth(self):
+        """Test self/cumulative times are converted to seconds with nesting depth."""
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [t.module for t in timings] == [
+            "yaml.error", "yaml", "crewai.agent", "comprehensive_curriculum_creator.crew"
+        ]
+        assert [t.depth for t in timings] == [2, 1, 1, 0]
+        assert timings[-1].cumulative_seconds == pytest.approx(0.00662)
+        assert timings[0].self_seconds == pytest.approx(0.00012)
+
+    def test_package_totals(self):
+        """Test module self times are summed per top-level package."""
+        profile = StartupProfile(
+            target="crew",
+            module="comprehensive_curriculum_creator.crew",
+            total_seconds=0.01,
+            imports=parse_importtime(IMPORTTIME_OUTPUT),
+        )
+
+        totals = dict(package_totals(profile))
+
+        assert totals["yaml"] == pytest.approx(0.00212)
+        assert list(dict(package_totals(profile)))[0] == "comprehensive_curriculum_creator"
+        assert "OVER BUDGET" in format_report(profile, budget=0.001)
+
+    def test_budget_override(self, monkeypatch):
+        """Test budgets can be overridden from the environment."""
+        monkeypatch.setenv("STARTUP_BUDGET_CREW", "2.5")
+
+        assert get_budget("crew") == 2.5
+
+
+class TestProfileStartupCommand:
+    """Test target validation and exit status of the profile_startup command."""
+
+    def test_unknown_target_is_rejected_up_front(self, monkeypatch):
+        """Test no target is profiled when one of the names is unknown."""
+        monkeypatch.setattr(startup_profile, "profile_import", lambda target: pytest.fail("profiled"))
+
+        with pytest.raises(ValueError, match="Unknown startup target.*crw"):
+            profile_startup(["crew", "crw"])
+
+    def test_unknown_target_exits_with_usage(self, monkeypatch, capsys):
+        """Test the command prints usage instead of a traceback."""
+        monkeypatch.setattr("sys.argv", ["profile_startup", "crw"])
+
+        with pytest.raises(SystemExit) as exit_info:
+            main.profile_startup()
+
+        assert exit_info.value.code == 2
+        assert "Usage: profile_startup" in capsys.readouterr().out
+
+    def test_failed_profile_fails_the_budget(self, monkeypatch, capsys):
+        """Test a target that cannot be profiled makes the command exit non-zero."""
+        def failing_import(target):
+            raise RuntimeError("Importing crew failed: boom")
+
+        monkeypatch.setattr(startup_profile, "profile_import", failing_import)
+        monkeypatch.setattr("sys.argv", ["profile_startup", "crew"])
+
+        with pytest.raises(SystemExit) as exit_info:
+            main.profile_startup()
+
+        assert exit_info.value.code == 1
+        assert "Startup profiling failed for: crew" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("target", ["crew", "deep_researcher"])
+def test_cold_start_within_budget(target):
+    """Test importing each entry point in a fresh interpreter stays within its budget."""
+    try:
+        profile = profile_import(target)
+    except RuntimeError as e:
+        if target == "crew":
+            raise
+        pytest.skip(str(e))
+
+    budget = get_budget(target)
+    assert profile.total_seconds <= budget, format_report(profile, budget=budget)
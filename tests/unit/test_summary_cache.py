@@ -0,0 +1,93 @@
+"""Unit tests for the shared webpage summary cache."""
+
+import asyncio
+import sys
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.deep_research_tool import DEFAULT_RESEARCH_SRC_PATH
+
+if str(DEFAULT_RESEARCH_SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_RESEARCH_SRC_PATH))
+utils = pytest.importorskip("open_deep_research.utils")
+
+MODEL = "openai:gpt-4.1-mini"
+
+
+class Summarizer:
+    """Counts summarizations; returns the content itself when told to fail."""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.calls = 0
+        self.fail = fail
+        self.delay = delay
+
+    def __call__(self, content):
+        async def summarize():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return content if self.fail else f"summary of {content}"
+        return summarize
+
+
+class TestSummaryCache:
+    """Test the in-memory and SQLite tiers and request coalescing."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used summary is evicted from memory."""
+        cache = utils.SummaryCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        assert cache.get("a") == "A"  # "b" is now the least recently used
+
+        cache.set("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+
+    def test_sqlite_tier_persists_across_instances(self, tmp_path):
+        """Test a new cache on the same file serves earlier summaries."""
+        path = str(tmp_path / "summaries.db")
+        key = utils.SummaryCache.make_key("https://a.example", "content", MODEL)
+        utils.SummaryCache(max_entries=0, path=path).set(key, "stored summary")
+
+        reopened = utils.SummaryCache(max_entries=4, path=path)
+
+        assert reopened.get(key) == "stored summary"
+        assert reopened.get(utils.SummaryCache.make_key("https://a.example", "changed", MODEL)) is None
+
+    def test_concurrent_requests_share_one_summarization(self):
+        """Test identical pages requested at once are summarized once."""
+        cache = utils.SummaryCache(max_entries=8)
+        summarizer = Summarizer(delay=0.05)
+
+        async def main():
+            return await asyncio.gather(*(
+                cache.get_or_summarize("https://a.example", "page", MODEL, summarizer("page"))
+                for _ in range(5)
+            ))
+
+        assert asyncio.run(main()) == ["summary of page"] * 5
+        assert summarizer.calls == 1
+        assert cache.misses == 1 and cache.hits == 4
+
+    def test_failed_summaries_are_not_cached(self, tmp_path):
+        """Test raw content returned by a failed summarization is retried next time."""
+        cache = utils.SummaryCache(max_entries=8, path=str(tmp_path / "summaries.db"))
+        failing, working = Summarizer(fail=True), Summarizer()
+
+        async def summarize(summarizer):
+            return await cache.get_or_summarize("https://a.example", "page", MODEL, summarizer("page"))
+
+        assert asyncio.run(summarize(failing)) == "page"
+        assert cache.get(utils.SummaryCache.make_key("https://a.example", "page", MODEL)) is None
+        assert asyncio.run(summarize(working)) == "summary of page"
+        assert working.calls == 1
+
+    def test_shared_cache_per_configuration(self, tmp_path):
+        """Test the same settings share one cache and a size of 0 disables it."""
+        path = str(tmp_path / "summaries.db")
+
+        assert utils.get_summary_cache(16, path) is utils.get_summary_cache(16, path)
+        assert utils.get_summary_cache(0) is None
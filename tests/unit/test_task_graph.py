@@ -0,0 +1,110 @@
+"""Unit tests for dependency-aware task scheduling."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from crewai import Agent, Task
+
+from comprehensive_curriculum_creator.crew import ComprehensiveCurriculumCreatorCrew
+from comprehensive_curriculum_creator.task_graph import schedule_parallel, task_levels
+
+
+def make_task(name, role, context=None):
+    """Build a task with its own agent."""
+    agent = Agent(role=role, goal="goal", backstory="backstory", llm="gpt-4o")
+    return Task(name=name, description=name, expected_output="output", agent=agent, context=context or [])
+
+
+@pytest.fixture(autouse=True)
+def openai_key():
+    """Agents need an API key to be constructed."""
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
+        yield
+
+
+class TestTaskLevels:
+    """Test grouping tasks by dependency level."""
+
+    def test_diamond(self):
+        """Test two tasks sharing a dependency land on the same level."""
+        root = make_task("root", "A")
+        left = make_task("left", "B", [root])
+        right = make_task("right", "C", [root])
+        join = make_task("join", "D", [left, right])
+
+        levels = task_levels([root, left, right, join])
+
+        assert [[task.name for task in level] for level in levels] == [["root"], ["left", "right"], ["join"]]
+
+    def test_missing_context_counts_as_done(self):
+        """Test dependencies outside the task list do not block a task."""
+        done = make_task("done", "A")
+        task = make_task("task", "B", [done])
+
+        assert [[t.name for t in level] for level in task_levels([task])] == [["task"]]
+
+    def test_future_dependency_rejected(self):
+        """Test a dependency on a later task raises."""
+        later = make_task("later", "A")
+        task = make_task("task", "B", [later])
+
+        with pytest.raises(ValueError):
+            task_levels([task, later])
+
+
+class TestScheduleParallel:
+    """Test marking independent tasks for concurrent execution."""
+
+    def test_independent_tasks_run_async(self):
+        """Test only the independent middle tasks are asynchronous."""
+        root = make_task("root", "A")
+        left = make_task("left", "B", [root])
+        right = make_task("right", "C", [root])
+        join = make_task("join", "D", [left, right])
+
+        schedule_parallel([root, left, right, join])
+
+        assert [t.async_execution for t in (root, left, right, join)] == [False, True, True, False]
+
+    def test_shared_agent_stays_sequential(self):
+        """Test tasks of the same agent are never run at the same time."""
+        root = make_task("root", "A")
+        left = make_task("left", "B", [root])
+        right = make_task("right", "B", [root])
+
+        schedule_parallel([root, left, right])
+
+        assert not left.async_execution and not right.async_execution
+
+    def test_level_after_concurrent_level_starts_with_join(self):
+        """Test consecutive concurrent levels are separated by a synchronous task."""
+        root = make_task("root", "A")
+        a1 = make_task("a1", "B", [root])
+        a2 = make_task("a2", "C", [root])
+        b1 = make_task("b1", "D", [a1])
+        b2 = make_task("b2", "E", [a2])
+        end = make_task("end", "F", [b1, b2])
+
+        schedule_parallel([root, a1, a2, b1, b2, end])
+
+        assert [t.async_execution for t in (root, a1, a2, b1, b2, end)] == [False, True, True, False, True, False]
+
+
+class TestCurriculumCrewSchedule:
+    """Test the schedule derived from tasks.yaml."""
+
+    def test_research_and_projects_run_concurrently(self):
+        """Test Stage 2 research and project design overlap."""
+        crew = ComprehensiveCurriculumCreatorCrew().crew()
+
+        async_tasks = {task.name for task in crew.tasks if task.async_execution}
+        assert async_tasks == {"research_course_content", "design_project_based_activities"}
+        assert crew.tasks[-1].name == "organize_course_structure"
+
+    def test_sequential_mode(self):
+        """Test parallel scheduling can be switched off."""
+        crew_instance = ComprehensiveCurriculumCreatorCrew()
+        crew_instance.parallel_tasks = False
+
+        assert not any(task.async_execution for task in crew_instance.crew().tasks)
@@ -0,0 +1,125 @@
+"""Unit tests for parallel, incremental zip packaging."""
+
+import os
+import zipfile
+
+import pytest
+
+from comprehensive_curriculum_creator.tools.zip_packager import ZipPackager, resolve_compress_type
+
+
+@pytest.fixture
+def course(tmp_path):
+    """Small course folder with text and already-compressed files."""
+    root = tmp_path / "Applied_AI"
+    session = root / "Module_1" / "Week_1" / "Session_1"
+    session.mkdir(parents=True)
+    (root / "course_overview.md").write_text("# Applied AI\n" * 200)
+    (session / "slides_presentation.md").write_text("## Slide\n" * 500)
+    (session / "diagram.png").write_bytes(os.urandom(4096))
+    return root
+
+
+@pytest.fixture
+def packager(tmp_path):
+    """Packager keeping its manifests inside the test directory."""
+    return ZipPackager(max_workers=4, manifest_dir=str(tmp_path / "manifests"))
+
+
+def read_members(zip_path):
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        return {info.filename: (info.compress_type, zf.read(info)) for info in zf.infolist()}
+
+
+class TestZipPackager:
+    """Test archive contents and incremental repackaging."""
+
+    def test_archive_round_trip(self, course, packager, tmp_path):
+        """Test every file is packaged with paths relative to the folder's parent."""
+        zip_path = tmp_path / "out" / "course.zip"
+
+        result = packager.package(course, zip_path)
+
+        members = read_members(zip_path)
+        assert result.file_count == 3 and result.compressed == 3 and result.reused == 0
+        assert set(members) == {
+            "Applied_AI/course_overview.md",
+            "Applied_AI/Module_1/Week_1/Session_1/slides_presentation.md",
+            "Applied_AI/Module_1/Week_1/Session_1/diagram.png",
+        }
+        assert members["Applied_AI/course_overview.md"] == (zipfile.ZIP_DEFLATED, (course / "course_overview.md").read_bytes())
+        assert members["Applied_AI/Module_1/Week_1/Session_1/diagram.png"][0] == zipfile.ZIP_STORED
+
+    def test_only_changed_files_are_recompressed(self, course, packager, tmp_path):
+        """Test a second run reuses unchanged members and picks up edits."""
+        zip_path = tmp_path / "course.zip"
+        packager.package(course, zip_path)
+
+        slides = course / "Module_1" / "Week_1" / "Session_1" / "slides_presentation.md"
+        slides.write_text("## Revised slide\n" * 300)
+        result = packager.package(course, zip_path)
+
+        assert result.compressed == 1 and result.reused == 2
+        members = read_members(zip_path)
+        assert members["Applied_AI/Module_1/Week_1/Session_1/slides_presentation.md"][1] == slides.read_bytes()
+        assert members["Applied_AI/course_overview.md"][1] == (course / "course_overview.md").read_bytes()
+
+    def test_touched_but_identical_file_is_reused(self, course, packager, tmp_path):
+        """Test a changed mtime with identical content falls back to the hash."""
+        zip_path = tmp_path / "course.zip"
+        packager.package(course, zip_path)
+
+        overview = course / "course_overview.md"
+        stat = overview.stat()
+        os.utime(overview, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        result = packager.package(course, zip_path)
+
+        assert result.compressed == 0 and result.reused == 3
+
+    def test_deleted_files_are_dropped(self, course, packager, tmp_path):
+        """Test files removed from the folder disappear from the archive."""
+        zip_path = tmp_path / "course.zip"
+        packager.package(course, zip_path)
+
+        (course / "course_overview.md").unlink()
+        packager.package(course, zip_path)
+
+        assert "Applied_AI/course_overview.md" not in read_members(zip_path)
+
+    def test_non_incremental_recompresses_everything(self, course, tmp_path):
+        """Test incremental mode can be switched off."""
+        zip_path = tmp_path / "course.zip"
+        packager = ZipPackager(incremental=False, manifest_dir=str(tmp_path / "manifests"))
+        packager.package(course, zip_path)
+
+        assert packager.package(course, zip_path).compressed == 3
+
+    def test_store_mode(self, course, tmp_path):
+        """Test store mode writes every member uncompressed."""
+        zip_path = tmp_path / "course.zip"
+        ZipPackager(compression="store", manifest_dir=str(tmp_path / "manifests")).package(course, zip_path)
+
+        assert {compress_type for compress_type, _ in read_members(zip_path).values()} == {zipfile.ZIP_STORED}
+
+    def test_changed_compression_mode_recompresses(self, course, tmp_path):
+        """Test members are not reused across compression methods."""
+        zip_path = tmp_path / "course.zip"
+        manifests = str(tmp_path / "manifests")
+        ZipPackager(compression="deflate", manifest_dir=manifests).package(course, zip_path)
+
+        result = ZipPackager(compression="store", manifest_dir=manifests).package(course, zip_path)
+
+        assert result.compressed == 3
+
+    def test_unknown_mode_rejected(self):
+        """Test an unknown compression mode raises."""
+        with pytest.raises(ValueError):
+            ZipPackager(compression="brotli")
+
+
+def test_zstd_falls_back_to_deflate_when_unsupported(tmp_path):
+    """Test zstd mode picks a method this Python can write."""
+    compress_type = resolve_compress_type("zstd", tmp_path / "notes.md")
+
+    assert compress_type in (zipfile.ZIP_DEFLATED, getattr(zipfile, "ZIP_ZSTANDARD", None))